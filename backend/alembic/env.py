@@ -18,8 +18,10 @@ from app.core.config import settings
 from app.db.base import Base
 
 # --- 全モデルをインポート（Alembic がメタデータを認識するために必須） ---
+from app.models.list_version import ListVersion  # noqa: F401
 from app.models.project import Project  # noqa: F401
 from app.models.task import Task  # noqa: F401
+from app.models.task_stats import ProjectTaskStats, ProjectTaskVersion  # noqa: F401
 
 # Alembic Config オブジェクト（alembic.ini の値にアクセス）
 config = context.config
@@ -0,0 +1,44 @@
+"""add keyset pagination indexes
+
+Revision ID: 3b7c1d9e2f4a
+Revises: 14ebd55e7469
+Create Date: 2026-10-17 09:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# リビジョン識別子（Alembic が自動管理）
+revision: str = "3b7c1d9e2f4a"
+down_revision: str | None = "14ebd55e7469"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """マイグレーション: アップグレード（スキーマ変更の適用）"""
+    # カーソルページネーション（キーセット）のシーク用複合インデックス
+    op.create_index(
+        "ix_projects_created_at_id", "projects", ["created_at", "id"], unique=False
+    )
+    op.create_index(
+        "ix_tasks_project_id_created_at_id",
+        "tasks",
+        ["project_id", "created_at", "id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_tasks_project_id_priority_id",
+        "tasks",
+        ["project_id", "priority", "id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """マイグレーション: ダウングレード（スキーマ変更のロールバック）"""
+    op.drop_index("ix_tasks_project_id_priority_id", table_name="tasks")
+    op.drop_index("ix_tasks_project_id_created_at_id", table_name="tasks")
+    op.drop_index("ix_projects_created_at_id", table_name="projects")
@@ -0,0 +1,49 @@
+"""add task filter sort indexes
+
+Revision ID: 5d2e8f1a7c3b
+Revises: 3b7c1d9e2f4a
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# リビジョン識別子（Alembic が自動管理）
+revision: str = "5d2e8f1a7c3b"
+down_revision: str | None = "3b7c1d9e2f4a"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """マイグレーション: アップグレード（スキーマ変更の適用）"""
+    # タスク一覧のフィルタ・ソート用複合インデックス
+    op.create_index(
+        "ix_tasks_project_id_status_priority_id",
+        "tasks",
+        ["project_id", "status", sa.text("priority DESC"), sa.text("id DESC")],
+        unique=False,
+    )
+    op.create_index(
+        "ix_tasks_project_id_due_date_id",
+        "tasks",
+        ["project_id", "due_date", "id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_tasks_project_id_updated_at_id",
+        "tasks",
+        ["project_id", "updated_at", "id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """マイグレーション: ダウングレード（スキーマ変更のロールバック）"""
+    op.drop_index("ix_tasks_project_id_updated_at_id", table_name="tasks")
+    op.drop_index("ix_tasks_project_id_due_date_id", table_name="tasks")
+    op.drop_index("ix_tasks_project_id_status_priority_id", table_name="tasks")
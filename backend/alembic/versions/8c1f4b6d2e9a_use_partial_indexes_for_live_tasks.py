@@ -0,0 +1,72 @@
+"""use partial indexes for live tasks
+
+Revision ID: 8c1f4b6d2e9a
+Revises: 5d2e8f1a7c3b
+Create Date: 2026-10-17 11:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# リビジョン識別子（Alembic が自動管理）
+revision: str = "8c1f4b6d2e9a"
+down_revision: str | None = "5d2e8f1a7c3b"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# 部分インデックスの述語（app.models.task.LIVE_TASK_PREDICATE と同じ）
+LIVE_TASK_PREDICATE = "is_deleted = false"
+
+# (全行インデックス名, 部分インデックス名, 列)
+TASK_INDEXES = [
+    (
+        "ix_tasks_project_id_created_at_id",
+        "ix_tasks_live_project_id_created_at_id",
+        ["project_id", "created_at", "id"],
+    ),
+    (
+        "ix_tasks_project_id_priority_id",
+        "ix_tasks_live_project_id_priority_id",
+        ["project_id", "priority", "id"],
+    ),
+    (
+        "ix_tasks_project_id_status_priority_id",
+        "ix_tasks_live_project_id_status_priority_id",
+        ["project_id", "status", sa.text("priority DESC"), sa.text("id DESC")],
+    ),
+    (
+        "ix_tasks_project_id_due_date_id",
+        "ix_tasks_live_project_id_due_date_id",
+        ["project_id", "due_date", "id"],
+    ),
+    (
+        "ix_tasks_project_id_updated_at_id",
+        "ix_tasks_live_project_id_updated_at_id",
+        ["project_id", "updated_at", "id"],
+    ),
+]
+
+
+def upgrade() -> None:
+    """マイグレーション: アップグレード（スキーマ変更の適用）"""
+    # 一覧・件数用の複合インデックスを未削除タスクのみの部分インデックスに置き換える
+    for full_name, live_name, columns in TASK_INDEXES:
+        op.create_index(
+            live_name,
+            "tasks",
+            columns,
+            unique=False,
+            postgresql_where=sa.text(LIVE_TASK_PREDICATE),
+        )
+        op.drop_index(full_name, table_name="tasks")
+
+
+def downgrade() -> None:
+    """マイグレーション: ダウングレード（スキーマ変更のロールバック）"""
+    for full_name, live_name, columns in reversed(TASK_INDEXES):
+        op.create_index(full_name, "tasks", columns, unique=False)
+        op.drop_index(live_name, table_name="tasks")
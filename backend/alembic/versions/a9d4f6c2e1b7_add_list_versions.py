@@ -0,0 +1,66 @@
+"""add list versions
+
+Revision ID: a9d4f6c2e1b7
+Revises: e7a3c5f9b2d8
+Create Date: 2026-10-17 18:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# リビジョン識別子（Alembic が自動管理）
+revision: str = "a9d4f6c2e1b7"
+down_revision: str | None = "e7a3c5f9b2d8"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """マイグレーション: アップグレード（スキーマ変更の適用）"""
+    # プロジェクト別タスク一覧のバージョン（条件付き GET の検証子）
+    op.create_table(
+        "project_task_versions",
+        sa.Column("project_id", sa.Uuid(), nullable=False),
+        sa.Column(
+            "tasks_modified_at",
+            sa.DateTime(),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column("revision", sa.BigInteger(), server_default="1", nullable=False),
+        sa.ForeignKeyConstraint(["project_id"], ["projects.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("project_id"),
+    )
+    # テーブル全体を対象とする一覧（プロジェクト一覧）のバージョン
+    op.create_table(
+        "list_versions",
+        sa.Column("name", sa.String(length=63), nullable=False),
+        sa.Column(
+            "modified_at",
+            sa.DateTime(),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column("revision", sa.BigInteger(), server_default="1", nullable=False),
+        sa.PrimaryKeyConstraint("name"),
+    )
+    # 既存の行からバージョンを初期化する（リビジョンは件数から始める）
+    op.execute(
+        "INSERT INTO project_task_versions (project_id, tasks_modified_at, revision) "
+        "SELECT project_id, max(updated_at), count(*) FROM tasks GROUP BY project_id"
+    )
+    op.execute(
+        "INSERT INTO list_versions (name, modified_at, revision) "
+        "SELECT 'projects', max(updated_at), count(*) FROM projects "
+        "HAVING count(*) > 0"
+    )
+
+
+def downgrade() -> None:
+    """マイグレーション: ダウングレード（スキーマ変更のロールバック）"""
+    op.drop_table("list_versions")
+    op.drop_table("project_task_versions")
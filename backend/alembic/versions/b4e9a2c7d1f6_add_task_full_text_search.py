@@ -0,0 +1,57 @@
+"""add task full text search
+
+Revision ID: b4e9a2c7d1f6
+Revises: 8c1f4b6d2e9a
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# リビジョン識別子（Alembic が自動管理）
+revision: str = "b4e9a2c7d1f6"
+down_revision: str | None = "8c1f4b6d2e9a"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """マイグレーション: アップグレード（スキーマ変更の適用）"""
+    # 全文検索用の生成列（STORED のため既存行も追加時に計算される）
+    op.add_column(
+        "tasks",
+        sa.Column(
+            "search_vector",
+            postgresql.TSVECTOR(),
+            sa.Computed(
+                "setweight(to_tsvector('simple', title), 'A') || "
+                "setweight(to_tsvector('simple', coalesce(description, '')), 'B')",
+                persisted=True,
+            ),
+            nullable=False,
+        ),
+    )
+    op.create_index(
+        "ix_tasks_live_search_vector",
+        "tasks",
+        ["search_vector"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_where=sa.text("is_deleted = false"),
+    )
+
+
+def downgrade() -> None:
+    """マイグレーション: ダウングレード（スキーマ変更のロールバック）"""
+    op.drop_index(
+        "ix_tasks_live_search_vector",
+        table_name="tasks",
+        postgresql_using="gin",
+        postgresql_where=sa.text("is_deleted = false"),
+    )
+    op.drop_column("tasks", "search_vector")
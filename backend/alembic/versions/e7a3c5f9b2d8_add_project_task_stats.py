@@ -0,0 +1,50 @@
+"""add project task stats
+
+Revision ID: e7a3c5f9b2d8
+Revises: b4e9a2c7d1f6
+Create Date: 2026-10-17 15:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# リビジョン識別子（Alembic が自動管理）
+revision: str = "e7a3c5f9b2d8"
+down_revision: str | None = "b4e9a2c7d1f6"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """マイグレーション: アップグレード（スキーマ変更の適用）"""
+    op.create_table(
+        "project_task_stats",
+        sa.Column("project_id", sa.Uuid(), nullable=False),
+        # tasks.status の ENUM 型を共有する（作成済みのため create_type=False）
+        sa.Column(
+            "status",
+            postgresql.ENUM(
+                "todo", "in_progress", "done", name="task_status", create_type=False
+            ),
+            nullable=False,
+        ),
+        sa.Column("task_count", sa.Integer(), server_default="0", nullable=False),
+        sa.ForeignKeyConstraint(["project_id"], ["projects.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("project_id", "status"),
+    )
+    # 既存タスクから集計値を初期化する
+    op.execute(
+        "INSERT INTO project_task_stats (project_id, status, task_count) "
+        "SELECT project_id, status, count(*) FROM tasks "
+        "WHERE is_deleted = false GROUP BY project_id, status"
+    )
+
+
+def downgrade() -> None:
+    """マイグレーション: ダウングレード（スキーマ変更のロールバック）"""
+    op.drop_table("project_task_stats")
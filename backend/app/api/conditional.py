@@ -0,0 +1,132 @@
+"""
+条件付きリクエスト（ETag / Last-Modified）ユーティリティ。
+
+サービス層が返すバージョン情報（検証子）から ETag を生成し、
+If-None-Match / If-Modified-Since に一致する場合は
+行の読み込みやシリアライズを行わずに 304 を返すためのヘルパーを提供する。
+"""
+
+import hashlib
+from collections.abc import Iterable
+from datetime import UTC, datetime
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any
+
+from fastapi import Request, Response, status
+
+from app.core.config import settings
+
+
+def build_etag(*parts: Any) -> str:
+    """
+    検証子の構成要素から弱い ETag を生成する。
+
+    JSON の表現はバイト単位で保証しない（圧縮等で変わりうる）ため弱い ETag とする。
+
+    Args:
+        parts: バージョンタグやクエリパラメータなど
+
+    Returns:
+        W/"<ハッシュ>" 形式の ETag
+    """
+    digest = hashlib.blake2b(
+        "|".join(str(part) for part in parts).encode(), digest_size=16
+    ).hexdigest()
+    return f'W/"{digest}"'
+
+
+def _as_utc(value: datetime) -> datetime:
+    """日時を UTC に揃える。タイムゾーンなしは UTC とみなす（内部ヘルパー）"""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=UTC)
+    return value.astimezone(UTC)
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """If-None-Match を弱い比較で評価する（内部ヘルパー）"""
+    if if_none_match.strip() == "*":
+        return True
+    target = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == target
+        for candidate in if_none_match.split(",")
+    )
+
+
+def is_not_modified(
+    request: Request, etag: str, last_modified: datetime | None
+) -> bool:
+    """
+    条件付きリクエストが未変更（304）と判定できるかを返す。
+
+    RFC 9110 に従い、If-None-Match がある場合は If-Modified-Since を無視する。
+
+    Args:
+        request: 受信したリクエスト
+        etag: 現在の表現の ETag
+        last_modified: 現在の表現の最終更新日時
+
+    Returns:
+        304 を返してよい場合は True
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return _etag_matches(if_none_match, etag)
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is None or last_modified is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    # HTTP 日付は秒精度のため、比較前にマイクロ秒を切り捨てる
+    return _as_utc(last_modified).replace(microsecond=0) <= _as_utc(since)
+
+
+def conditional_response(
+    request: Request,
+    response: Response,
+    version: dict[str, Any] | None,
+    *,
+    vary_on: Iterable[str] = (),
+) -> Response | None:
+    """
+    検証子ヘッダを設定し、未変更であれば 304 レスポンスを返す。
+
+    version が None（対象なし・0件など）の場合は何もせず、通常の処理に任せる。
+    Cache-Control はルート名で settings.CACHE_CONTROL から解決する。
+
+    Args:
+        request: 受信したリクエスト
+        response: ルートに注入されたレスポンス（200 時のヘッダ設定先）
+        version: サービス層の last_modified, tag を含む辞書
+        vary_on: ETag に含めるクエリパラメータ名（表現を変えるもの）
+
+    Returns:
+        未変更の場合は 304 レスポンス、それ以外は None
+    """
+    if version is None:
+        return None
+
+    params = request.query_params
+    etag = build_etag(
+        version["tag"],
+        *(f"{name}={','.join(params.getlist(name))}" for name in vary_on),
+    )
+    last_modified = version["last_modified"]
+
+    headers = {"ETag": etag}
+    if last_modified is not None:
+        headers["Last-Modified"] = format_datetime(_as_utc(last_modified), usegmt=True)
+    route = request.scope.get("route")
+    cache_control = settings.CACHE_CONTROL.get(
+        getattr(route, "name", ""), settings.CACHE_CONTROL_DEFAULT
+    )
+    if cache_control:
+        headers["Cache-Control"] = cache_control
+
+    if is_not_modified(request, etag, last_modified):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    response.headers.update(headers)
+    return None
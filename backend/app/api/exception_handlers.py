@@ -0,0 +1,31 @@
+"""
+例外ハンドラモジュール。
+
+サービス層の HTTPException 以外で、API のレスポンスに変換する例外を扱う。
+"""
+
+from fastapi import Request
+from fastapi.responses import JSONResponse
+
+from app.db.session import PoolBackpressureError
+
+
+async def pool_backpressure_handler(request: Request, exc: Exception) -> JSONResponse:
+    """
+    コネクションプールのバックプレッシャーを 503 と Retry-After に変換する。
+
+    Args:
+        request: 処理中のリクエスト
+        exc: 送出された PoolBackpressureError
+
+    Returns:
+        503 Service Unavailable のレスポンス
+    """
+    retry_after = exc.retry_after if isinstance(exc, PoolBackpressureError) else 1
+    return JSONResponse(
+        status_code=503,
+        content={
+            "detail": "データベースが混雑しています。しばらくしてから再試行してください"
+        },
+        headers={"Retry-After": str(retry_after)},
+    )
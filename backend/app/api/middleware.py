@@ -0,0 +1,350 @@
+"""
+ASGI ミドルウェアモジュール。
+
+リクエスト単位の計測を行うミドルウェア（Prometheus メトリクス、
+SQL の件数・時間の計測と Server-Timing ヘッダ）、
+ルートの種類ごとの同時実行数を制限するアドミッション制御、
+書き込み直後のクライアントの読み取りをプライマリに固定する Cookie の付与、
+ログに付与するリクエストIDの設定を提供する。
+BaseHTTPMiddleware はレスポンス本文をタスク経由で中継するため使用せず、
+純粋な ASGI ミドルウェアとして実装する。
+"""
+
+import logging
+import math
+import time
+import uuid
+import warnings
+from collections.abc import Mapping
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core import admission
+from app.core.admission import (
+    AdmissionRejected,
+    ConcurrencyLimiter,
+    RouteClass,
+    classify,
+)
+from app.core.config import settings
+from app.core.log import (
+    reset_request_context,
+    start_request_context,
+    valid_request_id,
+)
+from app.core.metrics import (
+    HTTP_REQUEST_DURATION_SECONDS,
+    HTTP_REQUESTS_IN_PROGRESS,
+    HTTP_REQUESTS_TOTAL,
+)
+from app.db.dependencies import READ_METHODS
+from app.db.query_stats import (
+    QueryBudgetExceeded,
+    QueryBudgetWarning,
+    QueryStats,
+    find_violations,
+    reset_query_stats,
+    start_query_stats,
+)
+from app.db.replicas import READ_YOUR_WRITES_HEADER
+
+# リクエスト単位のログ（処理時間と SQL の件数・時間）
+request_logger = logging.getLogger("app.request")
+
+# 書き込み直後の固定の対象外とするメソッド（書き込みを行わないリクエスト）
+_NON_WRITE_METHODS = READ_METHODS | {"OPTIONS"}
+
+# どのルートにも一致しなかったリクエストのラベル（404 のパスで系列を増やさない）
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+def route_template(scope: Scope) -> str:
+    """
+    リクエストが一致したルートのパステンプレートを返す。
+
+    ルーティング後に scope に設定される route を参照するため、
+    アプリケーションの呼び出し後に使用する。
+    FastAPI のバージョンによっては route のパスに include_router の
+    プレフィックスが含まれないため、実際のパスから同じ深さのセグメントを
+    取り除いた残りをプレフィックスとして補う（プレフィックスは固定文字列とする）。
+
+    Args:
+        scope: ASGI スコープ
+
+    Returns:
+        パステンプレート（一致なしの場合は UNMATCHED_ROUTE）
+    """
+    template: str | None = getattr(scope.get("route"), "path_format", None)
+    if not template:
+        return UNMATCHED_ROUTE
+    segments = scope["path"].split("/")
+    prefix = "/".join(segments[: len(segments) - template.count("/")])
+    return prefix + template
+
+
+class MetricsMiddleware:
+    """
+    HTTP リクエストの Prometheus メトリクスを記録するミドルウェア。
+
+    - http_requests_in_progress: 処理中のリクエスト数（メソッド別）
+    - http_requests_total: ルートテンプレート・ステータスコード別のリクエスト数
+    - http_request_duration_seconds: ルートテンプレート別の処理時間
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        # 例外でレスポンスが開始されなかった場合は 500 として記録する
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        in_progress = HTTP_REQUESTS_IN_PROGRESS.labels(method)
+        in_progress.inc()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - start
+            in_progress.dec()
+            route = route_template(scope)
+            HTTP_REQUESTS_TOTAL.labels(method, route, str(status_code)).inc()
+            HTTP_REQUEST_DURATION_SECONDS.labels(method, route).observe(elapsed)
+
+
+def server_timing(stats: QueryStats) -> str:
+    """
+    計測結果を Server-Timing ヘッダの値に変換する。
+
+    Args:
+        stats: 処理中のリクエストの計測結果
+
+    Returns:
+        app（レスポンス開始までの時間）と db（SQL の合計時間と件数）のエントリ
+    """
+    app_ms = (time.perf_counter() - stats.started_at) * 1000
+    return (
+        f"app;dur={app_ms:.1f}, "
+        f'db;dur={stats.duration * 1000:.1f};desc="{stats.count} SQL"'
+    )
+
+
+class QueryStatsMiddleware:
+    """
+    リクエストごとに SQL の件数と合計時間を計測するミドルウェア。
+
+    - 計測結果を contextvar に設定し、エンジンのイベントフックが記録する
+    - レスポンス開始時点の値を Server-Timing ヘッダに出力する
+    - 完了時に処理時間・SQL の件数と時間をリクエストログに出力する
+    - QUERY_STATS_STRICT が off 以外の場合、QUERY_BUDGETS の超過と
+      同じ形の SQL の繰り返し（N+1）を警告または例外にする
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats, token = start_query_stats(lambda: route_template(scope))
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                MutableHeaders(scope=message).append(
+                    "Server-Timing", server_timing(stats)
+                )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            reset_query_stats(token)
+            route = route_template(scope)
+            duration_ms = (time.perf_counter() - stats.started_at) * 1000
+            request_logger.info(
+                "%s %s status=%d duration_ms=%.1f db_queries=%d db_ms=%.1f",
+                scope["method"],
+                route,
+                status_code,
+                duration_ms,
+                stats.count,
+                stats.duration * 1000,
+                extra={
+                    "method": scope["method"],
+                    "route": route,
+                    "status": status_code,
+                    "duration_ms": round(duration_ms, 1),
+                    "db_queries": stats.count,
+                    "db_ms": round(stats.duration * 1000, 1),
+                },
+            )
+
+        if settings.QUERY_STATS_STRICT != "off":
+            self._check(scope, stats)
+
+    def _check(self, scope: Scope, stats: QueryStats) -> None:
+        """クエリ予算と繰り返しを検査し、strict モードに応じて警告・例外にする"""
+        route_name = getattr(scope.get("route"), "name", None)
+        violations = find_violations(
+            stats,
+            budget=settings.QUERY_BUDGETS.get(route_name or ""),
+            repeat_threshold=settings.QUERY_REPEAT_THRESHOLD,
+        )
+        if not violations:
+            return
+        message = f"クエリ予算違反 ({route_template(scope)}): " + "; ".join(violations)
+        if settings.QUERY_STATS_STRICT == "raise":
+            raise QueryBudgetExceeded(message)
+        request_logger.warning(message)
+        warnings.warn(message, QueryBudgetWarning, stacklevel=2)
+
+
+class AdmissionControlMiddleware:
+    """
+    ルートの種類（read / write / export）ごとに同時実行数を制限するミドルウェア。
+
+    - 上限を超えたリクエストは待ち行列で期限まで実行枠の空きを待つ
+    - 待ち行列が満杯、または期限までに空かない場合は 503 と Retry-After を返し、
+      アプリケーション（DB コネクションの取得）まで到達させない
+    - ストリーミングレスポンスは送信完了まで実行枠を保持する
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        limiters: Mapping[RouteClass, ConcurrencyLimiter] | None = None,
+    ) -> None:
+        self.app = app
+        # 省略時はワーカープロセス共通のリミッター（実行中に変更可能）を使う
+        self.limiters = admission.limiters if limiters is None else limiters
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        route_class = (
+            classify(scope["method"], scope["path"])
+            if scope["type"] == "http"
+            else None
+        )
+        limiter = self.limiters.get(route_class) if route_class else None
+        if limiter is None:
+            await self.app(scope, receive, send)
+            return
+
+        try:
+            await limiter.acquire()
+        except AdmissionRejected as e:
+            request_logger.warning(
+                "リクエストを打ち切りました route_class=%s reason=%s",
+                e.route_class,
+                e.reason,
+            )
+            response = JSONResponse(
+                status_code=503,
+                content={
+                    "detail": "サーバーが混雑しています。"
+                    "しばらくしてから再試行してください"
+                },
+                headers={"Retry-After": str(settings.ADMISSION_RETRY_AFTER_SECONDS)},
+            )
+            await response(scope, receive, send)
+            return
+
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            limiter.release()
+
+
+class ReadYourWritesMiddleware:
+    """
+    書き込みに成功したクライアントの読み取りを一定期間プライマリに固定するミドルウェア。
+
+    /api/ 以下の書き込みリクエスト（GET / HEAD / OPTIONS 以外）が 2xx / 3xx で
+    完了した場合に、固定の期限（UNIX 時刻）を Cookie（DB_READ_YOUR_WRITES_COOKIE）と
+    X-Read-Your-Writes-Until ヘッダで返す。期限内のクライアントの読み取りは
+    レプリカの複製遅延の影響を受けないよう get_db_session がプライマリに振り分ける。
+    """
+
+    def __init__(
+        self, app: ASGIApp, window: float = settings.DB_READ_YOUR_WRITES_SECONDS
+    ) -> None:
+        self.app = app
+        self.window = window
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or scope["method"] in _NON_WRITE_METHODS
+            or not scope["path"].startswith("/api/")
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start" and message["status"] < 400:
+                until = f"{time.time() + self.window:.3f}"
+                headers = MutableHeaders(scope=message)
+                headers.append(READ_YOUR_WRITES_HEADER, until)
+                headers.append(
+                    "Set-Cookie",
+                    f"{settings.DB_READ_YOUR_WRITES_COOKIE}={until}; "
+                    f"Max-Age={math.ceil(self.window)}; Path=/; HttpOnly; SameSite=Lax",
+                )
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+
+class RequestContextMiddleware:
+    """
+    リクエストIDを決めてログ用のコンテキストに設定するミドルウェア。
+
+    - LOG_REQUEST_ID_HEADER で受け取った値を使う（ない・形式が不正な場合は生成する）
+    - リクエストIDをレスポンスの同じヘッダで返す
+    - 処理中に出力したログには request_id・route・elapsed_ms が付与される
+      （app.core.log.RequestContextFilter）
+    """
+
+    def __init__(
+        self, app: ASGIApp, header: str = settings.LOG_REQUEST_ID_HEADER
+    ) -> None:
+        self.app = app
+        self.header = header
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = Headers(scope=scope).get(self.header, "")
+        if not valid_request_id(request_id):
+            request_id = uuid.uuid4().hex
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message).append(self.header, request_id)
+            await send(message)
+
+        token = start_request_context(
+            request_id, scope["method"], lambda: route_template(scope)
+        )
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            reset_request_context(token)
@@ -0,0 +1,73 @@
+"""
+高速レスポンスシリアライズモジュール。
+
+FastAPI の標準経路では、ルートが返したモデルを response_model で
+再検証（model_dump → validate）してから JSON にエンコードする。
+一覧のように件数が多いレスポンスではこの二重処理が支配的になるため、
+一度だけ検証したモデルを pydantic-core のシリアライザで直接バイト列にする
+経路を提供する。ルーターの default_response_class で選択する。
+"""
+
+from typing import Any, TypeVar
+
+import pydantic_core
+from fastapi import Request, Response
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+# 注入レスポンスから引き継がないヘッダ（本文に合わせて再計算される）
+_BODY_HEADERS = frozenset({b"content-length", b"content-type"})
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+class PydanticJSONResponse(JSONResponse):
+    """
+    pydantic-core で JSON をレンダリングするレスポンスクラス。
+
+    BaseModel はスキーマのシリアライザで直接バイト列に変換し、
+    それ以外（dict など）は pydantic_core.to_json でエンコードする。
+    """
+
+    def render(self, content: Any) -> bytes:
+        """コンテンツを JSON バイト列に変換する"""
+        if isinstance(content, BaseModel):
+            return content.__pydantic_serializer__.to_json(content)
+        return pydantic_core.to_json(content)
+
+
+def render_model(
+    request: Request, response: Response, model: ModelT
+) -> ModelT | Response:
+    """
+    検証済みモデルをルーターの設定に応じて返却する。
+
+    ルートの response_class が PydanticJSONResponse の場合はレスポンスを直接生成し、
+    response_model による再検証を省略する。それ以外はモデルをそのまま返し、
+    FastAPI の通常の処理に任せる。
+
+    Args:
+        request: 受信したリクエスト（ルートの response_class の解決に使用）
+        response: ルートに注入されたレスポンス（設定済みヘッダを引き継ぐ）
+        model: 検証済みのレスポンスモデル
+
+    Returns:
+        PydanticJSONResponse またはモデル
+    """
+    route = request.scope.get("route")
+    response_class = getattr(route, "response_class", None)
+    # 未指定の場合は DefaultPlaceholder に包まれている
+    response_class = getattr(response_class, "value", response_class)
+    if not (
+        isinstance(response_class, type)
+        and issubclass(response_class, PydanticJSONResponse)
+    ):
+        return model
+
+    rendered = response_class(model, status_code=response.status_code or 200)
+    rendered.raw_headers.extend(
+        (name, value)
+        for name, value in response.raw_headers
+        if name not in _BODY_HEADERS
+    )
+    return rendered
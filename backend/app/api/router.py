@@ -7,7 +7,8 @@ API ルーター集約モジュール。
 
 from fastapi import APIRouter
 
-from app.api.routes import health, projects, tasks
+from app.api.routes import debug, health, metrics, projects, search, tasks
+from app.core.config import settings
 
 # メインAPIルーター（全ルートの集約ポイント）
 api_router = APIRouter()
@@ -15,8 +16,16 @@ api_router = APIRouter()
 # --- ヘルスチェック（プレフィックスなし） ---
 api_router.include_router(health.router)
 
+# --- メトリクス（プレフィックスなし） ---
+if settings.METRICS_ENABLED:
+    api_router.include_router(metrics.router)
+
+# --- デバッグ（プレフィックスなし、DEBUG_API_TOKEN 設定時のみ有効） ---
+api_router.include_router(debug.router)
+
 # --- バージョン付きAPIルート ---
 # /api/v1 プレフィックスで名前空間を分離
 # 将来的な v2 API との共存を可能にする
 api_router.include_router(projects.router, prefix="/api/v1")
 api_router.include_router(tasks.router, prefix="/api/v1")
+api_router.include_router(search.router, prefix="/api/v1")
@@ -0,0 +1,117 @@
+"""
+デバッグ API ルート。
+
+運用中の調査用エンドポイントを提供する。
+DEBUG_API_TOKEN が設定されている場合のみ有効で、
+X-Debug-Token ヘッダにトークンを指定したリクエストのみ受け付ける。
+"""
+
+import secrets
+
+from fastapi import APIRouter, Depends, Header, HTTPException, status
+
+from app.core.admission import RouteClass, limiters
+from app.core.config import settings
+from app.db.session import slow_query_log
+from app.schemas.debug import (
+    AdmissionLimiterStatus,
+    AdmissionLimitUpdate,
+    AdmissionStatusList,
+    SlowQueryPlanList,
+)
+
+
+async def require_debug_token(
+    x_debug_token: str | None = Header(default=None),
+) -> None:
+    """
+    デバッグ API の認証を行う。
+
+    トークン未設定（無効）の場合はエンドポイントの存在を明かさないため 404 を返す。
+
+    Raises:
+        HTTPException: 無効な場合は 404、トークンが一致しない場合は 403
+    """
+    if not settings.DEBUG_API_TOKEN:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+    if x_debug_token is None or not secrets.compare_digest(
+        x_debug_token, settings.DEBUG_API_TOKEN
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="デバッグ API へのアクセス権がありません",
+        )
+
+
+router = APIRouter(
+    prefix="/debug",
+    tags=["デバッグ"],
+    dependencies=[Depends(require_debug_token)],
+    include_in_schema=False,
+)
+
+
+@router.get(
+    "/slow-queries",
+    response_model=SlowQueryPlanList,
+    summary="スロークエリの実行計画",
+    description="このワーカーが保持する直近のスロークエリの実行計画を新しい順に返す",
+)
+async def get_slow_queries() -> SlowQueryPlanList:
+    """スロークエリの実行計画を取得する"""
+    return SlowQueryPlanList.model_validate(
+        {
+            "threshold_ms": settings.SLOW_QUERY_THRESHOLD_MS,
+            "explain_sample_rate": settings.SLOW_QUERY_EXPLAIN_SAMPLE_RATE,
+            "items": slow_query_log.plans() if slow_query_log is not None else [],
+        }
+    )
+
+
+@router.delete(
+    "/slow-queries",
+    status_code=status.HTTP_204_NO_CONTENT,
+    summary="スロークエリの実行計画の破棄",
+    description="このワーカーが保持する実行計画を破棄する",
+)
+async def clear_slow_queries() -> None:
+    """スロークエリの実行計画を破棄する"""
+    if slow_query_log is not None:
+        slow_query_log.clear()
+
+
+@router.get(
+    "/admission",
+    response_model=AdmissionStatusList,
+    summary="アドミッション制御の状態",
+    description="このワーカーのルートの種類ごとの同時実行数の上限と処理中・待機中の数を返す",
+)
+async def get_admission() -> AdmissionStatusList:
+    """アドミッション制御の設定と状態を取得する"""
+    return AdmissionStatusList.model_validate(
+        {
+            "enabled": settings.ADMISSION_CONTROL_ENABLED,
+            "items": [limiter.stats() for limiter in limiters.values()],
+        }
+    )
+
+
+@router.patch(
+    "/admission/{route_class}",
+    response_model=AdmissionLimiterStatus,
+    summary="アドミッション制御の設定変更",
+    description="このワーカーの同時実行数の上限・待ち行列を変更する（再起動で設定値に戻る）",
+)
+async def update_admission(
+    route_class: RouteClass, data: AdmissionLimitUpdate
+) -> AdmissionLimiterStatus:
+    """アドミッション制御の設定を変更する"""
+    limiter = limiters[route_class]
+    limiter.configure(
+        limit=data.limit,
+        queue_size=data.queue_size,
+        queue_timeout=(
+            data.queue_timeout_ms / 1000 if data.queue_timeout_ms is not None else None
+        ),
+    )
+    return AdmissionLimiterStatus.model_validate(limiter.stats())
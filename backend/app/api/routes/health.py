@@ -10,8 +10,14 @@ from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
-from app.db.dependencies import get_db_session
-from app.schemas.health import HealthCheckResponse
+from app.db.dependencies import get_primary_db_session
+from app.db.replicas import replica_set
+from app.db.session import PoolBackpressureError, pool_stats
+from app.schemas.health import (
+    DatabasePoolStatus,
+    HealthCheckResponse,
+    ReplicaStatus,
+)
 
 router = APIRouter(tags=["ヘルスチェック"])
 
@@ -23,24 +29,37 @@ router = APIRouter(tags=["ヘルスチェック"])
     description="アプリケーションとDB接続の稼働状態を確認する",
 )
 async def health_check(
-    db: AsyncSession = Depends(get_db_session),
+    db: AsyncSession = Depends(get_primary_db_session),
 ) -> HealthCheckResponse:
     """
     ヘルスチェックエンドポイント。
 
     - アプリケーションの稼働状態を確認
-    - PostgreSQL への接続を検証（SELECT 1 クエリ）
-    - バージョン情報を返却
+    - PostgreSQL（プライマリ）への接続を検証（SELECT 1 クエリ）
+    - バージョン情報・コネクションプール・リードレプリカの状態を返却
+    - プールが混雑して取得を打ち切った場合、または異常なリードレプリカがある場合は
+      degraded（読み取りはプライマリで継続できる）
     """
     # データベース接続の確認
     db_status = "connected"
     try:
         await db.execute(text("SELECT 1"))
+    except PoolBackpressureError:
+        db_status = "saturated"
     except Exception:
         db_status = "disconnected"
 
+    replicas = [ReplicaStatus.model_validate(r) for r in replica_set.stats()]
+    app_status = {"connected": "healthy", "saturated": "degraded"}.get(
+        db_status, "unhealthy"
+    )
+    if app_status == "healthy" and not all(r.healthy for r in replicas):
+        app_status = "degraded"
+
     return HealthCheckResponse(
-        status="healthy" if db_status == "connected" else "unhealthy",
+        status=app_status,
         database=db_status,
         version=settings.APP_VERSION,
+        pool=DatabasePoolStatus.model_validate(pool_stats()),
+        replicas=replicas,
     )
@@ -0,0 +1,23 @@
+"""
+メトリクス API ルート。
+
+Prometheus がスクレイプするためのエンドポイントを提供する。
+"""
+
+from fastapi import APIRouter, Response
+
+from app.core.metrics import render_metrics
+
+router = APIRouter(tags=["メトリクス"])
+
+
+@router.get(
+    "/metrics",
+    summary="メトリクス",
+    description="Prometheus のテキスト形式でメトリクスを返す",
+    include_in_schema=False,
+)
+async def metrics() -> Response:
+    """Prometheus メトリクスを返す（マルチプロセス時は全ワーカーの合算値）"""
+    body, content_type = render_metrics()
+    return Response(content=body, media_type=content_type)
@@ -5,18 +5,32 @@ Project CRUD API ルート。
 """
 
 import uuid
+from typing import Literal
 
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Query, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.api.conditional import conditional_response
+from app.api.responses import PydanticJSONResponse, render_model
+from app.core.config import settings
+from app.core.pagination import CountStrategy
 from app.db.dependencies import get_db_session
-from app.schemas.common import PaginatedResponse
-from app.schemas.project import ProjectCreate, ProjectRead, ProjectUpdate
+from app.repositories.project import ProjectLoad
+from app.schemas.common import CursorPaginatedResponse, PaginatedResponse
+from app.schemas.project import (
+    ProjectCreate,
+    ProjectRead,
+    ProjectTaskStatsList,
+    ProjectTaskStatsRead,
+    ProjectUpdate,
+)
 from app.services.project import ProjectService
 
 router = APIRouter(
     prefix="/projects",
     tags=["プロジェクト"],
+    # 一覧は検証済みモデルを直接シリアライズする（response_model の再検証を省略）
+    default_response_class=PydanticJSONResponse,
 )
 
 
@@ -39,27 +53,90 @@ async def create_project(
 
 @router.get(
     "",
-    response_model=PaginatedResponse[ProjectRead],
+    response_model=(
+        PaginatedResponse[ProjectRead] | CursorPaginatedResponse[ProjectRead]
+    ),
     summary="プロジェクト一覧取得",
-    description="プロジェクト一覧をページネーション付きで取得する",
+    description=(
+        "プロジェクト一覧をページネーション付きで取得する。"
+        "pagination=cursor または cursor 指定時はキーセット方式で取得する"
+    ),
 )
 async def get_projects(
+    request: Request,
+    response: Response,
     page: int = Query(default=1, ge=1, description="ページ番号"),
     per_page: int = Query(default=20, ge=1, le=100, description="1ページあたりの件数"),
+    pagination: Literal["offset", "cursor"] = Query(
+        default="offset", description="ページネーション方式"
+    ),
+    cursor: str | None = Query(default=None, description="前ページの next_cursor"),
+    count: CountStrategy = Query(
+        default="exact",
+        description="総件数の算出戦略（オフセット方式のみ）",
+    ),
+    with_task_count: bool = Query(default=False, description="未削除タスク数を含める"),
     db: AsyncSession = Depends(get_db_session),
-) -> PaginatedResponse[ProjectRead]:
+) -> PaginatedResponse[ProjectRead] | CursorPaginatedResponse[ProjectRead] | Response:
     """プロジェクト一覧を取得する"""
     service = ProjectService(db)
-    result = await service.get_projects(page=page, per_page=per_page)
-    return PaginatedResponse[ProjectRead](
-        items=[ProjectRead.model_validate(p) for p in result["items"]],
-        total=result["total"],
-        page=result["page"],
-        per_page=result["per_page"],
-        pages=result["pages"],
+    load: ProjectLoad = "task_counts" if with_task_count else "none"
+
+    # --- 条件付き GET（タスク数はプロジェクト全体のタスク集計が必要なため対象外） ---
+    if not with_task_count:
+        not_modified = conditional_response(
+            request,
+            response,
+            await service.get_projects_version(),
+            vary_on=("page", "per_page", "pagination", "cursor", "count"),
+        )
+        if not_modified is not None:
+            return not_modified
+
+    # --- カーソル方式（深いページでも一定コスト） ---
+    if pagination == "cursor" or cursor is not None:
+        cursor_result = await service.get_projects_by_cursor(
+            cursor=cursor, per_page=per_page, load=load
+        )
+        return render_model(
+            request,
+            response,
+            CursorPaginatedResponse[ProjectRead].model_validate(cursor_result),
+        )
+
+    result = await service.get_projects(
+        page=page, per_page=per_page, load=load, count=count
+    )
+    return render_model(
+        request, response, PaginatedResponse[ProjectRead].model_validate(result)
     )
 
 
+# /{project_id} より先に登録する（"stats" を UUID として解釈させない）
+@router.get(
+    "/stats",
+    response_model=ProjectTaskStatsList,
+    summary="プロジェクト別タスク集計の一括取得",
+    description=(
+        "複数プロジェクトのステータス別タスク数を取得する。"
+        "存在しないプロジェクトは結果に含まれない"
+    ),
+)
+async def get_projects_stats(
+    ids: list[uuid.UUID] = Query(
+        ...,
+        min_length=1,
+        max_length=settings.STATS_MAX_PROJECT_IDS,
+        description="対象プロジェクトのID（ids=...&ids=... の形式で複数指定）",
+    ),
+    db: AsyncSession = Depends(get_db_session),
+) -> ProjectTaskStatsList:
+    """複数プロジェクトのタスク集計を取得する"""
+    service = ProjectService(db)
+    result = await service.get_projects_stats(ids)
+    return ProjectTaskStatsList.model_validate(result)
+
+
 @router.get(
     "/{project_id}",
     response_model=ProjectRead,
@@ -68,14 +145,48 @@ async def get_projects(
 )
 async def get_project(
     project_id: uuid.UUID,
+    request: Request,
+    response: Response,
+    with_task_count: bool = Query(default=False, description="未削除タスク数を含める"),
     db: AsyncSession = Depends(get_db_session),
-) -> ProjectRead:
+) -> ProjectRead | Response:
     """指定IDのプロジェクトを取得する"""
     service = ProjectService(db)
-    project = await service.get_project(project_id)
+
+    # --- 条件付き GET（検証子のみ取得し、未変更なら行を読み込まない） ---
+    not_modified = conditional_response(
+        request,
+        response,
+        await service.get_project_version(project_id, with_task_count=with_task_count),
+        vary_on=("with_task_count",),
+    )
+    if not_modified is not None:
+        return not_modified
+    project = await service.get_project(
+        project_id, load="task_counts" if with_task_count else "none"
+    )
     return ProjectRead.model_validate(project)
 
 
+@router.get(
+    "/{project_id}/stats",
+    response_model=ProjectTaskStatsRead,
+    summary="プロジェクトのタスク集計取得",
+    description=(
+        "未削除タスク数をステータス別に取得する"
+        "（タスクの書き込み時に更新される集計テーブルから読み込む）"
+    ),
+)
+async def get_project_stats(
+    project_id: uuid.UUID,
+    db: AsyncSession = Depends(get_db_session),
+) -> ProjectTaskStatsRead:
+    """プロジェクトのタスク集計を取得する"""
+    service = ProjectService(db)
+    result = await service.get_project_stats(project_id)
+    return ProjectTaskStatsRead.model_validate(result)
+
+
 @router.patch(
     "/{project_id}",
     response_model=ProjectRead,
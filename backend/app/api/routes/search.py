@@ -0,0 +1,53 @@
+"""
+検索 API ルート。
+
+タスクのタイトル・説明に対する全文検索エンドポイントを提供する。
+プロジェクト横断、または project_id 指定でプロジェクト内に絞って検索できる。
+"""
+
+import uuid
+
+from fastapi import APIRouter, Depends, Query, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.responses import PydanticJSONResponse, render_model
+from app.db.dependencies import get_db_session
+from app.schemas.common import PaginatedResponse
+from app.schemas.task import TaskSearchHit
+from app.services.task import TaskService
+
+router = APIRouter(
+    prefix="/search",
+    tags=["検索"],
+    default_response_class=PydanticJSONResponse,
+)
+
+
+@router.get(
+    "/tasks",
+    response_model=PaginatedResponse[TaskSearchHit],
+    summary="タスク全文検索",
+    description=(
+        "タイトル・説明を全文検索し、関連度順に返す（削除済みタスクは対象外）。"
+        'q は "..." でフレーズ、-語 で除外、or で OR 検索を指定できる'
+    ),
+)
+async def search_tasks(
+    request: Request,
+    response: Response,
+    q: str = Query(..., min_length=1, max_length=200, description="検索語"),
+    project_id: uuid.UUID | None = Query(
+        default=None, description="指定時はそのプロジェクト内のみを検索"
+    ),
+    page: int = Query(default=1, ge=1, description="ページ番号"),
+    per_page: int = Query(default=20, ge=1, le=100, description="1ページあたりの件数"),
+    db: AsyncSession = Depends(get_db_session),
+) -> PaginatedResponse[TaskSearchHit] | Response:
+    """タスクを全文検索する"""
+    service = TaskService(db)
+    result = await service.search_tasks(
+        q, project_id=project_id, page=page, per_page=per_page
+    )
+    return render_model(
+        request, response, PaginatedResponse[TaskSearchHit].model_validate(result)
+    )
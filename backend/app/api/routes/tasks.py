@@ -6,21 +6,115 @@ URL はネスト構造: /api/v1/projects/{project_id}/tasks
 """
 
 import uuid
+from datetime import datetime
+from typing import Any, Literal
 
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import (
+    APIRouter,
+    Depends,
+    Header,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    status,
+)
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import StreamingResponse
+from pydantic import ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.dependencies import get_db_session
-from app.schemas.common import PaginatedResponse
-from app.schemas.task import TaskCreate, TaskRead, TaskUpdate
+from app.api.conditional import conditional_response
+from app.api.responses import PydanticJSONResponse, render_model
+from app.core.config import settings
+from app.core.pagination import CountStrategy
+from app.db.dependencies import get_db_session, session_factory_for
+from app.models.task import TaskStatus
+from app.repositories.task import TaskSortKey
+from app.schemas.common import CursorPaginatedResponse, PaginatedResponse
+from app.schemas.task import (
+    TaskBulkCreate,
+    TaskBulkDelete,
+    TaskBulkItemResult,
+    TaskBulkResponse,
+    TaskBulkUpdate,
+    TaskCreate,
+    TaskImportResult,
+    TaskListFilter,
+    TaskRead,
+    TaskUpdate,
+)
+from app.services.export import (
+    EXPORT_MEDIA_TYPES,
+    negotiate_export_format,
+    stream_tasks,
+)
+from app.services.importer import import_format_from_content_type, import_tasks
+from app.services.project import ProjectService
 from app.services.task import TaskService
 
 router = APIRouter(
     prefix="/projects/{project_id}/tasks",
     tags=["タスク"],
+    # 一覧は検証済みモデルを直接シリアライズする（response_model の再検証を省略）
+    default_response_class=PydanticJSONResponse,
 )
 
 
+def _to_bulk_response(result: dict[str, Any]) -> TaskBulkResponse:
+    """サービス層の一括操作結果をレスポンススキーマに変換する"""
+    return TaskBulkResponse(
+        results=[
+            TaskBulkItemResult(
+                index=r["index"],
+                id=r["id"],
+                status=r["status"],
+                task=(
+                    TaskRead.model_validate(r["task"])
+                    if r["task"] is not None
+                    else None
+                ),
+            )
+            for r in result["results"]
+        ],
+        succeeded=result["succeeded"],
+        failed=result["failed"],
+    )
+
+
+def _task_list_filter(
+    status_: list[TaskStatus] | None = Query(
+        default=None, alias="status", description="ステータス（複数指定可）"
+    ),
+    priority_min: int | None = Query(default=None, ge=0, description="優先度の下限"),
+    priority_max: int | None = Query(default=None, ge=0, description="優先度の上限"),
+    due_from: datetime | None = Query(default=None, description="期限日時の下限"),
+    due_to: datetime | None = Query(default=None, description="期限日時の上限"),
+    created_since: datetime | None = Query(
+        default=None, description="この日時以降に作成されたタスク"
+    ),
+    updated_since: datetime | None = Query(
+        default=None, description="この日時以降に更新されたタスク"
+    ),
+) -> TaskListFilter:
+    """一覧のフィルタ用クエリパラメータを TaskListFilter にまとめる"""
+    try:
+        return TaskListFilter(
+            status=status_,
+            priority_min=priority_min,
+            priority_max=priority_max,
+            due_from=due_from,
+            due_to=due_to,
+            created_since=created_since,
+            updated_since=updated_since,
+        )
+    except ValidationError as e:
+        # 範囲の整合性エラーも通常のクエリ検証エラーと同じ 422 で返す
+        raise RequestValidationError(
+            [{**error, "loc": ("query", *error["loc"])} for error in e.errors()]
+        ) from None
+
+
 @router.post(
     "",
     response_model=TaskRead,
@@ -39,33 +133,225 @@ async def create_task(
     return TaskRead.model_validate(task)
 
 
+# --- 一括操作（/{task_id} より先に登録して "bulk" がIDと解釈されるのを防ぐ） ---
+
+
+@router.post(
+    "/bulk",
+    response_model=TaskBulkResponse,
+    status_code=status.HTTP_201_CREATED,
+    summary="タスク一括作成",
+    description="指定プロジェクトに複数のタスクを1トランザクションで作成する",
+)
+async def bulk_create_tasks(
+    project_id: uuid.UUID,
+    data: TaskBulkCreate,
+    db: AsyncSession = Depends(get_db_session),
+) -> TaskBulkResponse:
+    """タスクを一括作成する"""
+    service = TaskService(db)
+    result = await service.bulk_create_tasks(project_id, data)
+    return _to_bulk_response(result)
+
+
+@router.patch(
+    "/bulk",
+    response_model=TaskBulkResponse,
+    summary="タスク一括更新",
+    description="指定プロジェクトの複数タスクを1トランザクションで部分更新する",
+)
+async def bulk_update_tasks(
+    project_id: uuid.UUID,
+    data: TaskBulkUpdate,
+    db: AsyncSession = Depends(get_db_session),
+) -> TaskBulkResponse:
+    """タスクを一括部分更新する"""
+    service = TaskService(db)
+    result = await service.bulk_update_tasks(project_id, data)
+    return _to_bulk_response(result)
+
+
+@router.post(
+    "/bulk-delete",
+    response_model=TaskBulkResponse,
+    summary="タスク一括削除",
+    description="指定プロジェクトの複数タスクを ID リストで削除する（論理/物理）",
+)
+async def bulk_delete_tasks(
+    project_id: uuid.UUID,
+    data: TaskBulkDelete,
+    db: AsyncSession = Depends(get_db_session),
+) -> TaskBulkResponse:
+    """タスクを一括削除する"""
+    service = TaskService(db)
+    result = await service.bulk_delete_tasks(project_id, data)
+    return _to_bulk_response(result)
+
+
+@router.post(
+    "/import",
+    response_model=TaskImportResult,
+    summary="タスクインポート",
+    description=(
+        "リクエストボディの NDJSON / CSV（Content-Type で指定）を"
+        "ストリーミングで解析し、COPY で一括ロードする。不正な行は除外して結果に含める"
+    ),
+)
+async def import_project_tasks(
+    project_id: uuid.UUID,
+    request: Request,
+    content_type: str | None = Header(default=None),
+    db: AsyncSession = Depends(get_db_session),
+) -> TaskImportResult:
+    """タスクを一括インポートする"""
+    import_format = import_format_from_content_type(content_type)
+    if import_format is None:
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail="対応形式: application/x-ndjson, text/csv",
+        )
+
+    await ProjectService(db).get_project(project_id)
+    result = await import_tasks(
+        db,
+        project_id,
+        request.stream(),
+        import_format,
+        chunk_size=settings.IMPORT_CHUNK_SIZE,
+        workers=settings.IMPORT_VALIDATION_WORKERS,
+        max_reported_errors=settings.IMPORT_MAX_REPORTED_ERRORS,
+    )
+    return TaskImportResult.model_validate(result)
+
+
+@router.get(
+    "/export",
+    response_class=StreamingResponse,
+    summary="タスクエクスポート",
+    description=(
+        "指定プロジェクトの全タスクをストリーミング出力する。"
+        "Accept ヘッダで形式を選択（application/x-ndjson / text/csv）"
+    ),
+    responses={
+        200: {"content": {"application/x-ndjson": {}, "text/csv": {}}},
+        406: {"description": "対応していない Accept ヘッダ"},
+    },
+)
+async def export_tasks(
+    project_id: uuid.UUID,
+    request: Request,
+    include_deleted: bool = Query(default=False, description="削除済みタスクを含める"),
+    accept: str | None = Header(default=None),
+    db: AsyncSession = Depends(get_db_session),
+) -> StreamingResponse:
+    """プロジェクトのタスクを NDJSON / CSV でストリーミング出力する"""
+    export_format = negotiate_export_format(accept)
+    if export_format is None:
+        raise HTTPException(
+            status_code=status.HTTP_406_NOT_ACCEPTABLE,
+            detail="対応形式: application/x-ndjson, text/csv",
+        )
+
+    # ストリーム開始後はステータスコードを変更できないため、存在確認は先に行う
+    await ProjectService(db).get_project(project_id)
+
+    extension = "csv" if export_format == "csv" else "ndjson"
+    return StreamingResponse(
+        stream_tasks(
+            project_id,
+            export_format,
+            include_deleted=include_deleted,
+            session_factory=session_factory_for(request),
+        ),
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={
+            "Content-Disposition": (
+                f'attachment; filename="tasks-{project_id}.{extension}"'
+            ),
+        },
+    )
+
+
 @router.get(
     "",
-    response_model=PaginatedResponse[TaskRead],
+    response_model=(PaginatedResponse[TaskRead] | CursorPaginatedResponse[TaskRead]),
     summary="タスク一覧取得",
-    description="指定プロジェクトのタスク一覧をページネーション付きで取得する",
+    description=(
+        "指定プロジェクトのタスク一覧をページネーション付きで取得する。"
+        "pagination=cursor または cursor 指定時はキーセット方式で取得する"
+    ),
 )
 async def get_tasks(
     project_id: uuid.UUID,
+    request: Request,
+    response: Response,
     page: int = Query(default=1, ge=1, description="ページ番号"),
     per_page: int = Query(default=20, ge=1, le=100, description="1ページあたりの件数"),
     include_deleted: bool = Query(default=False, description="削除済みタスクを含める"),
+    pagination: Literal["offset", "cursor"] = Query(
+        default="offset", description="ページネーション方式"
+    ),
+    cursor: str | None = Query(default=None, description="前ページの next_cursor"),
+    count: CountStrategy = Query(
+        default="exact",
+        description="総件数の算出戦略（オフセット方式のみ）",
+    ),
+    order_by: TaskSortKey = Query(
+        default="created_at",
+        description='ソートキー（"-" 付きは降順。due_date 系はオフセット方式のみ）',
+    ),
+    filters: TaskListFilter = Depends(_task_list_filter),
     db: AsyncSession = Depends(get_db_session),
-) -> PaginatedResponse[TaskRead]:
+) -> PaginatedResponse[TaskRead] | CursorPaginatedResponse[TaskRead] | Response:
     """プロジェクトのタスク一覧を取得する"""
     service = TaskService(db)
+
+    # --- 条件付き GET（検証子のみ取得し、未変更なら行を読み込まない） ---
+    not_modified = conditional_response(
+        request,
+        response,
+        await service.get_tasks_version(project_id),
+        vary_on=(
+            "page",
+            "per_page",
+            "include_deleted",
+            "pagination",
+            "cursor",
+            "count",
+            "order_by",
+            *TaskListFilter.model_fields,
+        ),
+    )
+    if not_modified is not None:
+        return not_modified
+
+    # --- カーソル方式（深いページでも一定コスト） ---
+    if pagination == "cursor" or cursor is not None:
+        cursor_result = await service.get_tasks_by_cursor(
+            project_id,
+            cursor=cursor,
+            per_page=per_page,
+            order_by=order_by,
+            include_deleted=include_deleted,
+            filters=filters,
+        )
+        return render_model(
+            request,
+            response,
+            CursorPaginatedResponse[TaskRead].model_validate(cursor_result),
+        )
+
     result = await service.get_tasks(
         project_id,
         page=page,
         per_page=per_page,
         include_deleted=include_deleted,
+        count=count,
+        order_by=order_by,
+        filters=filters,
     )
-    return PaginatedResponse[TaskRead](
-        items=[TaskRead.model_validate(t) for t in result["items"]],
-        total=result["total"],
-        page=result["page"],
-        per_page=result["per_page"],
-        pages=result["pages"],
+    return render_model(
+        request, response, PaginatedResponse[TaskRead].model_validate(result)
     )
 
 
@@ -78,10 +364,19 @@ async def get_tasks(
 async def get_task(
     project_id: uuid.UUID,
     task_id: uuid.UUID,
+    request: Request,
+    response: Response,
     db: AsyncSession = Depends(get_db_session),
-) -> TaskRead:
+) -> TaskRead | Response:
     """指定IDのタスクを取得する"""
     service = TaskService(db)
+
+    # --- 条件付き GET（検証子のみ取得し、未変更なら行を読み込まない） ---
+    not_modified = conditional_response(
+        request, response, await service.get_task_version(project_id, task_id)
+    )
+    if not_modified is not None:
+        return not_modified
     task = await service.get_task(project_id, task_id)
     return TaskRead.model_validate(task)
 
@@ -0,0 +1,222 @@
+"""
+アドミッション制御モジュール。
+
+ルートの種類（読み取り・書き込み・エクスポート）ごとに同時実行数を制限し、
+上限を超えたリクエストは有限の待ち行列で期限まで待たせる。
+待ち行列が満杯、または期限までに枠が空かなかったリクエストは
+AdmissionRejected で打ち切る（ミドルウェアが 503 に変換する）。
+
+上限・待ち行列の長さ・待ち時間の期限は実行中に変更できる（ワーカープロセス単位）。
+"""
+
+import asyncio
+from collections import deque
+from typing import Any, Literal, NoReturn
+
+from app.core.config import settings
+from app.core.metrics import (
+    ADMISSION_IN_FLIGHT,
+    ADMISSION_QUEUE_DEPTH,
+    ADMISSION_SHED_TOTAL,
+)
+
+# ルートの種類
+RouteClass = Literal["read", "write", "export"]
+ROUTE_CLASSES: tuple[RouteClass, ...] = ("read", "write", "export")
+
+# 打ち切りの理由（queue_full: 待ち行列が満杯 / timeout: 期限までに枠が空かない）
+ShedReason = Literal["queue_full", "timeout"]
+
+
+class AdmissionRejected(Exception):
+    """
+    同時実行数の上限によりリクエストを受け付けなかった場合の例外。
+
+    属性:
+        route_class: ルートの種類
+        reason: 打ち切りの理由
+    """
+
+    def __init__(self, route_class: RouteClass, reason: ShedReason) -> None:
+        super().__init__(f"{route_class}: {reason}")
+        self.route_class = route_class
+        self.reason = reason
+
+
+class ConcurrencyLimiter:
+    """
+    1種類のルートの同時実行数を制限するリミッター。
+
+    枠が空くと待ち行列の先頭から順に枠を引き渡す（FIFO）。
+    上限を引き上げた場合は、その場で待機中のリクエストに枠を割り当てる。
+    limit が None の場合は制限しない。
+    """
+
+    def __init__(
+        self,
+        route_class: RouteClass,
+        *,
+        limit: int | None,
+        queue_size: int,
+        queue_timeout: float,
+    ) -> None:
+        """
+        リミッターを初期化する。
+
+        Args:
+            route_class: ルートの種類（メトリクスのラベル）
+            limit: 同時実行数の上限（None の場合は制限しない）
+            queue_size: 待ち行列の最大長（0 の場合は待たずに打ち切る）
+            queue_timeout: 待ち行列での待ち時間の期限（秒）
+        """
+        self.route_class = route_class
+        self.limit = limit
+        self.queue_size = queue_size
+        self.queue_timeout = queue_timeout
+        self.in_flight = 0
+        self._waiters: deque[asyncio.Future[None]] = deque()
+
+    @property
+    def queue_depth(self) -> int:
+        """待ち行列で待機中のリクエスト数"""
+        return len(self._waiters)
+
+    def configure(
+        self,
+        *,
+        limit: int | None = None,
+        queue_size: int | None = None,
+        queue_timeout: float | None = None,
+    ) -> None:
+        """
+        上限・待ち行列の設定を変更する（指定した項目のみ）。
+
+        待ち行列を短くしても、既に待機中のリクエストは打ち切らない。
+
+        Args:
+            limit: 同時実行数の上限
+            queue_size: 待ち行列の最大長
+            queue_timeout: 待ち行列での待ち時間の期限（秒）
+        """
+        if limit is not None:
+            self.limit = limit
+        if queue_size is not None:
+            self.queue_size = queue_size
+        if queue_timeout is not None:
+            self.queue_timeout = queue_timeout
+        self._wake()
+
+    async def acquire(self) -> None:
+        """
+        実行枠を取得する（必要に応じて待ち行列で待機する）。
+
+        Raises:
+            AdmissionRejected: 待ち行列が満杯、または期限までに枠が空かない場合
+        """
+        if self._has_capacity() and not self._waiters:
+            self._admit()
+            return
+        if len(self._waiters) >= self.queue_size:
+            self._shed("queue_full")
+
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        if settings.METRICS_ENABLED:
+            ADMISSION_QUEUE_DEPTH.labels(self.route_class).inc()
+        try:
+            await asyncio.wait_for(waiter, self.queue_timeout)
+        except (TimeoutError, asyncio.CancelledError) as e:
+            if waiter.done() and not waiter.cancelled():
+                # 期限・切断と同時に枠が引き渡されていた場合は次の待機者に回す
+                self.release()
+            if isinstance(e, TimeoutError):
+                self._shed("timeout")
+            raise
+        finally:
+            if waiter in self._waiters:
+                self._waiters.remove(waiter)
+            if settings.METRICS_ENABLED:
+                ADMISSION_QUEUE_DEPTH.labels(self.route_class).dec()
+
+    def release(self) -> None:
+        """実行枠を返却し、待機中のリクエストに引き渡す"""
+        self.in_flight -= 1
+        if settings.METRICS_ENABLED:
+            ADMISSION_IN_FLIGHT.labels(self.route_class).dec()
+        self._wake()
+
+    def _has_capacity(self) -> bool:
+        """実行枠に空きがあるか（内部ヘルパー）"""
+        return self.limit is None or self.in_flight < self.limit
+
+    def _admit(self) -> None:
+        """実行枠を1つ割り当てる（内部ヘルパー）"""
+        self.in_flight += 1
+        if settings.METRICS_ENABLED:
+            ADMISSION_IN_FLIGHT.labels(self.route_class).inc()
+
+    def _wake(self) -> None:
+        """空いている枠を待ち行列の先頭から順に引き渡す（内部ヘルパー）"""
+        while self._waiters and self._has_capacity():
+            waiter = self._waiters.popleft()
+            if waiter.done():
+                continue  # 期限切れ・切断で取り消し済み
+            self._admit()
+            waiter.set_result(None)
+
+    def _shed(self, reason: ShedReason) -> NoReturn:
+        """打ち切りを記録して AdmissionRejected を送出する（内部ヘルパー）"""
+        if settings.METRICS_ENABLED:
+            ADMISSION_SHED_TOTAL.labels(self.route_class, reason).inc()
+        raise AdmissionRejected(self.route_class, reason)
+
+    def stats(self) -> dict[str, Any]:
+        """
+        現在の設定と状態を返す。
+
+        Returns:
+            route_class, limit, queue_size, queue_timeout_ms, in_flight,
+            queue_depth を含む辞書
+        """
+        return {
+            "route_class": self.route_class,
+            "limit": self.limit,
+            "queue_size": self.queue_size,
+            "queue_timeout_ms": self.queue_timeout * 1000,
+            "in_flight": self.in_flight,
+            "queue_depth": self.queue_depth,
+        }
+
+
+def classify(method: str, path: str) -> RouteClass | None:
+    """
+    リクエストをルートの種類に分類する。
+
+    /api/ 以下のみを対象とし、ヘルスチェック・メトリクス・デバッグ API は
+    混雑時にも応答できるよう制限しない。
+
+    Args:
+        method: HTTP メソッド
+        path: リクエストのパス
+
+    Returns:
+        ルートの種類（制限の対象外の場合は None）
+    """
+    if not path.startswith("/api/") or method == "OPTIONS":
+        return None
+    # エクスポート・インポートは長時間コネクションを占有するため別枠にする
+    if path.rstrip("/").rsplit("/", 1)[-1] in ("export", "import"):
+        return "export"
+    return "read" if method in ("GET", "HEAD") else "write"
+
+
+# --- ワーカープロセス単位のリミッター（ADMISSION_* 設定から作成） ---
+limiters: dict[RouteClass, ConcurrencyLimiter] = {
+    route_class: ConcurrencyLimiter(
+        route_class,
+        limit=settings.ADMISSION_LIMITS.get(route_class),
+        queue_size=settings.ADMISSION_QUEUE_SIZES.get(route_class, 0),
+        queue_timeout=settings.ADMISSION_QUEUE_TIMEOUT_MS.get(route_class, 0.0) / 1000,
+    )
+    for route_class in ROUTE_CLASSES
+}
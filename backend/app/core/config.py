@@ -49,6 +49,14 @@ class Settings(BaseSettings):
     # --- ロギング設定 ---
     LOG_LEVEL: str = "INFO"
     LOG_FORMAT: Literal["json", "text"] = "text"
+    # ログキューの最大件数（出力が追いつかず満杯の場合、新しいレコードは破棄する）
+    LOG_QUEUE_SIZE: int = 10000
+    # INFO 以下のログを出力する割合（ロガー名 → 0.0〜1.0。子ロガーにも適用。
+    # 例: {"app.request": 0.1, "uvicorn.access": 0.1}）
+    # WARNING 以上とエラー応答（status >= 400）のリクエストログは常に出力する
+    LOG_SAMPLE_RATES: dict[str, float] = {}
+    # リクエストIDのヘッダ（受け取った値をログに使い、レスポンスにも返す）
+    LOG_REQUEST_ID_HEADER: str = "X-Request-ID"
 
     # --- PostgreSQL 接続設定 ---
     POSTGRES_USER: str = "training0"
@@ -61,6 +69,158 @@ class Settings(BaseSettings):
     BACKEND_HOST: str = "0.0.0.0"
     BACKEND_PORT: int = 8000
 
+    # --- 本番サーバー設定（python -m app.serve） ---
+    # ワーカープロセス数（None: 利用可能な CPU 数。コンテナの CPU 制限を考慮する）
+    SERVER_WORKERS: int | None = None
+    # ワーカーをこの件数のリクエストごとに再起動してメモリ増加を抑える（None で無効）
+    SERVER_MAX_REQUESTS: int | None = 10000
+    # 再起動までの件数に加える乱数の上限（全ワーカーの同時再起動を避ける）
+    SERVER_MAX_REQUESTS_JITTER: int = 1000
+    # 終了シグナル受信後、処理中のリクエストの完了を待つ最大秒数
+    SERVER_GRACEFUL_TIMEOUT_SECONDS: int = 30
+    # Keep-Alive 接続を次のリクエストまで保持する秒数
+    # （前段のプロキシが Keep-Alive を使う場合はプロキシのタイムアウトより長くする）
+    SERVER_KEEP_ALIVE_SECONDS: int = 5
+    # 同じ PostgreSQL に接続するサーバー（コンテナ・ホスト）の数
+    SERVER_INSTANCES: int = 1
+    # PostgreSQL の接続数の上限（None: 起動時に max_connections から取得する）
+    DB_MAX_CONNECTIONS: int | None = None
+    # マイグレーション・運用作業などアプリ以外のために残しておく接続数
+    DB_CONNECTION_HEADROOM: int = 10
+
+    # --- DB コネクションプール設定 ---
+    # 常時保持するコネクション数
+    DB_POOL_SIZE: int = 10
+    # pool_size を超えて一時的に作成できるコネクション数
+    DB_MAX_OVERFLOW: int = 20
+    # コネクション取得の最大待ち時間（秒）。超えると sqlalchemy.exc.TimeoutError
+    DB_POOL_TIMEOUT_SECONDS: float = 30.0
+    # この秒数を超えて使われたコネクションを再接続する（-1 で無効）
+    DB_POOL_RECYCLE_SECONDS: int = -1
+    # 貸し出し前に死活確認（SELECT 1 相当）を行うか
+    DB_POOL_PRE_PING: bool = True
+    # バックプレッシャー: コネクション取得の待ちがこの時間（ミリ秒）を超える場合、
+    # 待たずに 503 と Retry-After を返す
+    # （None で無効: DB_POOL_TIMEOUT_SECONDS まで待つ）
+    DB_POOL_WAIT_BUDGET_MS: float | None = None
+
+    # --- リードレプリカ設定 ---
+    # リードレプリカの接続URL（asyncpg ドライバ、JSON 配列で指定。空の場合は使わない）
+    # GET / HEAD リクエストのセッションを正常なレプリカに振り分ける
+    DB_REPLICA_URLS: list[str] = []
+    # レプリカのヘルスチェックの間隔（秒）
+    DB_REPLICA_HEALTH_CHECK_INTERVAL_SECONDS: float = 5.0
+    # レプリカのヘルスチェック1回あたりの時間の上限（秒）
+    DB_REPLICA_HEALTH_CHECK_TIMEOUT_SECONDS: float = 2.0
+    # 複製遅延がこの秒数を超えたレプリカを使わない（None で遅延を確認しない）
+    DB_REPLICA_MAX_LAG_SECONDS: float | None = None
+    # 書き込み後、同じクライアントの読み取りをプライマリに固定する秒数（0 で無効）
+    DB_READ_YOUR_WRITES_SECONDS: float = 5.0
+    # 書き込み後の固定期限を保持する Cookie 名
+    # （Cookie を使えないクライアントは X-Read-Your-Writes-Until ヘッダで送り返す）
+    DB_READ_YOUR_WRITES_COOKIE: str = "primary_until"
+
+    # --- アドミッション制御設定 ---
+    # ルートの種類（read / write / export）ごとに同時実行数を制限するか
+    ADMISSION_CONTROL_ENABLED: bool = True
+    # ルートの種類 → 同時実行数の上限（未定義の種類は制限しない）
+    ADMISSION_LIMITS: dict[str, int] = {"read": 24, "write": 8, "export": 2}
+    # ルートの種類 → 上限を超えたリクエストの待ち行列の最大長（未定義は 0: 待たない）
+    ADMISSION_QUEUE_SIZES: dict[str, int] = {"read": 100, "write": 50, "export": 4}
+    # ルートの種類 → 待ち行列での待ち時間の期限（ミリ秒、未定義は 0）
+    ADMISSION_QUEUE_TIMEOUT_MS: dict[str, float] = {
+        "read": 1000.0,
+        "write": 2000.0,
+        "export": 5000.0,
+    }
+    # 打ち切ったリクエストの 503 レスポンスに付ける Retry-After（秒）
+    ADMISSION_RETRY_AFTER_SECONDS: int = 1
+
+    # --- ページネーション設定 ---
+    # count_strategy=cached で使用する件数キャッシュの有効期間（秒）
+    COUNT_CACHE_TTL_SECONDS: float = 30.0
+
+    # --- 一括操作設定 ---
+    # 一括作成・更新・削除エンドポイントの1リクエストあたりの最大件数
+    BULK_MAX_ITEMS: int = 1000
+    # プロジェクト集計の一括取得（/projects/stats）で指定できる最大プロジェクト数
+    STATS_MAX_PROJECT_IDS: int = 100
+
+    # --- エクスポート設定 ---
+    # サーバーサイドカーソルの1回あたりのフェッチ行数
+    EXPORT_BATCH_SIZE: int = 1000
+
+    # --- インポート設定 ---
+    # 検証・COPY の単位となる行数
+    IMPORT_CHUNK_SIZE: int = 5000
+    # チャンク検証の並列プロセス数（0 の場合はイベントループ上で検証）
+    IMPORT_VALIDATION_WORKERS: int = 0
+    # 結果に含めるエラー行の最大件数
+    IMPORT_MAX_REPORTED_ERRORS: int = 100
+
+    # --- エンティティキャッシュ設定 ---
+    # get_by_id のプロセス内リードスルーキャッシュ
+    ENTITY_CACHE_ENABLED: bool = True
+    # モデル（テーブル名）ごとの最大エントリ数
+    ENTITY_CACHE_MAX_SIZE: int = 10000
+    # テーブル名 → TTL（秒）。ここに定義されたテーブルのみキャッシュする
+    ENTITY_CACHE_TTL_SECONDS: dict[str, float] = {"projects": 30.0}
+
+    # --- 読み取りの合流設定（app.services.coalescing） ---
+    # 同じ引数の同時実行中の読み取りを1回のクエリに合流させるか
+    COALESCING_ENABLED: bool = True
+    # 1つの実行に合流できる呼び出し数の上限（超えた分は個別に実行する）
+    COALESCING_MAX_WAITERS: int = 100
+
+    # --- HTTP キャッシュ設定 ---
+    # 条件付き GET 対応ルートの Cache-Control（no-cache: 毎回 ETag で再検証させる）
+    CACHE_CONTROL_DEFAULT: str = "private, no-cache"
+    # ルート名 → Cache-Control（未定義のルートは CACHE_CONTROL_DEFAULT）
+    CACHE_CONTROL: dict[str, str] = {
+        "get_project": "private, no-cache",
+        "get_projects": "private, no-cache",
+        "get_task": "private, no-cache",
+        "get_tasks": "private, no-cache",
+    }
+
+    # --- メトリクス設定 ---
+    # /metrics エンドポイントと計測ミドルウェア・DB イベントフックを有効にするか
+    # （python -m app.serve 以外で複数ワーカー起動する場合は
+    #  環境変数 PROMETHEUS_MULTIPROC_DIR も設定すること）
+    METRICS_ENABLED: bool = True
+
+    # --- リクエスト単位のクエリ計測設定 ---
+    # SQL の件数・時間を Server-Timing ヘッダとリクエストログに出力するか
+    QUERY_STATS_ENABLED: bool = True
+    # クエリ予算・繰り返しの違反時の動作
+    # （off: 何もしない / warn: 警告ログと QueryBudgetWarning / raise: 例外を送出）
+    QUERY_STATS_STRICT: Literal["off", "warn", "raise"] = "off"
+    # ルート名 → 1リクエストあたりの SQL ステートメント数の上限（strict モードで検査）
+    QUERY_BUDGETS: dict[str, int] = {
+        "get_project": 2,
+        "get_projects": 3,
+        "get_project_stats": 1,
+        "get_task": 2,
+        "get_tasks": 3,
+    }
+    # 同じ形の SQL がこの回数以上実行されたら N+1 とみなす（strict モードで検査）
+    QUERY_REPEAT_THRESHOLD: int = 5
+
+    # --- スロークエリログ設定 ---
+    # この実行時間（ミリ秒）以上の SQL を app.slow_query に記録する（None で無効）
+    SLOW_QUERY_THRESHOLD_MS: float | None = 500.0
+    # スロークエリのうち EXPLAIN (FORMAT JSON) を再実行する割合（0.0 で無効）
+    # 読み取り専用の SQL のみが対象（書き込み・行ロックを含む SQL は実行しない）
+    SLOW_QUERY_EXPLAIN_SAMPLE_RATE: float = 0.0
+    # EXPLAIN ANALYZE で実測値を取得するか（対象の SELECT をもう一度実行する）
+    SLOW_QUERY_EXPLAIN_ANALYZE: bool = False
+    # ワーカーごとに保持する実行計画の最大件数
+    SLOW_QUERY_PLAN_BUFFER_SIZE: int = 50
+
+    # --- デバッグ API 設定 ---
+    # /debug エンドポイントの認証トークン（X-Debug-Token ヘッダで指定、空の場合は無効）
+    DEBUG_API_TOKEN: str = ""
+
     # --- CORS 設定 ---
     CORS_ORIGINS: str = "http://localhost:3000,http://localhost:5173,http://localhost:8080"
 
@@ -0,0 +1,366 @@
+"""
+構造化ロギングモジュール。
+
+ログの書き出し（標準出力への I/O とフォーマット）をイベントループから切り離すため、
+ロガーには QueueHandler のみを登録し、バックグラウンドスレッドの QueueListener が
+キューから取り出して出力する。
+
+- リクエストID・ルート・リクエスト開始からの経過時間は contextvar から取得し、
+  呼び出し元のスレッドでレコードに付与する（リスナーのスレッドでは参照できないため）
+- INFO 以下の大量のログは LOG_SAMPLE_RATES の割合に間引く
+  （同じリクエストのログはまとめて残すか捨てるかを揃える）
+- キューが満杯の場合は待たずに破棄し、log_records_dropped_total に記録する
+- JSON 形式は json.dumps で出力し、extra に指定した項目もフィールドとして含める
+"""
+
+import copy
+import json
+import logging
+import queue
+import re
+import sys
+import time
+import zlib
+from collections.abc import Callable, Mapping
+from contextvars import ContextVar, Token
+from datetime import UTC, datetime
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any
+
+from app.core.config import settings
+from app.core.metrics import LOG_RECORDS_DROPPED_TOTAL
+
+# 受け付けるリクエストIDの形式（ログへの改行・制御文字の混入を防ぐ）
+_REQUEST_ID_PATTERN = re.compile(r"[A-Za-z0-9._\-]{1,128}")
+
+# LogRecord の標準属性（これ以外の属性は extra としてJSONに含める）。
+# color_message は uvicorn がターミナル向けに付与する色付きのメッセージ
+_RESERVED_ATTRS = frozenset(
+    vars(logging.LogRecord("", logging.INFO, "", 0, "", None, None))
+) | {"message", "asctime", "taskName", "color_message"}
+
+# 例外のトレースバックを文字列にするフォーマッタ
+_exception_formatter = logging.Formatter()
+
+
+class RequestContext:
+    """
+    処理中のリクエストのログ用コンテキスト。
+
+    属性:
+        request_id: リクエストID
+        method: HTTP メソッド
+        started_at: リクエスト開始時刻（time.perf_counter）
+    """
+
+    def __init__(
+        self,
+        request_id: str,
+        method: str,
+        route_resolver: Callable[[], str] | None = None,
+    ) -> None:
+        """
+        コンテキストを初期化する。
+
+        Args:
+            request_id: リクエストID
+            method: HTTP メソッド
+            route_resolver: 処理中のリクエストのルートを返す関数
+                （ルーティング前は確定しないため、参照時に解決する）
+        """
+        self.request_id = request_id
+        self.method = method
+        self.started_at = time.perf_counter()
+        self._route_resolver = route_resolver
+
+    @property
+    def route(self) -> str | None:
+        """処理中のリクエストのルート（解決できない場合は None）"""
+        return self._route_resolver() if self._route_resolver else None
+
+    @property
+    def elapsed_ms(self) -> float:
+        """リクエスト開始からの経過時間（ミリ秒）"""
+        return round((time.perf_counter() - self.started_at) * 1000, 1)
+
+
+# 処理中のリクエストのコンテキスト（リクエスト外では None）
+_current_context: ContextVar[RequestContext | None] = ContextVar(
+    "log_request_context", default=None
+)
+
+
+def valid_request_id(value: str) -> bool:
+    """クライアントから受け取ったリクエストIDをそのまま使えるか判定する"""
+    return _REQUEST_ID_PATTERN.fullmatch(value) is not None
+
+
+def start_request_context(
+    request_id: str,
+    method: str,
+    route_resolver: Callable[[], str] | None = None,
+) -> Token[RequestContext | None]:
+    """
+    リクエストのログ用コンテキストを現在のコンテキストに設定する。
+
+    Args:
+        request_id: リクエストID
+        method: HTTP メソッド
+        route_resolver: 処理中のリクエストのルートを返す関数
+
+    Returns:
+        終了時に reset_request_context へ渡すトークン
+    """
+    return _current_context.set(RequestContext(request_id, method, route_resolver))
+
+
+def reset_request_context(token: Token[RequestContext | None]) -> None:
+    """
+    ログ用コンテキストを設定前の状態に戻す。
+
+    Args:
+        token: start_request_context が返したトークン
+    """
+    _current_context.reset(token)
+
+
+def current_request_context() -> RequestContext | None:
+    """処理中のリクエストのログ用コンテキストを返す（リクエスト外では None）"""
+    return _current_context.get()
+
+
+class RequestContextFilter(logging.Filter):
+    """
+    処理中のリクエストの request_id・route・elapsed_ms をレコードに付与するフィルタ。
+
+    extra で同名の項目が指定されている場合はそちらを優先する。
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        context = _current_context.get()
+        if context is not None:
+            if not hasattr(record, "request_id"):
+                record.request_id = context.request_id
+            if not hasattr(record, "route"):
+                record.route = context.route
+            if not hasattr(record, "elapsed_ms"):
+                record.elapsed_ms = context.elapsed_ms
+        return True
+
+
+class SamplingFilter(logging.Filter):
+    """
+    INFO 以下のログをロガーごとの割合に間引くフィルタ。
+
+    - WARNING 以上と、ステータス 400 以上のリクエストログ（extra の status）は常に残す
+    - ロガー名とその親（app.request → app）の順に割合を探し、未定義の場合は間引かない
+    - リクエスト内のログはリクエストIDから判定し、同じリクエストのログを揃えて残す
+    - 残したレコードには sample_rate を付与する（集計時の重み付け用）
+    """
+
+    def __init__(self, rates: Mapping[str, float]) -> None:
+        """
+        フィルタを初期化する。
+
+        Args:
+            rates: ロガー名 → 出力する割合（0.0〜1.0）
+        """
+        super().__init__()
+        self.rates = dict(rates)
+        self._counter = 0
+
+    def _rate(self, name: str) -> float | None:
+        """ロガー名（または親）に設定された割合を返す（内部ヘルパー）"""
+        while name:
+            rate = self.rates.get(name)
+            if rate is not None:
+                return rate
+            name = name.rpartition(".")[0]
+        return None
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > logging.INFO or getattr(record, "status", 0) >= 400:
+            return True
+        rate = self._rate(record.name)
+        if rate is None or rate >= 1.0:
+            return True
+
+        request_id = getattr(record, "request_id", None)
+        if request_id is not None:
+            point = zlib.crc32(request_id.encode()) / 0xFFFFFFFF
+        else:
+            # リクエスト外のログは件数で等間隔に間引く
+            self._counter += 1
+            point = (self._counter * 0.6180339887) % 1.0
+        if point >= rate:
+            if settings.METRICS_ENABLED:
+                LOG_RECORDS_DROPPED_TOTAL.labels("sampled").inc()
+            return False
+        record.sample_rate = rate
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    1レコードを1行の JSON に変換するフォーマッタ。
+
+    time（UTC、ミリ秒）・level・logger・message と、extra・コンテキストの項目、
+    例外がある場合は exception（トレースバック）を出力する。
+    JSON に変換できない値は文字列にする。
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload: dict[str, Any] = {
+            "time": datetime.fromtimestamp(record.created, UTC).isoformat(
+                timespec="milliseconds"
+            ),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in vars(record).items():
+            if key not in _RESERVED_ATTRS and not key.startswith("_"):
+                payload[key] = value
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            payload["exception"] = record.exc_text
+        if record.stack_info:
+            payload["stack"] = record.stack_info
+        return json.dumps(payload, ensure_ascii=False, default=str)
+
+
+class NonBlockingQueueHandler(QueueHandler):
+    """
+    レコードをキューに入れるだけのハンドラ（呼び出し元をブロックしない）。
+
+    - メッセージの組み立てと例外のトレースバックの文字列化は呼び出し元で行い、
+      フォーマット（JSON 化）と出力はリスナーのスレッドで行う
+    - キューが満杯の場合はレコードを破棄する
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # 引数・例外オブジェクトはスレッドをまたいで参照させない
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        if record.exc_info:
+            record.exc_text = _exception_formatter.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            if settings.METRICS_ENABLED:
+                LOG_RECORDS_DROPPED_TOTAL.labels("queue_full").inc()
+
+
+def create_queue_pipeline(
+    handler: logging.Handler,
+    *,
+    queue_size: int,
+    sample_rates: Mapping[str, float] | None = None,
+) -> tuple[NonBlockingQueueHandler, QueueListener]:
+    """
+    キュー経由でハンドラに出力するパイプラインを作成する（リスナーは未開始）。
+
+    Args:
+        handler: リスナーのスレッドで出力するハンドラ
+        queue_size: キューの最大件数（超えたレコードは破棄する）
+        sample_rates: ロガー名 → INFO 以下のログを出力する割合
+
+    Returns:
+        (ロガーに登録するハンドラ, start() で開始するリスナー) のタプル
+    """
+    log_queue: queue.Queue[logging.LogRecord] = queue.Queue(maxsize=queue_size)
+    queue_handler = NonBlockingQueueHandler(log_queue)
+    queue_handler.addFilter(RequestContextFilter())
+    if sample_rates:
+        queue_handler.addFilter(SamplingFilter(sample_rates))
+    listener = QueueListener(log_queue, handler, respect_handler_level=True)
+    return queue_handler, listener
+
+
+# 動作中のリスナー（setup_logging で開始し、stop_logging で停止する）
+_listener: QueueListener | None = None
+
+
+def setup_logging() -> None:
+    """
+    構造化ロギングを設定する。
+
+    環境モードに応じてログ形式を切り替え:
+    - dev: 人間が読みやすいテキスト形式
+    - prod: JSON 形式（ログ集約ツール向け）
+
+    ルートロガーには NonBlockingQueueHandler のみを登録し、
+    標準出力への書き出しはバックグラウンドスレッドで行う。
+    uvicorn のロガーも同じパイプラインに流す。
+    """
+    global _listener
+    stop_logging()
+
+    # ルートロガーの設定
+    root_logger = logging.getLogger()
+    root_logger.setLevel(settings.log_level_int)
+
+    # 既存のハンドラをクリア（重複防止）
+    root_logger.handlers.clear()
+
+    # コンソールハンドラの作成（リスナーのスレッドで出力する）
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setLevel(settings.log_level_int)
+
+    if settings.LOG_FORMAT == "json":
+        # --- 本番環境向け: JSON 形式 ---
+        # ログ集約ツール（CloudWatch, Datadog 等）でパースしやすい形式
+        formatter: logging.Formatter = JsonFormatter()
+    else:
+        # --- 開発環境向け: テキスト形式 ---
+        formatter = logging.Formatter(
+            "%(asctime)s | %(levelname)-8s | %(name)s | %(message)s",
+            datefmt="%Y-%m-%d %H:%M:%S",
+        )
+    handler.setFormatter(formatter)
+
+    queue_handler, _listener = create_queue_pipeline(
+        handler,
+        queue_size=settings.LOG_QUEUE_SIZE,
+        sample_rates=settings.LOG_SAMPLE_RATES,
+    )
+    root_logger.addHandler(queue_handler)
+    _listener.start()
+
+    # SQLAlchemy のログレベルを調整（DEBUGモード以外は抑制）
+    logging.getLogger("sqlalchemy.engine").setLevel(
+        logging.DEBUG if settings.DEBUG else logging.WARNING
+    )
+    # uvicorn のログ（独自の同期ハンドラを外してルートロガーに流す）
+    for name in ("uvicorn", "uvicorn.error", "uvicorn.access"):
+        uvicorn_logger = logging.getLogger(name)
+        uvicorn_logger.handlers.clear()
+        uvicorn_logger.propagate = True
+    logging.getLogger("uvicorn.access").setLevel(logging.INFO)
+
+
+def stop_logging() -> None:
+    """
+    リスナーを停止する（キューに残ったレコードを出力してから戻る）。
+
+    停止後のログ（サーバー終了時のログなど）は、ルートロガーから
+    出力先のハンドラに直接出力する。
+    """
+    global _listener
+    if _listener is None:
+        return
+    _listener.stop()
+    root_logger = logging.getLogger()
+    for handler in list(root_logger.handlers):
+        if isinstance(handler, NonBlockingQueueHandler):
+            root_logger.removeHandler(handler)
+    for handler in _listener.handlers:
+        root_logger.addHandler(handler)
+    _listener = None
@@ -0,0 +1,194 @@
+"""
+Prometheus メトリクス定義モジュール。
+
+HTTP リクエスト・DB クエリ・コネクションプール・リードレプリカ・読み取りの合流・
+ロギングのメトリクスを定義し、/metrics 用のテキスト形式の出力を提供する。
+
+複数ワーカー（uvicorn --workers など）で起動する場合は、
+プロセス起動前に環境変数 PROMETHEUS_MULTIPROC_DIR に空のディレクトリを指定する
+（python -m app.serve は自動で用意する）。
+各ワーカーの値はそのディレクトリのファイルに書き込まれ、
+/metrics ではどのワーカーが応答しても全ワーカーの合算値を返す。
+"""
+
+import os
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+
+# DB クエリ・プール待ち時間用のバケット（秒）。HTTP より細かい範囲を対象にする
+_DB_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+)
+
+# --- HTTP メトリクス ---
+# route はルートのパステンプレート（/api/v1/projects/{project_id} など）。
+# 生のパスを使うと ID ごとに系列が増えるため使用しない
+HTTP_REQUESTS_TOTAL = Counter(
+    "http_requests_total",
+    "HTTP リクエスト数",
+    ["method", "route", "status"],
+)
+HTTP_REQUEST_DURATION_SECONDS = Histogram(
+    "http_request_duration_seconds",
+    "HTTP リクエストの処理時間（秒）",
+    ["method", "route"],
+)
+# ゲージは multiprocess_mode でワーカー間の集約方法を指定する
+# （livesum: 稼働中のプロセスの値の合計）
+HTTP_REQUESTS_IN_PROGRESS = Gauge(
+    "http_requests_in_progress",
+    "処理中の HTTP リクエスト数",
+    ["method"],
+    multiprocess_mode="livesum",
+)
+
+# --- アドミッション制御メトリクス ---
+ADMISSION_IN_FLIGHT = Gauge(
+    "admission_in_flight",
+    "実行枠を取得して処理中のリクエスト数（ルートの種類別）",
+    ["route_class"],
+    multiprocess_mode="livesum",
+)
+ADMISSION_QUEUE_DEPTH = Gauge(
+    "admission_queue_depth",
+    "実行枠の空きを待っているリクエスト数（ルートの種類別）",
+    ["route_class"],
+    multiprocess_mode="livesum",
+)
+ADMISSION_SHED_TOTAL = Counter(
+    "admission_shed_total",
+    "同時実行数の上限により 503 で打ち切ったリクエスト数"
+    "（queue_full: 待ち行列が満杯 / timeout: 期限までに枠が空かない）",
+    ["route_class", "reason"],
+)
+
+# --- DB メトリクス ---
+DB_QUERIES_TOTAL = Counter(
+    "db_queries_total",
+    "実行した SQL ステートメント数",
+    ["operation"],
+)
+DB_QUERY_DURATION_SECONDS = Histogram(
+    "db_query_duration_seconds",
+    "SQL ステートメントの実行時間（秒）",
+    ["operation"],
+    buckets=_DB_BUCKETS,
+)
+DB_POOL_CHECKED_OUT = Gauge(
+    "db_pool_checked_out",
+    "貸し出し中のコネクション数",
+    multiprocess_mode="livesum",
+)
+DB_POOL_OVERFLOW = Gauge(
+    "db_pool_overflow",
+    "pool_size を超えて作成されたオーバーフローコネクション数",
+    multiprocess_mode="livesum",
+)
+DB_POOL_WAITERS = Gauge(
+    "db_pool_waiters",
+    "空きコネクションを待っているリクエスト数",
+    multiprocess_mode="livesum",
+)
+DB_POOL_REJECTIONS_TOTAL = Counter(
+    "db_pool_rejections_total",
+    "バックプレッシャーで取得を打ち切った回数"
+    "（predicted: 待ち時間の見込みで即時 / timeout: 待ち時間の上限に到達）",
+    ["reason"],
+)
+DB_POOL_CHECKOUT_WAIT_SECONDS = Histogram(
+    "db_pool_checkout_wait_seconds",
+    "プールからコネクションを取得するまでの待ち時間（秒、新規接続時は接続時間を含む）",
+    buckets=_DB_BUCKETS,
+)
+
+DB_SESSION_ROUTING_TOTAL = Counter(
+    "db_session_routing_total",
+    "リクエストのセッションの振り分け先（primary / replica）と理由"
+    "（write: 書き込み / read: 読み取り / read_your_writes: 書き込み直後の固定 /"
+    " no_replica: 正常なレプリカなし）",
+    ["target", "reason"],
+)
+DB_REPLICA_HEALTHY = Gauge(
+    "db_replica_healthy",
+    "リードレプリカが正常か（1: 正常 / 0: 異常。マルチプロセス時は全ワーカーの最小値）",
+    ["replica"],
+    multiprocess_mode="livemin",
+)
+DB_REPLICA_LAG_SECONDS = Gauge(
+    "db_replica_lag_seconds",
+    "ヘルスチェックで計測したリードレプリカの複製遅延（秒）",
+    ["replica"],
+    multiprocess_mode="livemax",
+)
+
+# --- 読み取りの合流メトリクス ---
+COALESCED_CALLS_TOTAL = Counter(
+    "coalesced_calls_total",
+    "サービスの読み取りの呼び出し数（leader: クエリを実行 / follower: 実行中の"
+    "呼び出しに合流 / overflow: 合流できる数の上限を超えたため個別に実行）",
+    ["operation", "role"],
+)
+
+# --- ロギングメトリクス ---
+LOG_RECORDS_DROPPED_TOTAL = Counter(
+    "log_records_dropped_total",
+    "出力しなかったログレコード数"
+    "（queue_full: ログキューが満杯 / sampled: LOG_SAMPLE_RATES による間引き）",
+    ["reason"],
+)
+
+
+def is_multiprocess() -> bool:
+    """マルチプロセスモード（PROMETHEUS_MULTIPROC_DIR 指定あり）かを返す"""
+    return "PROMETHEUS_MULTIPROC_DIR" in os.environ
+
+
+def render_metrics() -> tuple[bytes, str]:
+    """
+    メトリクスを Prometheus のテキスト形式で出力する。
+
+    マルチプロセスモードでは、共有ディレクトリから全ワーカーの値を集約する。
+
+    Returns:
+        (本文, Content-Type) のタプル
+    """
+    if is_multiprocess():
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)  # type: ignore[no-untyped-call]
+    else:
+        registry = REGISTRY
+    return generate_latest(registry), CONTENT_TYPE_LATEST
+
+
+def mark_process_dead(pid: int) -> None:
+    """
+    終了したワーカーの livesum ゲージを集計対象から外す。
+
+    マルチプロセスモード以外では何もしない。
+
+    Args:
+        pid: 終了したプロセスのPID
+    """
+    if is_multiprocess():
+        multiprocess.mark_process_dead(pid)  # type: ignore[no-untyped-call]
@@ -0,0 +1,11 @@
+"""
+ページネーションの共通定義モジュール。
+
+スキーマ層（レスポンスの count_strategy）とリポジトリ層（総件数の算出）の
+両方から参照する型を定義する。各戦略の動作は app.repositories.counting を参照。
+"""
+
+from typing import Literal
+
+# 総件数の算出戦略
+CountStrategy = Literal["exact", "estimated", "cached", "none"]
@@ -3,20 +3,86 @@
 
 FastAPI の Depends() 経由で各リクエストに
 非同期DBセッションを提供する。
+リードレプリカ（DB_REPLICA_URLS）の設定時は、読み取り専用のリクエストの
+セッションをレプリカに振り分ける（app.db.replicas）。
 """
 
+import time
 from collections.abc import AsyncGenerator
 
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import Request
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
+from app.core.config import settings
+from app.core.metrics import DB_SESSION_ROUTING_TOTAL
+from app.db.replicas import READ_YOUR_WRITES_HEADER, replica_set
 from app.db.session import async_session_factory
 
+# レプリカに振り分けるメソッド（書き込みを行わないリクエスト）
+READ_METHODS = frozenset({"GET", "HEAD"})
 
-async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
+
+def pinned_to_primary(request: Request) -> bool:
+    """
+    クライアントが書き込み直後の期間内か（読み取りをプライマリに固定するか）を判定する。
+
+    期限（UNIX 時刻）は書き込み時に Cookie と X-Read-Your-Writes-Until ヘッダで返し、
+    クライアントはどちらかで送り返す。
+
+    Args:
+        request: 処理中のリクエスト
+
+    Returns:
+        期限内の場合は True
+    """
+    value = request.cookies.get(
+        settings.DB_READ_YOUR_WRITES_COOKIE
+    ) or request.headers.get(READ_YOUR_WRITES_HEADER)
+    if not value:
+        return False
+    try:
+        return float(value) > time.time()
+    except ValueError:
+        return False
+
+
+def session_factory_for(request: Request) -> async_sessionmaker[AsyncSession]:
+    """
+    リクエストのセッションの接続先（プライマリ / レプリカ）を選ぶ。
+
+    - GET / HEAD 以外: プライマリ（同じリクエスト内の読み取りも含めて一貫させる）
+    - 書き込み直後の期間内のクライアント: プライマリ（自分の書き込みを読めるようにする）
+    - それ以外: 正常なレプリカ（ない場合はプライマリ）
+
+    Args:
+        request: 処理中のリクエスト
+
+    Returns:
+        セッションファクトリ
+    """
+    if not replica_set:
+        return async_session_factory
+
+    if request.method not in READ_METHODS:
+        target, reason, factory = "primary", "write", async_session_factory
+    elif pinned_to_primary(request):
+        target, reason, factory = "primary", "read_your_writes", async_session_factory
+    elif (replica := replica_set.pick()) is not None:
+        target, reason, factory = "replica", "read", replica.session_factory
+    else:
+        target, reason, factory = "primary", "no_replica", async_session_factory
+
+    if settings.METRICS_ENABLED:
+        DB_SESSION_ROUTING_TOTAL.labels(target, reason).inc()
+    return factory
+
+
+async def get_db_session(request: Request) -> AsyncGenerator[AsyncSession]:
     """
     リクエストスコープの非同期DBセッションを提供する。
 
     - 各リクエストに対して新しいセッションを生成
+    - GET / HEAD はリードレプリカ、それ以外はプライマリに接続（session_factory_for）
     - リクエスト終了時にセッションを自動クローズ
     - 例外発生時もセッションは確実にクローズされる（finally節）
 
@@ -25,6 +91,19 @@ async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
         async def get_items(db: AsyncSession = Depends(get_db_session)):
             ...
     """
+    async with session_factory_for(request)() as session:
+        try:
+            yield session
+        finally:
+            await session.close()
+
+
+async def get_primary_db_session() -> AsyncGenerator[AsyncSession]:
+    """
+    常にプライマリに接続する非同期DBセッションを提供する。
+
+    レプリカの遅延を許容できない読み取り（ヘルスチェックなど）で使用する。
+    """
     async with async_session_factory() as session:
         try:
             yield session
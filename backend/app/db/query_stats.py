@@ -0,0 +1,167 @@
+"""
+リクエスト単位のクエリ計測モジュール。
+
+ミドルウェアがリクエストごとに QueryStats を contextvar に設定し、
+エンジンの after_cursor_execute フックが実行した SQL の件数・時間・形を記録する。
+結果は Server-Timing ヘッダとリクエストログに出力し、
+strict モードではクエリ予算の超過や同一形状の繰り返し（N+1）を検出する。
+"""
+
+import re
+import time
+from collections import Counter
+from collections.abc import Callable
+from contextvars import ContextVar, Token
+
+# パラメータ・リテラルを ? に置き換えるパターン
+# （asyncpg の $1::TYPE / :name / %(name)s / 文字列 / 数値）
+_PLACEHOLDER = re.compile(
+    r"\$\d+(?:::\w+(?: WITH(?:OUT)? TIME ZONE)?(?:\[\])?)?"
+    r"|%\(\w+\)s|(?<![\w:]):\w+|'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b"
+)
+# IN (?, ?, ...) や複数行 VALUES の件数の違いを同じ形として扱う
+_REPEATED_PLACEHOLDERS = re.compile(r"\?(?:\s*,\s*\?)+")
+_REPEATED_ROWS = re.compile(r"\(\?\)(?:\s*,\s*\(\?\))+")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_sql(statement: str) -> str:
+    """
+    SQL 文をパラメータの値や件数に依存しない「形」に正規化する。
+
+    Args:
+        statement: 実行された SQL 文
+
+    Returns:
+        パラメータ・リテラルを ? に置き換え、空白を1つにまとめた SQL 文
+    """
+    shape = _PLACEHOLDER.sub("?", statement)
+    shape = _REPEATED_PLACEHOLDERS.sub("?", shape)
+    shape = _REPEATED_ROWS.sub("(?)", shape)
+    return _WHITESPACE.sub(" ", shape).strip()
+
+
+class QueryStats:
+    """
+    1リクエスト分のクエリ計測結果。
+
+    属性:
+        started_at: リクエスト開始時刻（time.perf_counter）
+        count: 実行した SQL ステートメント数
+        duration: SQL の実行時間の合計（秒）
+        shapes: 正規化した SQL 文 → 実行回数
+    """
+
+    def __init__(self, route_resolver: Callable[[], str] | None = None) -> None:
+        """
+        計測を初期化する。
+
+        Args:
+            route_resolver: 処理中のリクエストのルートを返す関数
+                （ルーティング前は確定しないため、参照時に解決する）
+        """
+        self._route_resolver = route_resolver
+        self.started_at = time.perf_counter()
+        self.count = 0
+        self.duration = 0.0
+        self.shapes: Counter[str] = Counter()
+
+    @property
+    def route(self) -> str | None:
+        """処理中のリクエストのルート（解決できない場合は None）"""
+        return self._route_resolver() if self._route_resolver else None
+
+    def record(self, statement: str, elapsed: float) -> None:
+        """
+        実行した SQL を記録する。
+
+        Args:
+            statement: 実行された SQL 文
+            elapsed: 実行時間（秒）
+        """
+        self.count += 1
+        self.duration += elapsed
+        self.shapes[normalize_sql(statement)] += 1
+
+    def repeated_shapes(self, threshold: int) -> list[tuple[str, int]]:
+        """
+        threshold 回以上実行された SQL の形を返す（N+1 の候補）。
+
+        Args:
+            threshold: 繰り返しとみなす実行回数
+
+        Returns:
+            (正規化した SQL 文, 実行回数) のリスト（回数の多い順）
+        """
+        return [
+            (shape, times)
+            for shape, times in self.shapes.most_common()
+            if times >= threshold
+        ]
+
+
+# 処理中のリクエストの計測結果（リクエスト外では None）
+_current_stats: ContextVar[QueryStats | None] = ContextVar("query_stats", default=None)
+
+
+def start_query_stats(
+    route_resolver: Callable[[], str] | None = None,
+) -> tuple[QueryStats, Token[QueryStats | None]]:
+    """
+    新しい計測を開始し、現在のコンテキストに設定する。
+
+    Args:
+        route_resolver: 処理中のリクエストのルートを返す関数
+
+    Returns:
+        (計測結果, 終了時に reset_query_stats へ渡すトークン) のタプル
+    """
+    stats = QueryStats(route_resolver)
+    return stats, _current_stats.set(stats)
+
+
+def reset_query_stats(token: Token[QueryStats | None]) -> None:
+    """
+    計測を終了し、コンテキストを開始前の状態に戻す。
+
+    Args:
+        token: start_query_stats が返したトークン
+    """
+    _current_stats.reset(token)
+
+
+def current_query_stats() -> QueryStats | None:
+    """処理中のリクエストの計測結果を返す（リクエスト外では None）"""
+    return _current_stats.get()
+
+
+class QueryBudgetWarning(UserWarning):
+    """strict=warn でクエリ予算の超過・同一形状の繰り返しを検出した場合の警告"""
+
+
+class QueryBudgetExceeded(RuntimeError):
+    """strict=raise でクエリ予算の超過・同一形状の繰り返しを検出した場合の例外"""
+
+
+def find_violations(
+    stats: QueryStats, *, budget: int | None, repeat_threshold: int
+) -> list[str]:
+    """
+    計測結果からクエリ予算の超過と同一形状の繰り返しを検出する。
+
+    Args:
+        stats: 1リクエスト分の計測結果
+        budget: SQL ステートメント数の上限（None の場合は検査しない）
+        repeat_threshold: 繰り返しとみなす実行回数
+
+    Returns:
+        違反内容の説明のリスト（違反なしの場合は空）
+    """
+    violations = []
+    if budget is not None and stats.count > budget:
+        violations.append(f"{stats.count} 件のクエリ（予算 {budget} 件）")
+    violations.extend(
+        f"同じ形のクエリを {times} 回実行: {shape}"
+        for shape, times in stats.repeated_shapes(repeat_threshold)
+    )
+    return violations
@@ -0,0 +1,236 @@
+"""
+リードレプリカのルーティングモジュール。
+
+DB_REPLICA_URLS に指定したリードレプリカごとにエンジンを作成し、
+読み取り専用のリクエストのセッションを正常なレプリカにラウンドロビンで割り当てる。
+書き込みを行うリクエストのセッションは常にプライマリを使う。
+
+レプリカの正常性は定期的なヘルスチェック（SELECT 1 と複製遅延の確認）と、
+クエリ実行時の接続断の検知で判定する。接続断を検知したレプリカは
+次のヘルスチェックで復旧を確認するまで使わない。
+正常なレプリカがない場合はプライマリにフォールバックする。
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any
+
+from sqlalchemy import event, text
+from sqlalchemy.engine import ExceptionContext, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.core.config import settings
+from app.core.metrics import DB_REPLICA_HEALTHY, DB_REPLICA_LAG_SECONDS
+from app.db.session import build_engine, build_session_factory
+
+logger = logging.getLogger(__name__)
+
+# 書き込み直後の固定期限を Cookie の代わりに送り返すためのヘッダ
+READ_YOUR_WRITES_HEADER = "X-Read-Your-Writes-Until"
+
+# 複製遅延（秒）。レプリカでない（リカバリ中でない）場合と、受信済みの WAL を
+# すべて適用済みの場合は 0。最後に適用したトランザクションからの経過時間は
+# プライマリに書き込みがない間も増え続けるため、適用が遅れている場合のみ計測する
+_LAG_QUERY = text(
+    "SELECT CASE"
+    " WHEN NOT pg_is_in_recovery() THEN 0"
+    " WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0"
+    " ELSE COALESCE("
+    "EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0"
+    ") END"
+)
+
+
+class Replica:
+    """
+    1台のリードレプリカ。
+
+    属性:
+        name: 表示名（host:port/database。パスワードを含めない）
+        engine: レプリカのエンジン
+        session_factory: レプリカのセッションファクトリ
+        healthy: 正常か（起動直後は最初のヘルスチェックまで正常とみなす）
+        lag_seconds: 最後に計測した複製遅延（秒、未計測の場合は None）
+        last_error: 最後に異常と判定した理由（正常な場合は None）
+        checked_at: 最後にヘルスチェックを行った時刻（time.time、未実施の場合は None）
+    """
+
+    def __init__(self, name: str, engine: AsyncEngine) -> None:
+        self.name = name
+        self.engine = engine
+        self.session_factory = build_session_factory(engine, read_replica=True)
+        self.healthy = True
+        self.lag_seconds: float | None = None
+        self.last_error: str | None = None
+        self.checked_at: float | None = None
+
+    def mark(self, healthy: bool, error: str | None = None) -> None:
+        """
+        正常性を更新する（状態が変わった場合はログに記録する）。
+
+        Args:
+            healthy: 正常か
+            error: 異常と判定した理由
+        """
+        if healthy != self.healthy:
+            if healthy:
+                logger.info("リードレプリカが復旧しました replica=%s", self.name)
+            else:
+                logger.warning(
+                    "リードレプリカを切り離しました replica=%s reason=%s",
+                    self.name,
+                    error,
+                )
+        self.healthy = healthy
+        self.last_error = None if healthy else error
+        DB_REPLICA_HEALTHY.labels(self.name).set(1 if healthy else 0)
+
+    def stats(self) -> dict[str, Any]:
+        """
+        現在の状態を返す（ヘルスチェック用）。
+
+        Returns:
+            name, healthy, lag_seconds, last_error, checked_at を含む辞書
+        """
+        return {
+            "name": self.name,
+            "healthy": self.healthy,
+            "lag_seconds": self.lag_seconds,
+            "last_error": self.last_error,
+            "checked_at": self.checked_at,
+        }
+
+
+class ReplicaSet:
+    """
+    リードレプリカの集合とヘルスチェック。
+
+    属性:
+        replicas: 登録されたレプリカ
+        max_lag: 許容する複製遅延（秒、None の場合は確認しない）
+        check_interval: ヘルスチェックの間隔（秒）
+        check_timeout: ヘルスチェック1回あたりの時間の上限（秒）
+    """
+
+    def __init__(
+        self,
+        replicas: list[Replica],
+        *,
+        max_lag: float | None,
+        check_interval: float,
+        check_timeout: float,
+    ) -> None:
+        """
+        レプリカの集合を初期化し、接続断の検知フックを登録する。
+
+        Args:
+            replicas: 登録するレプリカ
+            max_lag: 許容する複製遅延（秒、None の場合は確認しない）
+            check_interval: ヘルスチェックの間隔（秒）
+            check_timeout: ヘルスチェック1回あたりの時間の上限（秒）
+        """
+        self.replicas = replicas
+        self.max_lag = max_lag
+        self.check_interval = check_interval
+        self.check_timeout = check_timeout
+        self._next = 0
+        for replica in replicas:
+            DB_REPLICA_HEALTHY.labels(replica.name).set(1)
+            self._watch_disconnects(replica)
+
+    def __len__(self) -> int:
+        return len(self.replicas)
+
+    @staticmethod
+    def _watch_disconnects(replica: Replica) -> None:
+        """クエリ・接続で接続断を検知したらレプリカを切り離す（内部ヘルパー）"""
+
+        @event.listens_for(replica.engine.sync_engine, "handle_error")
+        def _handle_error(context: ExceptionContext) -> None:
+            if context.is_disconnect:
+                replica.mark(False, f"接続断: {context.original_exception}")
+
+    def pick(self) -> Replica | None:
+        """
+        正常なレプリカをラウンドロビンで1台選ぶ。
+
+        Returns:
+            選んだレプリカ（正常なレプリカがない場合は None）
+        """
+        for _ in range(len(self.replicas)):
+            replica = self.replicas[self._next % len(self.replicas)]
+            self._next += 1
+            if replica.healthy:
+                return replica
+        return None
+
+    async def check(self, replica: Replica) -> None:
+        """
+        レプリカに接続して正常性と複製遅延を確認する。
+
+        Args:
+            replica: 対象レプリカ
+        """
+
+        async def probe() -> float:
+            async with replica.engine.connect() as conn:
+                lag = await conn.scalar(_LAG_QUERY)
+            return float(lag or 0.0)
+
+        replica.checked_at = time.time()
+        try:
+            lag = await asyncio.wait_for(probe(), self.check_timeout)
+        except Exception as e:  # 接続失敗・タイムアウトはすべて異常とする
+            replica.mark(False, f"ヘルスチェック失敗: {type(e).__name__}: {e}")
+            return
+
+        replica.lag_seconds = lag
+        DB_REPLICA_LAG_SECONDS.labels(replica.name).set(lag)
+        if self.max_lag is not None and lag > self.max_lag:
+            replica.mark(False, f"複製遅延 {lag:.1f} 秒（上限 {self.max_lag} 秒）")
+        else:
+            replica.mark(True)
+
+    async def check_all(self) -> None:
+        """全レプリカのヘルスチェックを並行して実行する"""
+        await asyncio.gather(*(self.check(replica) for replica in self.replicas))
+
+    async def run_health_checks(self) -> None:
+        """ヘルスチェックを check_interval ごとに繰り返す（キャンセルされるまで）"""
+        while True:
+            await self.check_all()
+            await asyncio.sleep(self.check_interval)
+
+    async def dispose(self) -> None:
+        """全レプリカのエンジンを破棄する"""
+        for replica in self.replicas:
+            await replica.engine.dispose()
+
+    def stats(self) -> list[dict[str, Any]]:
+        """
+        全レプリカの状態を返す。
+
+        Returns:
+            Replica.stats() のリスト
+        """
+        return [replica.stats() for replica in self.replicas]
+
+
+def _display_name(url: str) -> str:
+    """接続URLから表示名（host:port/database）を作る（内部ヘルパー）"""
+    parsed = make_url(url)
+    return f"{parsed.host}:{parsed.port or 5432}/{parsed.database}"
+
+
+# --- ワーカープロセス単位のレプリカ集合（DB_REPLICA_* 設定から作成） ---
+# コネクションプールのメトリクス（db_pool_*）はプライマリのみ記録する
+replica_set = ReplicaSet(
+    [
+        Replica(_display_name(url), build_engine(url, pool_metrics=False))
+        for url in settings.DB_REPLICA_URLS
+    ],
+    max_lag=settings.DB_REPLICA_MAX_LAG_SECONDS,
+    check_interval=settings.DB_REPLICA_HEALTH_CHECK_INTERVAL_SECONDS,
+    check_timeout=settings.DB_REPLICA_HEALTH_CHECK_TIMEOUT_SECONDS,
+)
@@ -3,34 +3,402 @@
 
 SQLAlchemy 2.0 の非同期機能を使用して、
 PostgreSQL (asyncpg) への接続を管理する。
+METRICS_ENABLED の場合は、クエリとコネクションプールの
+Prometheus メトリクスを記録するイベントフックを登録する。
+QUERY_STATS_ENABLED の場合は、リクエスト単位のクエリ計測にも記録する。
+SLOW_QUERY_THRESHOLD_MS を超えた SQL はスロークエリログに記録する。
+コネクションプールは DB_POOL_* 設定で構成し、DB_POOL_WAIT_BUDGET_MS の指定時は
+取得待ちが上限を超える要求を待たせずに失敗させる（バックプレッシャー）。
+リードレプリカのエンジンも build_engine で同じ設定で作成する（app.db.replicas）。
 """
 
+import math
+import time
+from typing import Any, NoReturn, cast
+
+from sqlalchemy import event, exc
+from sqlalchemy.engine import Connection, Engine, ExceptionContext
+from sqlalchemy.engine.interfaces import ExecutionContext
 from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry
 
 from app.core.config import settings
-
-# --- 非同期エンジンの作成 ---
-# pool_pre_ping: 接続の死活監視（stale connection 防止）
-# echo: DEBUG時のみSQLログを出力
-async_engine = create_async_engine(
-    settings.DATABASE_URL,
-    echo=settings.DEBUG,
-    pool_pre_ping=True,
-    pool_size=10,
-    max_overflow=20,
+from app.core.metrics import (
+    DB_POOL_CHECKED_OUT,
+    DB_POOL_CHECKOUT_WAIT_SECONDS,
+    DB_POOL_OVERFLOW,
+    DB_POOL_REJECTIONS_TOTAL,
+    DB_POOL_WAITERS,
+    DB_QUERIES_TOTAL,
+    DB_QUERY_DURATION_SECONDS,
 )
+from app.db.query_stats import current_query_stats
+from app.db.slow_query import SlowQueryLog
+
+# クエリ開始時刻のスタックを保持する Connection.info のキー
+_QUERY_START_KEY = "query_start_time"
+
+# 貸し出し時刻を保持するコネクションレコードの info のキー
+_CHECKOUT_AT_KEY = "pool_checked_out_at"
+
+# 平均貸し出し時間（指数移動平均）の平滑化係数
+_HOLD_TIME_SMOOTHING = 0.2
+
+# リードレプリカに接続するセッションであることを示す Session.info のキー
+READ_REPLICA_INFO_KEY = "read_replica"
+
+# メトリクスの operation ラベルとして扱う SQL の先頭キーワード
+_OPERATIONS = frozenset({"SELECT", "INSERT", "UPDATE", "DELETE", "WITH"})
+
+
+class PoolBackpressureError(exc.TimeoutError):
+    """
+    コネクション取得の待ちが DB_POOL_WAIT_BUDGET_MS を超えるため打ち切った場合の例外。
+
+    sqlalchemy.exc.TimeoutError のサブクラスのため、
+    既存のタイムアウト処理でも捕捉できる。
+    API では 503 Service Unavailable と Retry-After ヘッダに変換する。
+
+    属性:
+        retry_after: 再試行までの推奨待ち時間（秒）
+    """
+
+    def __init__(self, message: str, *, retry_after: int) -> None:
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """
+    コネクション取得を計測し、バックプレッシャーを適用するプール。
+
+    - metrics_enabled: 取得の待ち時間・オーバーフロー数・待機数を記録する
+      （プールのイベントは取得完了後にしか発火しないため、取得処理自体を計測する）
+    - wait_budget: 空きがない状態での取得待ちの上限（秒）。待機数と平均貸し出し時間から
+      見込んだ待ち時間が上限を超える場合は待たずに、実際の待ちが上限に達した場合は
+      その時点で PoolBackpressureError を送出する
+
+    追加の引数は create_async_engine のキーワード引数として渡す
+    （SQLAlchemy はプールクラスの引数名に一致するものをプールに渡す）。
+    """
+
+    def __init__(
+        self,
+        creator: Any,
+        metrics_enabled: bool = True,
+        wait_budget: float | None = None,
+        **kw: Any,
+    ) -> None:
+        if wait_budget is not None:
+            kw["timeout"] = min(kw.get("timeout", 30.0), wait_budget)
+        super().__init__(creator, **kw)
+        self._metrics_enabled = metrics_enabled
+        self._wait_budget = wait_budget
+        # 空きを待っている取得要求の数
+        self._waiters = 0
+        # コネクションの平均貸し出し時間（秒、指数移動平均。未計測の間は None）
+        self._avg_hold: float | None = None
+
+    def recreate(self) -> "InstrumentedAsyncQueuePool":
+        # 基底クラスの recreate は独自の引数を引き継がないため作り直す
+        self.logger.info("Pool recreating")
+        return self.__class__(
+            self._creator,
+            metrics_enabled=self._metrics_enabled,
+            wait_budget=self._wait_budget,
+            pool_size=self._pool.maxsize,
+            max_overflow=self._max_overflow,
+            pre_ping=self._pre_ping,
+            use_lifo=self._pool.use_lifo,
+            timeout=self._timeout,
+            recycle=self._recycle,
+            echo=self.echo,
+            logging_name=self._orig_logging_name,
+            reset_on_return=self._reset_on_return,
+            _dispatch=self.dispatch,
+            dialect=self._dialect,
+        )
+
+    def _saturated(self) -> bool:
+        """空きコネクションがなく、オーバーフローも上限に達しているか"""
+        return (
+            self._max_overflow > -1
+            and self.checkedin() == 0
+            and self._overflow >= self._max_overflow
+        )
+
+    def _estimated_wait(self) -> float | None:
+        """待機中の要求の後ろに並んだ場合の待ち時間の見込み（秒、未計測なら None）"""
+        if self._avg_hold is None:
+            return None
+        capacity = self.size() + self._max_overflow
+        return (self._waiters + 1) * self._avg_hold / max(capacity, 1)
+
+    def _reject(self, reason: str, expected_wait: float | None) -> NoReturn:
+        """バックプレッシャーで取得を打ち切る"""
+        if self._metrics_enabled:
+            DB_POOL_REJECTIONS_TOTAL.labels(reason).inc()
+        raise PoolBackpressureError(
+            f"コネクションプールが上限に達しています（待機 {self._waiters} 件、"
+            f"上限 {self._wait_budget:.3f} 秒）",
+            retry_after=max(math.ceil(expected_wait or 0.0), 1),
+        )
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        start = time.perf_counter()
+        saturated = self._saturated()
+        if saturated and self._wait_budget is not None:
+            expected_wait = self._estimated_wait()
+            if expected_wait is not None and expected_wait > self._wait_budget:
+                self._reject("predicted", expected_wait)
+        if saturated:
+            self._waiters += 1
+            if self._metrics_enabled:
+                DB_POOL_WAITERS.inc()
+        try:
+            record = super()._do_get()
+        except exc.TimeoutError:
+            if self._wait_budget is None:
+                raise
+            self._reject("timeout", self._avg_hold)
+        finally:
+            if saturated:
+                self._waiters -= 1
+                if self._metrics_enabled:
+                    DB_POOL_WAITERS.dec()
+            if self._metrics_enabled:
+                DB_POOL_CHECKOUT_WAIT_SECONDS.observe(time.perf_counter() - start)
+                DB_POOL_OVERFLOW.set(max(self.overflow(), 0))
+        record.info[_CHECKOUT_AT_KEY] = time.perf_counter()
+        return record
+
+    def _do_return_conn(self, record: ConnectionPoolEntry) -> None:
+        checked_out_at = record.info.pop(_CHECKOUT_AT_KEY, None)
+        if checked_out_at is not None:
+            held = time.perf_counter() - checked_out_at
+            self._avg_hold = (
+                held
+                if self._avg_hold is None
+                else self._avg_hold + _HOLD_TIME_SMOOTHING * (held - self._avg_hold)
+            )
+        try:
+            super()._do_return_conn(record)
+        finally:
+            if self._metrics_enabled:
+                DB_POOL_OVERFLOW.set(max(self.overflow(), 0))
+
+    def stats(self) -> dict[str, Any]:
+        """
+        プールの現在の状態を返す（ヘルスチェック用）。
+
+        Returns:
+            size, max_overflow, checked_in, checked_out, overflow, waiters,
+            avg_hold_ms, wait_budget_ms を含む辞書
+        """
+        return {
+            "size": self.size(),
+            "max_overflow": self._max_overflow,
+            "checked_in": self.checkedin(),
+            "checked_out": self.checkedout(),
+            "overflow": max(self.overflow(), 0),
+            "waiters": self._waiters,
+            "avg_hold_ms": (
+                round(self._avg_hold * 1000, 1) if self._avg_hold is not None else None
+            ),
+            "wait_budget_ms": (
+                self._wait_budget * 1000 if self._wait_budget is not None else None
+            ),
+        }
+
+
+def _operation(statement: str) -> str:
+    """SQL 文の先頭キーワードを operation ラベルに変換する（内部ヘルパー）"""
+    keyword = statement.lstrip().split(None, 1)[0].upper() if statement else ""
+    return keyword if keyword in _OPERATIONS else "OTHER"
+
 
-# --- 非同期セッションファクトリの作成 ---
-# expire_on_commit=False: コミット後にオブジェクトを期限切れにしない
-# （非同期コンテキストでの lazy loading エラーを防止するため重要）
-async_session_factory = async_sessionmaker(
-    bind=async_engine,
-    class_=AsyncSession,
-    expire_on_commit=False,
-    autocommit=False,
-    autoflush=False,
+def instrument_engine(
+    engine: Engine,
+    *,
+    metrics: bool = True,
+    pool_metrics: bool = True,
+    slow_query_log: SlowQueryLog | None = None,
+) -> None:
+    """
+    エンジンにクエリ計測用のイベントフックを登録する。
+
+    実行時間はリクエスト単位の計測（処理中のリクエストがある場合）に常に記録し、
+    metrics=True の場合は Prometheus メトリクスにも記録する。
+
+    Args:
+        engine: 対象エンジン（AsyncEngine の場合は sync_engine を渡す）
+        metrics: クエリ・コネクションプールのメトリクスを記録するか
+        pool_metrics: metrics=True の場合に貸し出し中のコネクション数も記録するか
+        slow_query_log: 指定時はしきい値を超えた SQL を記録する
+    """
+
+    def _finish(conn: Connection, statement: str) -> float:
+        """開始時刻を取り出して実行時間を記録し、経過秒数を返す"""
+        elapsed: float = time.perf_counter() - conn.info[_QUERY_START_KEY].pop()
+        stats = current_query_stats()
+        if stats is not None:
+            stats.record(statement, elapsed)
+        if metrics:
+            operation = _operation(statement)
+            DB_QUERIES_TOTAL.labels(operation).inc()
+            DB_QUERY_DURATION_SECONDS.labels(operation).observe(elapsed)
+        return elapsed
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before_cursor_execute(
+        conn: Connection, cursor: Any, statement: str, *args: Any
+    ) -> None:
+        conn.info.setdefault(_QUERY_START_KEY, []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after_cursor_execute(
+        conn: Connection,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: ExecutionContext | None,
+        executemany: bool,
+    ) -> None:
+        elapsed = _finish(conn, statement)
+        if slow_query_log is not None:
+            slow_query_log.observe(
+                conn,
+                statement,
+                parameters,
+                elapsed=elapsed,
+                executemany=executemany,
+                stream_results=bool(
+                    context is not None
+                    and context.execution_options.get("stream_results")
+                ),
+            )
+
+    @event.listens_for(engine, "handle_error")
+    def _handle_error(context: ExceptionContext) -> None:
+        # 失敗したクエリも実行数・時間に含める（開始時刻のスタックを残さない）
+        conn = context.connection
+        if conn is None or not conn.info.get(_QUERY_START_KEY):
+            return
+        _finish(conn, context.statement or "")
+
+    if not (metrics and pool_metrics):
+        return
+
+    @event.listens_for(engine, "checkout")
+    def _checkout(*args: Any) -> None:
+        DB_POOL_CHECKED_OUT.inc()
+
+    @event.listens_for(engine, "checkin")
+    def _checkin(*args: Any) -> None:
+        DB_POOL_CHECKED_OUT.dec()
+
+
+# --- スロークエリログ（SLOW_QUERY_THRESHOLD_MS 未設定の場合は無効） ---
+slow_query_log = (
+    SlowQueryLog(
+        threshold_ms=settings.SLOW_QUERY_THRESHOLD_MS,
+        explain_sample_rate=settings.SLOW_QUERY_EXPLAIN_SAMPLE_RATE,
+        explain_analyze=settings.SLOW_QUERY_EXPLAIN_ANALYZE,
+        buffer_size=settings.SLOW_QUERY_PLAN_BUFFER_SIZE,
+    )
+    if settings.SLOW_QUERY_THRESHOLD_MS is not None
+    else None
 )
+
+
+def build_engine(url: str, *, pool_metrics: bool = True) -> AsyncEngine:
+    """
+    DB_POOL_* 設定のコネクションプールを持つ非同期エンジンを作成する。
+
+    METRICS_ENABLED / QUERY_STATS_ENABLED / SLOW_QUERY_THRESHOLD_MS に応じて
+    クエリ計測用のイベントフックも登録する。
+
+    Args:
+        url: 接続URL（asyncpg ドライバ）
+        pool_metrics: コネクションプールのメトリクス（db_pool_*）を記録するか
+            （ゲージを上書きするため、メトリクスに記録するプールは1つにする）
+
+    Returns:
+        作成したエンジン
+    """
+    # プールの大きさ・待ち時間・再接続・死活監視は DB_POOL_* 設定で調整する
+    # echo: DEBUG時のみSQLログを出力
+    engine = create_async_engine(
+        url,
+        echo=settings.DEBUG,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT_SECONDS,
+        pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+        poolclass=InstrumentedAsyncQueuePool,
+        metrics_enabled=settings.METRICS_ENABLED and pool_metrics,
+        wait_budget=(
+            settings.DB_POOL_WAIT_BUDGET_MS / 1000
+            if settings.DB_POOL_WAIT_BUDGET_MS is not None
+            else None
+        ),
+    )
+    if (
+        settings.METRICS_ENABLED
+        or settings.QUERY_STATS_ENABLED
+        or slow_query_log is not None
+    ):
+        instrument_engine(
+            engine.sync_engine,
+            metrics=settings.METRICS_ENABLED,
+            pool_metrics=pool_metrics,
+            slow_query_log=slow_query_log,
+        )
+    return engine
+
+
+def build_session_factory(
+    engine: AsyncEngine, *, read_replica: bool = False
+) -> async_sessionmaker[AsyncSession]:
+    """
+    アプリ共通の設定でセッションファクトリを作成する。
+
+    expire_on_commit=False: コミット後にオブジェクトを期限切れにしない
+    （非同期コンテキストでの lazy loading エラーを防止するため重要）
+
+    Args:
+        engine: セッションの接続先エンジン
+        read_replica: リードレプリカのセッションか
+            （Session.info[READ_REPLICA_INFO_KEY] に設定し、
+            複製遅延のある読み取り結果をキャッシュに登録しないために使う）
+
+    Returns:
+        セッションファクトリ
+    """
+    return async_sessionmaker(
+        bind=engine,
+        class_=AsyncSession,
+        expire_on_commit=False,
+        autocommit=False,
+        autoflush=False,
+        info={READ_REPLICA_INFO_KEY: read_replica},
+    )
+
+
+# --- 非同期エンジン（プライマリ）の作成 ---
+async_engine = build_engine(settings.DATABASE_URL)
+
+
+def pool_stats() -> dict[str, Any]:
+    """アプリのエンジンのコネクションプールの状態を返す（ワーカープロセス単位）"""
+    return cast(InstrumentedAsyncQueuePool, async_engine.pool).stats()
+
+
+# --- 非同期セッションファクトリ（プライマリ）の作成 ---
+async_session_factory = build_session_factory(async_engine)
@@ -0,0 +1,205 @@
+"""
+スロークエリログモジュール。
+
+実行時間がしきい値を超えた SQL を、正規化した SQL・パラメータの型・
+実行時間・ルートとともにログに出力する。
+サンプリングされた読み取りクエリは同じコネクション上で
+EXPLAIN (FORMAT JSON) を再実行し、直近の実行計画をリングバッファに保持する。
+"""
+
+import json
+import logging
+import random
+import re
+from collections import deque
+from collections.abc import Mapping, Sequence
+from datetime import UTC, datetime
+from typing import Any
+
+from sqlalchemy.engine import Connection
+
+from app.db.query_stats import current_query_stats, normalize_sql
+
+logger = logging.getLogger("app.slow_query")
+
+# EXPLAIN の失敗で呼び出し元のトランザクションを中断させないためのセーブポイント名
+_SAVEPOINT = "slow_query_explain"
+
+# EXPLAIN を実行してよい（読み取り専用の）SQL の先頭キーワード
+_READ_ONLY_PREFIXES = ("SELECT", "WITH")
+# 読み取りに見えても書き込み・行ロックを含む SQL
+# （WITH ... INSERT、SELECT ... INTO、SELECT ... FOR UPDATE / FOR SHARE 等）
+_WRITE_KEYWORDS = re.compile(r"\b(?:INSERT|UPDATE|DELETE|MERGE|INTO|SHARE)\b")
+
+
+def param_shape(parameters: Any) -> list[str] | dict[str, str]:
+    """
+    パラメータを値を含まない型の一覧に変換する（ログに値を残さない）。
+
+    Args:
+        parameters: DBAPI に渡されたパラメータ（シーケンスまたはマッピング）
+
+    Returns:
+        各パラメータの型名（リストは要素数付き、例: list[3]）
+    """
+
+    def describe(value: Any) -> str:
+        if isinstance(value, list | tuple):
+            return f"list[{len(value)}]"
+        return type(value).__name__
+
+    if isinstance(parameters, Mapping):
+        return {str(key): describe(value) for key, value in parameters.items()}
+    if isinstance(parameters, Sequence) and not isinstance(parameters, str):
+        return [describe(value) for value in parameters]
+    return []
+
+
+def is_read_only(statement: str) -> bool:
+    """
+    EXPLAIN を再実行してよい読み取り専用の SQL かを判定する。
+
+    Args:
+        statement: 実行された SQL 文
+
+    Returns:
+        SELECT / WITH で始まり、書き込みや行ロックを含まない場合は True
+    """
+    upper = statement.lstrip().upper()
+    return upper.startswith(_READ_ONLY_PREFIXES) and not _WRITE_KEYWORDS.search(upper)
+
+
+class SlowQueryLog:
+    """
+    スロークエリの記録と実行計画のリングバッファ（ワーカープロセス単位）。
+
+    エンジンの after_cursor_execute フックから呼び出される。
+    EXPLAIN は SQLAlchemy のイベントを経由しない DBAPI カーソルで実行するため、
+    計測やスロークエリ判定の対象にはならない。
+    """
+
+    def __init__(
+        self,
+        *,
+        threshold_ms: float,
+        explain_sample_rate: float = 0.0,
+        explain_analyze: bool = False,
+        buffer_size: int = 50,
+    ) -> None:
+        """
+        スロークエリログを初期化する。
+
+        Args:
+            threshold_ms: スロークエリとみなす実行時間（ミリ秒）
+            explain_sample_rate: EXPLAIN を再実行する割合（0.0〜1.0）
+            explain_analyze: EXPLAIN ANALYZE で実測値を取得するか（クエリを再実行する）
+            buffer_size: 保持する実行計画の最大件数
+        """
+        self.threshold_ms = threshold_ms
+        self.explain_sample_rate = explain_sample_rate
+        self.explain_analyze = explain_analyze
+        self._plans: deque[dict[str, Any]] = deque(maxlen=buffer_size)
+
+    def observe(
+        self,
+        conn: Connection,
+        statement: str,
+        parameters: Any,
+        *,
+        elapsed: float,
+        executemany: bool,
+        stream_results: bool,
+    ) -> None:
+        """
+        実行済みの SQL を判定し、しきい値を超えていればログと実行計画を記録する。
+
+        Args:
+            conn: SQL を実行したコネクション
+            statement: 実行された SQL 文
+            parameters: DBAPI に渡されたパラメータ
+            elapsed: 実行時間（秒）
+            executemany: executemany で実行されたか（EXPLAIN の対象外）
+            stream_results: サーバーサイドカーソルか（EXPLAIN の対象外）
+        """
+        duration_ms = elapsed * 1000
+        if duration_ms < self.threshold_ms:
+            return
+
+        stats = current_query_stats()
+        route = (stats.route if stats is not None else None) or "-"
+        sql = normalize_sql(statement)
+        params = param_shape(parameters)
+        logger.warning(
+            "slow query duration_ms=%.1f route=%s sql=%s params=%s",
+            duration_ms,
+            route,
+            sql,
+            params,
+            extra={
+                "duration_ms": round(duration_ms, 1),
+                "route": route,
+                "sql": sql,
+                "params": params,
+            },
+        )
+
+        if (
+            self.explain_sample_rate <= 0
+            or executemany
+            or stream_results
+            or not is_read_only(statement)
+            or random.random() >= self.explain_sample_rate
+        ):
+            return
+        plan = self._explain(conn, statement, parameters)
+        if plan is None:
+            return
+        self._plans.append(
+            {
+                "captured_at": datetime.now(UTC),
+                "route": route,
+                "duration_ms": round(duration_ms, 1),
+                "sql": sql,
+                "params": params,
+                "analyzed": self.explain_analyze,
+                "plan": plan,
+            }
+        )
+
+    def _explain(self, conn: Connection, statement: str, parameters: Any) -> Any | None:
+        """
+        同じコネクション・パラメータで EXPLAIN を実行する（内部ヘルパー）。
+
+        セーブポイント内で実行し、失敗しても呼び出し元のトランザクションは継続する。
+
+        Returns:
+            実行計画（JSON をデコードしたもの）、失敗した場合は None
+        """
+        options = "FORMAT JSON"
+        if self.explain_analyze:
+            options = f"ANALYZE, BUFFERS, {options}"
+        cursor = conn.connection.cursor()
+        try:
+            cursor.execute(f"SAVEPOINT {_SAVEPOINT}")
+            try:
+                cursor.execute(f"EXPLAIN ({options}) {statement}", parameters)
+                row = cursor.fetchone()
+            except Exception:
+                cursor.execute(f"ROLLBACK TO SAVEPOINT {_SAVEPOINT}")
+                raise
+            cursor.execute(f"RELEASE SAVEPOINT {_SAVEPOINT}")
+        except Exception:
+            logger.warning("EXPLAIN の取得に失敗しました", exc_info=True)
+            return None
+        finally:
+            cursor.close()
+        plan = row[0] if row else None
+        return json.loads(plan) if isinstance(plan, str) else plan
+
+    def plans(self) -> list[dict[str, Any]]:
+        """保持している実行計画を新しい順に返す"""
+        return list(reversed(self._plans))
+
+    def clear(self) -> None:
+        """保持している実行計画を破棄する"""
+        self._plans.clear()
@@ -0,0 +1,202 @@
+"""
+合成データセット生成 CLI エントリーポイント。
+
+本番規模のクエリ性能をローカルで再現するため、タスク件数が Zipf 分布に従う
+多数のプロジェクトとタスクを生成して COPY でロードし、ANALYZE を実行する。
+同じ引数・シードであれば毎回同じデータを生成する。
+
+使用例:
+    python -m app.generate_dataset --projects 5000 --tasks 10000000 --defer-indexes
+    python -m app.generate_dataset --seed 7 --deleted-ratio 0.2 --replace
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from datetime import UTC, datetime
+from typing import Any
+
+from sqlalchemy import func, select
+
+from app.db.session import async_engine, async_session_factory
+from app.models.project import Project
+from app.models.task import TaskStatus
+from app.services.synthetic import (
+    DEFAULT_CREATED_UNTIL,
+    DEFAULT_STATUS_WEIGHTS,
+    delete_projects_by_prefix,
+    generate_dataset,
+)
+
+
+def _status_weights(value: str) -> dict[TaskStatus, float]:
+    """todo=0.5,in_progress=0.2,done=0.3 形式のステータス比率を解析する"""
+    weights: dict[TaskStatus, float] = {}
+    try:
+        for item in value.split(","):
+            name, _, weight = item.partition("=")
+            weights[TaskStatus(name.strip())] = float(weight)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(f"ステータス比率が不正です: {value}") from e
+    if any(weight < 0 for weight in weights.values()) or not sum(weights.values()):
+        raise argparse.ArgumentTypeError(f"ステータス比率が不正です: {value}")
+    return weights
+
+
+def _ratio(value: str) -> float:
+    """0.0〜1.0 の割合を解析する"""
+    ratio = float(value)
+    if not 0.0 <= ratio <= 1.0:
+        raise argparse.ArgumentTypeError(f"0.0〜1.0 で指定してください: {value}")
+    return ratio
+
+
+def _naive_utc(value: str) -> datetime:
+    """ISO 8601 の日時を解析し、タイムゾーンなしの UTC に変換する"""
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(UTC).replace(tzinfo=None)
+    return parsed
+
+
+def _print_progress(stats: dict[str, Any]) -> None:
+    """進捗を標準エラー出力に表示する"""
+    print(f"\rタスク: {stats['tasks']:,} 件", end="", file=sys.stderr, flush=True)
+
+
+def _parse_args(argv: list[str] | None) -> argparse.Namespace:
+    """コマンドライン引数を解析する"""
+    parser = argparse.ArgumentParser(
+        prog="python -m app.generate_dataset",
+        description="本番規模の合成データセットを生成して COPY でロードする",
+    )
+    parser.add_argument("--projects", type=int, default=1000, help="プロジェクト数")
+    parser.add_argument("--tasks", type=int, default=1_000_000, help="タスクの総件数")
+    parser.add_argument("--seed", type=int, default=42, help="乱数シード")
+    parser.add_argument(
+        "--name-prefix",
+        default="synthetic-",
+        help="プロジェクト名の接頭辞（名前は接頭辞 + 連番）",
+    )
+    parser.add_argument(
+        "--zipf-exponent",
+        type=float,
+        default=1.1,
+        help="プロジェクトごとのタスク件数の Zipf 分布の指数（0 で均等）",
+    )
+    parser.add_argument(
+        "--status-weights",
+        type=_status_weights,
+        default=DEFAULT_STATUS_WEIGHTS,
+        help="ステータス比率（例: todo=0.5,in_progress=0.2,done=0.3）",
+    )
+    parser.add_argument(
+        "--deleted-ratio", type=_ratio, default=0.05, help="論理削除済みの割合"
+    )
+    parser.add_argument(
+        "--due-ratio", type=_ratio, default=0.7, help="期限日を設定する割合"
+    )
+    parser.add_argument(
+        "--due-spread-days",
+        type=int,
+        default=60,
+        help="期限日を作成日時から何日後までに分散させるか",
+    )
+    parser.add_argument(
+        "--created-until",
+        type=_naive_utc,
+        default=DEFAULT_CREATED_UNTIL,
+        help="作成日時の終端（UTC、ISO 8601）",
+    )
+    parser.add_argument(
+        "--created-span-days",
+        type=int,
+        default=365,
+        help="作成日時を分散させる日数",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=50_000,
+        help="COPY とコミットの単位となるタスク数",
+    )
+    parser.add_argument(
+        "--defer-indexes",
+        action="store_true",
+        help="tasks のインデックスを削除してロードし、最後に一括作成する"
+        "（他の利用者がいない DB でのみ使用）",
+    )
+    parser.add_argument(
+        "--replace",
+        action="store_true",
+        help="同じ接頭辞の既存プロジェクトを削除してから生成する",
+    )
+    args = parser.parse_args(argv)
+    if args.projects < 1 or args.tasks < 0 or args.chunk_size < 1:
+        parser.error("--projects / --chunk-size は 1 以上、--tasks は 0 以上")
+    if not args.name_prefix:
+        parser.error("--name-prefix は空にできません")
+    return args
+
+
+async def _run(args: argparse.Namespace) -> int:
+    """生成を実行し、終了コードを返す"""
+    start = time.perf_counter()
+    try:
+        async with async_session_factory() as session:
+            if args.replace:
+                deleted = await delete_projects_by_prefix(session, args.name_prefix)
+                print(f"既存プロジェクトを削除: {deleted:,} 件", file=sys.stderr)
+            else:
+                existing = await session.scalar(
+                    select(func.count())
+                    .select_from(Project)
+                    .where(Project.name.startswith(args.name_prefix, autoescape=True))
+                )
+                if existing:
+                    print(
+                        f"接頭辞 {args.name_prefix!r} のプロジェクトが既に "
+                        f"{existing:,} 件あります（--replace で置き換え）",
+                        file=sys.stderr,
+                    )
+                    return 1
+
+            result = await generate_dataset(
+                session,
+                projects=args.projects,
+                tasks=args.tasks,
+                seed=args.seed,
+                name_prefix=args.name_prefix,
+                zipf_exponent=args.zipf_exponent,
+                status_weights=args.status_weights,
+                deleted_ratio=args.deleted_ratio,
+                due_ratio=args.due_ratio,
+                due_spread_days=args.due_spread_days,
+                created_until=args.created_until,
+                created_span_days=args.created_span_days,
+                chunk_size=args.chunk_size,
+                defer_indexes=args.defer_indexes,
+                on_progress=_print_progress,
+            )
+    finally:
+        await async_engine.dispose()
+
+    print(file=sys.stderr)
+    print(
+        f"完了: プロジェクト {result['projects']:,} 件 / "
+        f"タスク {result['tasks']:,} 件（未削除 {result['live_tasks']:,} 件、"
+        f"最大 {result['largest_project']:,} 件/プロジェクト）"
+        f" {time.perf_counter() - start:.1f} 秒",
+        file=sys.stderr,
+    )
+    return 0
+
+
+def main(argv: list[str] | None = None) -> None:
+    """CLI エントリーポイント"""
+    sys.exit(asyncio.run(_run(_parse_args(argv))))
+
+
+if __name__ == "__main__":
+    main()
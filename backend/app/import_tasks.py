@@ -0,0 +1,118 @@
+"""
+タスク一括インポート CLI エントリーポイント。
+
+旧システムからの移行など、大量のタスクを NDJSON / CSV ファイルから
+COPY で高速ロードする。API の /tasks/import と同じパイプラインを使用する。
+
+使用例:
+    python -m app.import_tasks --project-id <UUID> tasks.csv
+    cat tasks.ndjson | python -m app.import_tasks --project-id <UUID> --format ndjson -
+"""
+
+import argparse
+import asyncio
+import sys
+import uuid
+from collections.abc import AsyncIterator
+from pathlib import Path
+from typing import Any, BinaryIO
+
+from app.core.config import settings
+from app.db.session import async_engine, async_session_factory
+from app.repositories.project import ProjectRepository
+from app.services.importer import ImportFormat, import_tasks
+
+# ファイル読み込みの単位（バイト）
+_READ_SIZE = 1024 * 1024
+
+
+async def _read_chunks(stream: BinaryIO) -> AsyncIterator[bytes]:
+    """ファイルをスレッドで読み込み、イベントループをブロックせずにチャンクを返す"""
+    while chunk := await asyncio.to_thread(stream.read, _READ_SIZE):
+        yield chunk
+
+
+def _print_progress(stats: dict[str, Any]) -> None:
+    """進捗を標準エラー出力に表示する"""
+    print(
+        f"\r取り込み: {stats['imported']:,} 件 / 除外: {stats['rejected']:,} 件",
+        end="",
+        file=sys.stderr,
+        flush=True,
+    )
+
+
+def _parse_args(argv: list[str] | None) -> argparse.Namespace:
+    """コマンドライン引数を解析する"""
+    parser = argparse.ArgumentParser(
+        prog="python -m app.import_tasks",
+        description="NDJSON / CSV ファイルからタスクを一括インポートする",
+    )
+    parser.add_argument("file", help="入力ファイル（- の場合は標準入力）")
+    parser.add_argument("--project-id", type=uuid.UUID, required=True)
+    parser.add_argument(
+        "--format",
+        choices=["ndjson", "csv"],
+        default=None,
+        help="入力形式（省略時は拡張子から判定）",
+    )
+    parser.add_argument("--chunk-size", type=int, default=settings.IMPORT_CHUNK_SIZE)
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=settings.IMPORT_VALIDATION_WORKERS,
+        help="チャンク検証の並列プロセス数",
+    )
+    return parser.parse_args(argv)
+
+
+async def _run(args: argparse.Namespace) -> int:
+    """インポートを実行し、終了コードを返す"""
+    import_format: ImportFormat = args.format or (
+        "csv" if args.file.endswith(".csv") else "ndjson"
+    )
+    stream: BinaryIO = (
+        sys.stdin.buffer if args.file == "-" else Path(args.file).open("rb")  # noqa: SIM115
+    )
+    try:
+        async with async_session_factory() as session:
+            project = await ProjectRepository(session).get_by_id(args.project_id)
+            if project is None:
+                print(
+                    f"プロジェクトが見つかりません: {args.project_id}", file=sys.stderr
+                )
+                return 1
+
+            result = await import_tasks(
+                session,
+                args.project_id,
+                _read_chunks(stream),
+                import_format,
+                chunk_size=args.chunk_size,
+                workers=args.workers,
+                max_reported_errors=settings.IMPORT_MAX_REPORTED_ERRORS,
+                on_progress=_print_progress,
+            )
+    finally:
+        stream.close()
+        await async_engine.dispose()
+
+    print(file=sys.stderr)
+    for error in result["errors"]:
+        print(f"  {error['line']} 行目: {error['error']}", file=sys.stderr)
+    if result["errors_truncated"]:
+        print("  ...（以降のエラーは省略）", file=sys.stderr)
+    print(
+        f"完了: 取り込み {result['imported']:,} 件 / 除外 {result['rejected']:,} 件",
+        file=sys.stderr,
+    )
+    return 0
+
+
+def main(argv: list[str] | None = None) -> None:
+    """CLI エントリーポイント"""
+    sys.exit(asyncio.run(_run(_parse_args(argv))))
+
+
+if __name__ == "__main__":
+    main()
@@ -2,11 +2,14 @@
 FastAPI アプリケーションエントリーポイント。
 
 アプリケーションの初期化、ライフスパンイベント、
-ミドルウェア設定、ルーター登録、構造化ロギングを行う。
+ミドルウェア設定、ルーター登録を行う。
+構造化ロギングの設定は app.core.log を参照。
 """
 
+import asyncio
+import contextlib
 import logging
-import sys
+import os
 from contextlib import asynccontextmanager
 from collections.abc import AsyncIterator
 
@@ -14,53 +17,20 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from sqlalchemy import text
 
+from app.api.exception_handlers import pool_backpressure_handler
+from app.api.middleware import (
+    AdmissionControlMiddleware,
+    MetricsMiddleware,
+    QueryStatsMiddleware,
+    ReadYourWritesMiddleware,
+    RequestContextMiddleware,
+)
 from app.api.router import api_router
 from app.core.config import settings
-
-
-def setup_logging() -> None:
-    """
-    構造化ロギングを設定する。
-
-    環境モードに応じてログ形式を切り替え:
-    - dev: 人間が読みやすいテキスト形式
-    - prod: JSON 形式（ログ集約ツール向け）
-    """
-    # ルートロガーの設定
-    root_logger = logging.getLogger()
-    root_logger.setLevel(settings.log_level_int)
-
-    # 既存のハンドラをクリア（重複防止）
-    root_logger.handlers.clear()
-
-    # コンソールハンドラの作成
-    handler = logging.StreamHandler(sys.stdout)
-    handler.setLevel(settings.log_level_int)
-
-    if settings.LOG_FORMAT == "json":
-        # --- 本番環境向け: JSON 形式 ---
-        # ログ集約ツール（CloudWatch, Datadog 等）でパースしやすい形式
-        formatter = logging.Formatter(
-            '{"time":"%(asctime)s","level":"%(levelname)s",'
-            '"logger":"%(name)s","message":"%(message)s"}',
-            datefmt="%Y-%m-%dT%H:%M:%S",
-        )
-    else:
-        # --- 開発環境向け: テキスト形式 ---
-        formatter = logging.Formatter(
-            "%(asctime)s | %(levelname)-8s | %(name)s | %(message)s",
-            datefmt="%Y-%m-%d %H:%M:%S",
-        )
-
-    handler.setFormatter(formatter)
-    root_logger.addHandler(handler)
-
-    # SQLAlchemy のログレベルを調整（DEBUGモード以外は抑制）
-    logging.getLogger("sqlalchemy.engine").setLevel(
-        logging.DEBUG if settings.DEBUG else logging.WARNING
-    )
-    # uvicorn のアクセスログ
-    logging.getLogger("uvicorn.access").setLevel(logging.INFO)
+from app.core.log import setup_logging, stop_logging
+from app.core.metrics import mark_process_dead
+from app.db.replicas import replica_set
+from app.db.session import PoolBackpressureError
 
 
 # ロガーインスタンス
@@ -72,7 +42,7 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     """
     アプリケーションのライフスパンイベント。
 
-    起動時: ロギング初期化、DB接続テスト
+    起動時: ロギング初期化、DB接続テスト、リードレプリカのヘルスチェック開始
     シャットダウン時: リソースクリーンアップ
     """
     # --- 起動時の処理 ---
@@ -95,12 +65,33 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     except Exception as e:
         logger.error("❌ データベース接続失敗: %s", e)
 
+    # リードレプリカのヘルスチェック（初回は起動時に完了させる）
+    health_checks: asyncio.Task[None] | None = None
+    if replica_set:
+        await replica_set.check_all()
+        for replica in replica_set.replicas:
+            logger.info(
+                "   リードレプリカ: %s（%s）",
+                replica.name,
+                "正常" if replica.healthy else f"異常: {replica.last_error}",
+            )
+        health_checks = asyncio.create_task(replica_set.run_health_checks())
+
     yield
 
     # --- シャットダウン時の処理 ---
     logger.info("🛑 アプリケーション終了中...")
+    if health_checks is not None:
+        health_checks.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await health_checks
+    await replica_set.dispose()
     await async_engine.dispose()
     logger.info("✅ データベースエンジン破棄完了")
+    # マルチプロセス時は終了するワーカーのゲージを集計から外す
+    mark_process_dead(os.getpid())
+    # キューに残ったログを出力してから終了する
+    stop_logging()
 
 
 def create_app() -> FastAPI:
@@ -121,6 +112,14 @@ def create_app() -> FastAPI:
         lifespan=lifespan,
     )
 
+    # --- アドミッション制御（CORS の内側: 503 にも CORS ヘッダを付ける） ---
+    if settings.ADMISSION_CONTROL_ENABLED:
+        app.add_middleware(AdmissionControlMiddleware)
+
+    # --- 書き込み直後の読み取りをプライマリに固定（リードレプリカの使用時のみ） ---
+    if settings.DB_REPLICA_URLS and settings.DB_READ_YOUR_WRITES_SECONDS > 0:
+        app.add_middleware(ReadYourWritesMiddleware)
+
     # --- CORS ミドルウェア ---
     app.add_middleware(
         CORSMiddleware,
@@ -130,6 +129,20 @@ def create_app() -> FastAPI:
         allow_headers=["*"],
     )
 
+    # --- クエリ計測ミドルウェア（Server-Timing ヘッダ・リクエストログ） ---
+    if settings.QUERY_STATS_ENABLED:
+        app.add_middleware(QueryStatsMiddleware)
+
+    # --- メトリクスミドルウェア（最外層で CORS を含む処理時間を計測） ---
+    if settings.METRICS_ENABLED:
+        app.add_middleware(MetricsMiddleware)
+
+    # --- リクエストIDの設定（最外層: 全ミドルウェアのログに付与する） ---
+    app.add_middleware(RequestContextMiddleware)
+
+    # --- 例外ハンドラ（コネクションプールのバックプレッシャー → 503） ---
+    app.add_exception_handler(PoolBackpressureError, pool_backpressure_handler)
+
     # --- ルーター登録 ---
     app.include_router(api_router)
 
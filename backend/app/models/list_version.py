@@ -0,0 +1,46 @@
+"""
+ListVersion モデル定義。
+
+テーブル全体を対象とする一覧（プロジェクト一覧など）のバージョンを保持する。
+一覧の条件付き GET の検証子を、全行の集計ではなく主キー検索1回で取得するために使う。
+"""
+
+from datetime import datetime
+
+from sqlalchemy import BigInteger, String, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class ListVersion(Base):
+    """
+    一覧バージョンテーブル。
+
+    属性:
+        name: 一覧名（主キー、通常は対象のテーブル名）
+        modified_at: 一覧の行が最後に作成・更新・削除された日時
+        revision: 書き込みのたびに 1 増える番号
+
+    行が存在しない一覧は書き込みが一度もないものとして扱う。
+    値は BaseRepository の書き込みメソッド（list_version 設定時）が
+    書き込みと同じトランザクションで更新する。
+    """
+
+    __tablename__ = "list_versions"
+
+    # --- カラム定義 ---
+    name: Mapped[str] = mapped_column(String(63), primary_key=True)
+    modified_at: Mapped[datetime] = mapped_column(
+        server_default=func.now(),
+        nullable=False,
+    )
+    revision: Mapped[int] = mapped_column(
+        BigInteger,
+        nullable=False,
+        default=1,
+        server_default="1",
+    )
+
+    def __repr__(self) -> str:
+        return f"<ListVersion(name='{self.name}', revision={self.revision})>"
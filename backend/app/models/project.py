@@ -7,8 +7,8 @@ Project モデル定義。
 
 from typing import TYPE_CHECKING
 
-from sqlalchemy import String, Text
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy import Index, String, Text
+from sqlalchemy.orm import Mapped, mapped_column, query_expression, relationship
 
 from app.db.base import Base
 from app.models.base import TimestampMixin, UUIDPrimaryKeyMixin
@@ -27,9 +27,14 @@ class Project(UUIDPrimaryKeyMixin, TimestampMixin, Base):
         name: プロジェクト名（必須、最大255文字）
         description: プロジェクト説明（任意）
         tasks: このプロジェクトに属するタスク一覧（リレーション）
+        task_count: 未削除タスク数（task_counts プロファイル指定時のみ設定）
     """
 
     __tablename__ = "projects"
+    __table_args__ = (
+        # カーソルページネーション（created_at, id でシーク）用
+        Index("ix_projects_created_at_id", "created_at", "id"),
+    )
 
     # --- カラム定義 ---
     name: Mapped[str] = mapped_column(
@@ -45,12 +50,20 @@ class Project(UUIDPrimaryKeyMixin, TimestampMixin, Base):
 
     # --- リレーション ---
     # Task との1対多関係。cascade でプロジェクト削除時にタスクも削除
+    # lazy="raise": 暗黙の読み込みを禁止し、必要な場合はリポジトリの
+    # ローダープロファイルで明示的に読み込む（大量タスクの全件ロード防止）
+    # passive_deletes=True: 削除時は DB の ON DELETE CASCADE に任せ、
+    # タスクをロードしない
     tasks: Mapped[list["Task"]] = relationship(
         "Task",
         back_populates="project",
         cascade="all, delete-orphan",
-        lazy="selectin",  # N+1問題を防ぐためeager loadingを使用
+        lazy="raise",
+        passive_deletes=True,
     )
 
+    # --- クエリ式（with_expression で読み込み時にのみ値が入る） ---
+    task_count: Mapped[int | None] = query_expression()
+
     def __repr__(self) -> str:
         return f"<Project(id={self.id}, name='{self.name}')>"
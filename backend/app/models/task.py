@@ -9,7 +9,20 @@ import enum
 import uuid
 from datetime import datetime
 
-from sqlalchemy import Boolean, DateTime, Enum, ForeignKey, Integer, String, Text
+from sqlalchemy import (
+    Boolean,
+    Computed,
+    DateTime,
+    Enum,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    false,
+    text,
+)
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
@@ -29,6 +42,14 @@ class TaskStatus(str, enum.Enum):
     DONE = "done"
 
 
+# 部分インデックスの述語。クエリ側は TASK_IS_LIVE で同じ述語を生成する
+LIVE_TASK_PREDICATE = "is_deleted = false"
+
+# 全文検索のテキスト検索設定（生成列と検索クエリで同じ設定を使用する）
+# 言語非依存の simple を使用し、語幹処理・ストップワード除去は行わない
+SEARCH_CONFIG = "simple"
+
+
 class Task(UUIDPrimaryKeyMixin, TimestampMixin, Base):
     """
     タスクテーブル。
@@ -42,9 +63,59 @@ class Task(UUIDPrimaryKeyMixin, TimestampMixin, Base):
         priority: 優先度（数値、デフォルト0）
         due_date: 期限日時（任意）
         is_deleted: 論理削除フラグ（ソフトデリート）
+        search_vector: 全文検索用の tsvector（title / description から自動生成）
     """
 
     __tablename__ = "tasks"
+    # 一覧・件数のホットパスは未削除タスクのみを対象とするため部分インデックスにする
+    # （論理削除済みを含む検索は ix_tasks_project_id を使用）
+    __table_args__ = (
+        # カーソルページネーション用（プロジェクト内を各ソートキーでシーク）
+        Index(
+            "ix_tasks_live_project_id_created_at_id",
+            "project_id",
+            "created_at",
+            "id",
+            postgresql_where=text(LIVE_TASK_PREDICATE),
+        ),
+        Index(
+            "ix_tasks_live_project_id_priority_id",
+            "project_id",
+            "priority",
+            "id",
+            postgresql_where=text(LIVE_TASK_PREDICATE),
+        ),
+        # 一覧のフィルタ・ソート用（ステータス指定 + 優先度順、期限日順、更新日順）
+        Index(
+            "ix_tasks_live_project_id_status_priority_id",
+            "project_id",
+            "status",
+            text("priority DESC"),
+            text("id DESC"),
+            postgresql_where=text(LIVE_TASK_PREDICATE),
+        ),
+        Index(
+            "ix_tasks_live_project_id_due_date_id",
+            "project_id",
+            "due_date",
+            "id",
+            postgresql_where=text(LIVE_TASK_PREDICATE),
+        ),
+        Index(
+            "ix_tasks_live_project_id_updated_at_id",
+            "project_id",
+            "updated_at",
+            "id",
+            postgresql_where=text(LIVE_TASK_PREDICATE),
+        ),
+        # 全文検索用（検索は未削除タスクのみが対象）
+        Index(
+            "ix_tasks_live_search_vector",
+            "search_vector",
+            postgresql_using="gin",
+            postgresql_where=text(LIVE_TASK_PREDICATE),
+        ),
+    )
 
     # --- カラム定義 ---
     project_id: Mapped[uuid.UUID] = mapped_column(
@@ -85,6 +156,19 @@ class Task(UUIDPrimaryKeyMixin, TimestampMixin, Base):
         server_default="false",
     )
 
+    # 全文検索用の生成列（タイトルを説明より高い重みで索引化）
+    # 通常の SELECT では不要なため遅延ロードにする
+    search_vector: Mapped[str] = mapped_column(
+        TSVECTOR,
+        Computed(
+            f"setweight(to_tsvector('{SEARCH_CONFIG}', title), 'A') || "
+            f"setweight(to_tsvector('{SEARCH_CONFIG}', "
+            "coalesce(description, '')), 'B')",
+            persisted=True,
+        ),
+        deferred=True,
+    )
+
     # --- リレーション ---
     project: Mapped["Project"] = relationship(
         "Project",
@@ -93,3 +177,9 @@ class Task(UUIDPrimaryKeyMixin, TimestampMixin, Base):
 
     def __repr__(self) -> str:
         return f"<Task(id={self.id}, title='{self.title}', status={self.status})>"
+
+
+# 未削除タスクの条件（"tasks.is_deleted = false" をリテラルで出力する）。
+# バインドパラメータにすると汎用プランで部分インデックスの述語を証明できないため、
+# is_deleted を条件に含むクエリは必ずこの式を使用する
+TASK_IS_LIVE = Task.is_deleted == false()
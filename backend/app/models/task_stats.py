@@ -0,0 +1,102 @@
+"""
+ProjectTaskStats / ProjectTaskVersion モデル定義。
+
+プロジェクト別・ステータス別の未削除タスク数を保持する集計テーブルと、
+プロジェクト別のタスク一覧のバージョンを保持するテーブル。
+どちらもタスクの書き込みと同じトランザクションで更新し、
+ステータス集計と条件付き GET の検証子の読み取りを O(1) にする。
+"""
+
+import uuid
+from datetime import datetime
+
+from sqlalchemy import BigInteger, Enum, ForeignKey, Integer, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+from app.models.task import TaskStatus
+
+
+class ProjectTaskStats(Base):
+    """
+    プロジェクト別タスク集計テーブル。
+
+    属性:
+        project_id: 対象プロジェクトのUUID（複合主キー、外部キー）
+        status: タスクステータス（複合主キー）
+        task_count: 該当ステータスの未削除タスク数
+
+    行が存在しない組み合わせは 0 件として扱う。
+    値は TaskRepository の書き込みメソッドが差分で更新し、
+    ずれた場合は TaskStatsRepository.repair で再計算する。
+    """
+
+    __tablename__ = "project_task_stats"
+
+    # --- カラム定義 ---
+    project_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("projects.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    # tasks.status と同じ ENUM 型（task_status）を共有する
+    status: Mapped[TaskStatus] = mapped_column(
+        Enum(
+            TaskStatus,
+            name="task_status",
+            native_enum=True,
+            values_callable=lambda x: [e.value for e in x],
+        ),
+        primary_key=True,
+    )
+    task_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+        server_default="0",
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<ProjectTaskStats(project_id={self.project_id}, "
+            f"status={self.status}, task_count={self.task_count})>"
+        )
+
+
+class ProjectTaskVersion(Base):
+    """
+    プロジェクト別タスク一覧のバージョンテーブル。
+
+    属性:
+        project_id: 対象プロジェクトのUUID（主キー、外部キー）
+        tasks_modified_at: タスクが最後に作成・更新・削除された日時
+        revision: タスクの書き込みのたびに 1 増える番号
+
+    論理削除済みを含むいずれかのタスクが変わるたびに更新するため、
+    include_deleted の有無によらず一覧の変化を検出できる。
+    行が存在しないプロジェクトはタスクの書き込みが一度もないものとして扱う。
+    値は TaskStatsRepository.apply_deltas が集計と同じステートメントで更新する。
+    """
+
+    __tablename__ = "project_task_versions"
+
+    # --- カラム定義 ---
+    project_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("projects.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    tasks_modified_at: Mapped[datetime] = mapped_column(
+        server_default=func.now(),
+        nullable=False,
+    )
+    revision: Mapped[int] = mapped_column(
+        BigInteger,
+        nullable=False,
+        default=1,
+        server_default="1",
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<ProjectTaskVersion(project_id={self.project_id}, "
+            f"revision={self.revision})>"
+        )
@@ -0,0 +1,61 @@
+"""
+プロジェクト別タスク集計の再計算 CLI エントリーポイント。
+
+project_task_stats はタスクの書き込み時に差分で更新されるが、
+リポジトリを経由しない直接の SQL 操作などでずれた場合に、
+タスクテーブルの GROUP BY 1回で集計を再計算して修正する。
+
+使用例:
+    python -m app.repair_task_stats
+    python -m app.repair_task_stats --project-id <UUID>
+"""
+
+import argparse
+import asyncio
+import sys
+import uuid
+
+from app.db.session import async_engine, async_session_factory
+from app.repositories.stats import TaskStatsRepository
+
+
+def _parse_args(argv: list[str] | None) -> argparse.Namespace:
+    """コマンドライン引数を解析する"""
+    parser = argparse.ArgumentParser(
+        prog="python -m app.repair_task_stats",
+        description="プロジェクト別タスク集計（project_task_stats）を再計算する",
+    )
+    parser.add_argument(
+        "--project-id",
+        type=uuid.UUID,
+        default=None,
+        help="対象プロジェクト（省略時は全プロジェクト）",
+    )
+    return parser.parse_args(argv)
+
+
+async def _run(args: argparse.Namespace) -> int:
+    """再計算を実行し、終了コードを返す"""
+    try:
+        async with async_session_factory() as session:
+            drift = await TaskStatsRepository(session).repair(args.project_id)
+    finally:
+        await async_engine.dispose()
+
+    for row in drift:
+        print(
+            f"  {row['project_id']} {row['status'].value}: "
+            f"{row['actual']:,} → {row['expected']:,}",
+            file=sys.stderr,
+        )
+    print(f"完了: 修正 {len(drift):,} 行", file=sys.stderr)
+    return 0
+
+
+def main(argv: list[str] | None = None) -> None:
+    """CLI エントリーポイント"""
+    sys.exit(asyncio.run(_run(_parse_args(argv))))
+
+
+if __name__ == "__main__":
+    main()
@@ -5,19 +5,95 @@
 CRUD操作（Create / Read / Update / Delete）を汎用的に実装する。
 """
 
+import base64
+import binascii
+import json
 import math
 import uuid
-from typing import Any, Generic, TypeVar
+from collections.abc import Hashable, Mapping, Sequence
+from datetime import datetime
+from typing import Any, ClassVar, Generic, TypeVar
 
-from sqlalchemy import func, select
+from sqlalchemy import (
+    ColumnElement,
+    Select,
+    func,
+    inspect,
+    literal,
+    select,
+    text,
+    tuple_,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute, make_transient_to_detached
+from sqlalchemy.sql.base import ExecutableOption
 
+from app.core.pagination import CountStrategy
 from app.db.base import Base
+from app.db.session import READ_REPLICA_INFO_KEY
+from app.repositories.cache import EntityCache
+from app.repositories.counting import count_cache
+from app.repositories.version import ListVersionRepository
 
 # SQLAlchemy モデルの型パラメータ（Baseを継承した任意のモデル）
 ModelType = TypeVar("ModelType", bound=Base)
 
 
+class InvalidCursorError(ValueError):
+    """カーソル文字列が不正（改ざん・別のソートキー用など）な場合に送出される例外"""
+
+
+def encode_cursor(key: str, values: list[Any]) -> str:
+    """
+    キーセットの値を不透明なカーソル文字列にエンコードする。
+
+    Args:
+        key: ソートキー名（別キーのカーソル流用を検出するため埋め込む）
+        values: 最終行のキー列の値（例: [created_at, id]）
+
+    Returns:
+        URL セーフな base64 文字列
+    """
+    payload = json.dumps({"k": key, "v": values}, default=str, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(
+    cursor: str, key: str, columns: list[InstrumentedAttribute[Any]]
+) -> list[Any]:
+    """
+    カーソル文字列をデコードし、キー列の Python 型に復元する。
+
+    Args:
+        cursor: encode_cursor で生成されたカーソル
+        key: 期待するソートキー名
+        columns: キー列（値の型変換に使用）
+
+    Returns:
+        キー列の値のリスト
+
+    Raises:
+        InvalidCursorError: カーソルが不正な場合
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded))
+        if payload["k"] != key or len(payload["v"]) != len(columns):
+            raise InvalidCursorError(cursor)
+        values: list[Any] = []
+        for column, raw in zip(columns, payload["v"], strict=True):
+            python_type = column.type.python_type
+            if python_type is datetime:
+                values.append(datetime.fromisoformat(raw))
+            elif python_type is uuid.UUID:
+                values.append(uuid.UUID(raw))
+            else:
+                values.append(python_type(raw))
+        return values
+    except (binascii.Error, json.JSONDecodeError, KeyError, TypeError, ValueError) as e:
+        raise InvalidCursorError(cursor) from e
+
+
 class BaseRepository(Generic[ModelType]):
     """
     ジェネリック CRUD リポジトリ。
@@ -30,8 +106,33 @@ class BaseRepository(Generic[ModelType]):
         class ProjectRepository(BaseRepository[Project]):
             def __init__(self, session: AsyncSession):
                 super().__init__(Project, session)
+
+    ローダープロファイル:
+        リレーションはモデル側で lazy="raise" とし、読み込みが必要な場合は
+        呼び出し側がプロファイル名（load 引数）で明示的に要求する。
+        サブクラスは loader_profiles を上書きしてプロファイルを追加する。
+
+    エンティティキャッシュ:
+        サブクラスで entity_cache を設定すると、get_by_id（load="none"）が
+        キャッシュを経由する。update / delete 時には自動で無効化される。
+
+    一覧バージョン:
+        サブクラスで list_version を設定すると、create / update / delete が
+        同じトランザクションで list_versions を更新し、get_multi_version が
+        全行の集計ではなく主キー検索1回になる。
     """
 
+    # プロファイル名 → SELECT に適用するローダーオプション
+    loader_profiles: ClassVar[dict[str, tuple[ExecutableOption, ...]]] = {
+        "none": (),
+    }
+
+    # get_by_id 用のエンティティキャッシュ（None の場合は無効）
+    entity_cache: ClassVar[EntityCache | None] = None
+
+    # get_multi_version 用の一覧名（None の場合は全行を集計する）
+    list_version: ClassVar[str | None] = None
+
     def __init__(self, model: type[ModelType], session: AsyncSession) -> None:
         """
         リポジトリを初期化する。
@@ -55,29 +156,174 @@ class BaseRepository(Generic[ModelType]):
         """
         instance = self.model(**data)
         self.session.add(instance)
+        await self._touch_list_version()
         await self.session.commit()
         await self.session.refresh(instance)
+        count_cache.incr((self.model.__tablename__,), 1)
         return instance
 
-    async def get_by_id(self, record_id: uuid.UUID) -> ModelType | None:
+    def _apply_loader_profile(self, stmt: Select[Any], load: str) -> Select[Any]:
+        """
+        SELECT 文にローダープロファイルのオプションを適用する（内部ヘルパー）。
+
+        Args:
+            stmt: 対象の SELECT 文
+            load: プロファイル名
+
+        Returns:
+            オプション適用後の SELECT 文
+
+        Raises:
+            ValueError: 未定義のプロファイル名が指定された場合
+        """
+        try:
+            options = self.loader_profiles[load]
+        except KeyError:
+            raise ValueError(f"未定義のローダープロファイルです: {load}") from None
+        return stmt.options(*options) if options else stmt
+
+    async def get_by_id(
+        self, record_id: uuid.UUID, *, load: str = "none"
+    ) -> ModelType | None:
         """
         IDでレコードを取得する。
 
+        エンティティキャッシュが有効かつ load="none" の場合はキャッシュを経由する。
+        リードレプリカのセッションでは、キャッシュから読むが取得結果は登録しない。
+
         Args:
             record_id: 検索対象のUUID
+            load: ローダープロファイル名（デフォルトはリレーションを読み込まない）
 
         Returns:
             見つかった場合はモデルインスタンス、なければ None
         """
+        # リレーションや式を読み込むプロファイルはスナップショットで表現できない
+        cache = self.entity_cache if load == "none" else None
+        generation = 0
+        if cache is not None:
+            snapshot = cache.get(record_id)
+            if snapshot is not None:
+                return await self._from_snapshot(snapshot)
+            generation = cache.begin_load()
+
+        instance = await self._fetch_by_id(record_id, load=load)
+        # リードレプリカの値は複製遅延で古い可能性があるため登録しない
+        if (
+            cache is not None
+            and instance is not None
+            and not self.session.info.get(READ_REPLICA_INFO_KEY)
+        ):
+            cache.put(record_id, self._snapshot(instance), generation)
+        return instance
+
+    async def _fetch_by_id(
+        self, record_id: uuid.UUID, *, load: str = "none"
+    ) -> ModelType | None:
+        """
+        キャッシュを経由せず DB から取得する（内部ヘルパー）。
+
+        更新・削除の対象はキャッシュの古い値ではなく最新の行を使用する。
+        """
         stmt = select(self.model).where(self.model.id == record_id)  # type: ignore[attr-defined]
+        stmt = self._apply_loader_profile(stmt, load)
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
 
+    async def get_updated_at(self, record_id: uuid.UUID) -> datetime | None:
+        """
+        条件付き GET 用に、レコードの更新日時のみを取得する。
+
+        エンティティキャッシュにあればクエリを発行しない。
+
+        Args:
+            record_id: 検索対象のUUID
+
+        Returns:
+            updated_at、見つからなければ None
+        """
+        cache = self.entity_cache
+        if cache is not None:
+            snapshot = cache.get(record_id)
+            if snapshot is not None:
+                cached: datetime = snapshot["updated_at"]
+                return cached
+
+        stmt = select(self.model.updated_at).where(  # type: ignore[attr-defined]
+            self.model.id == record_id  # type: ignore[attr-defined]
+        )
+        result = await self.session.execute(stmt)
+        updated_at: datetime | None = result.scalar_one_or_none()
+        return updated_at
+
+    async def get_multi_version(self) -> tuple[datetime | None, int]:
+        """
+        条件付き GET 用に、一覧全体の最終更新日時と件数（またはリビジョン）を取得する。
+
+        list_version が設定されていれば list_versions の主キー検索1回で取得し、
+        設定されていなければ全行の max(updated_at) と件数を集計する。
+
+        Returns:
+            (最終更新日時, リビジョンまたは件数) のタプル
+            （書き込みが一度もない一覧は (None, 0)）
+        """
+        if self.list_version is None:
+            return await self._aggregate_version([])
+        version = await ListVersionRepository(self.session).get(self.list_version)
+        if version is None:
+            return None, 0
+        return version
+
+    async def _touch_list_version(self) -> None:
+        """list_version が設定されていれば一覧のバージョンを進める（内部ヘルパー）"""
+        if self.list_version is not None:
+            await ListVersionRepository(self.session).touch(self.list_version)
+
+    async def _aggregate_version(
+        self, conditions: Sequence[ColumnElement[bool]]
+    ) -> tuple[datetime | None, int]:
+        """条件に一致する行の max(updated_at) と件数を取得する（内部ヘルパー）"""
+        stmt = (
+            select(func.max(self.model.updated_at), func.count())  # type: ignore[attr-defined]
+            .select_from(self.model)
+            .where(*conditions)
+        )
+        result = await self.session.execute(stmt)
+        last_modified, total = result.one()
+        return last_modified, total
+
+    def _snapshot(self, instance: ModelType) -> dict[str, Any]:
+        """インスタンスの列値を辞書として取り出す（内部ヘルパー、遅延ロード列は除く）"""
+        return {
+            prop.key: getattr(instance, prop.key)
+            for prop in inspect(self.model).column_attrs
+            if not prop.deferred
+        }
+
+    async def _from_snapshot(self, snapshot: Mapping[str, Any]) -> ModelType:
+        """
+        スナップショットからこのセッションに属するインスタンスを復元する（内部ヘルパー）。
+
+        DB にアクセスせず永続化済みインスタンスとしてセッションに取り込むため、
+        以降の更新・削除は通常どおり行える。
+        """
+        instance = self.model(**snapshot)
+        make_transient_to_detached(instance)
+        return await self.session.merge(instance, load=False)
+
+    def _invalidate_cached(self, *record_ids: uuid.UUID) -> None:
+        """エンティティキャッシュから該当レコードを破棄する（内部ヘルパー）"""
+        if self.entity_cache is not None:
+            for record_id in record_ids:
+                self.entity_cache.invalidate(record_id)
+
     async def get_multi(
         self,
         *,
         page: int = 1,
         per_page: int = 20,
+        load: str = "none",
+        count: CountStrategy = "exact",
     ) -> dict[str, Any]:
         """
         ページネーション付きでレコード一覧を取得する。
@@ -85,27 +331,236 @@ class BaseRepository(Generic[ModelType]):
         Args:
             page: ページ番号（1始まり）
             per_page: 1ページあたりの件数
+            load: ローダープロファイル名
+            count: 総件数の算出戦略
 
         Returns:
-            items, total, page, per_page, pages を含む辞書
+            items, total, page, per_page, pages, has_more, count_strategy を含む辞書
         """
-        # 全件数を取得
-        count_stmt = select(func.count()).select_from(self.model)
-        total_result = await self.session.execute(count_stmt)
-        total = total_result.scalar_one()
+        return await self._paginate_by_offset(
+            [],
+            page=page,
+            per_page=per_page,
+            load=load,
+            count=count,
+            cache_key=(self.model.__tablename__,),
+        )
 
-        # ページネーション付きでデータを取得
+    async def _paginate_by_offset(
+        self,
+        conditions: list[ColumnElement[bool]],
+        *,
+        page: int,
+        per_page: int,
+        load: str,
+        count: CountStrategy,
+        cache_key: Hashable,
+        order_by: Sequence[ColumnElement[Any] | InstrumentedAttribute[Any]] = (),
+    ) -> dict[str, Any]:
+        """
+        オフセットページネーションの共通実装（内部ヘルパー）。
+
+        per_page + 1 件を取得して has_more を判定する。
+        最終ページまで取得できた場合は件数が確定するため、戦略に関わらず
+        COUNT クエリを省略して exact として返す。
+
+        Args:
+            conditions: WHERE 条件のリスト
+            page: ページ番号（1始まり）
+            per_page: 1ページあたりの件数
+            load: ローダープロファイル名
+            count: 総件数の算出戦略
+            cache_key: cached 戦略で使用する件数キャッシュのキー
+            order_by: ORDER BY 句
+
+        Returns:
+            items, total, page, per_page, pages, has_more, count_strategy を含む辞書
+        """
+        # ページネーション付きでデータを取得（次ページ判定用に1件多く取得）
         offset = (page - 1) * per_page
-        stmt = select(self.model).offset(offset).limit(per_page)
+        stmt = (
+            select(self.model)
+            .where(*conditions)
+            .order_by(*order_by)
+            .offset(offset)
+            .limit(per_page + 1)
+        )
+        stmt = self._apply_loader_profile(stmt, load)
         result = await self.session.execute(stmt)
         items = list(result.scalars().all())
+        has_more = len(items) > per_page
+        items = items[:per_page]
+
+        # 総件数を取得
+        total: int | None
+        if not has_more and (items or page == 1):
+            total, count = offset + len(items), "exact"
+        elif count == "none":
+            total = None
+        elif count == "estimated":
+            total = await self._estimate_count(conditions)
+            if total is None:
+                total, count = await self._exact_count(conditions), "exact"
+            else:
+                # 推定値が取得済みの件数を下回らないよう補正する
+                total = max(total, offset + len(items) + 1)
+        elif count == "cached":
+            total = count_cache.get(cache_key)
+            if total is None:
+                total = await self._exact_count(conditions)
+                count_cache.set(cache_key, total)
+        else:
+            total = await self._exact_count(conditions)
 
         return {
             "items": items,
             "total": total,
             "page": page,
             "per_page": per_page,
-            "pages": math.ceil(total / per_page) if total > 0 else 0,
+            "pages": math.ceil(total / per_page) if total is not None else None,
+            "has_more": has_more,
+            "count_strategy": count,
+        }
+
+    async def _exact_count(self, conditions: list[ColumnElement[bool]]) -> int:
+        """
+        SELECT count(*) で正確な件数を取得する（内部ヘルパー）。
+
+        Args:
+            conditions: WHERE 条件のリスト
+
+        Returns:
+            件数
+        """
+        count_stmt = select(func.count()).select_from(self.model).where(*conditions)
+        total_result = await self.session.execute(count_stmt)
+        return int(total_result.scalar_one())
+
+    async def _estimate_count(
+        self, conditions: list[ColumnElement[bool]]
+    ) -> int | None:
+        """
+        プランナーの推定行数を取得する（内部ヘルパー）。
+
+        条件なしの場合は pg_class.reltuples を、条件ありの場合は
+        EXPLAIN (FORMAT JSON) の Plan Rows を使用する。
+
+        Args:
+            conditions: WHERE 条件のリスト
+
+        Returns:
+            推定件数、統計情報がない（未 ANALYZE）場合は None
+        """
+        if not conditions:
+            stmt = text(
+                "SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:table)"
+            )
+            result = await self.session.execute(
+                stmt, {"table": self.model.__tablename__}
+            )
+            estimate = result.scalar_one_or_none()
+        else:
+            # 条件値はリテラルとして埋め込む（EXPLAIN はバインド変数を受け付けない）
+            query = select(literal(1)).select_from(self.model).where(*conditions)
+            connection = await self.session.connection()
+            sql = query.compile(
+                dialect=connection.dialect,
+                compile_kwargs={"literal_binds": True},
+            )
+            result = await connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {sql}")
+            plan = result.scalar_one()
+            # ドライバが json 型を自動デコードしない場合に備える
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+            estimate = plan[0]["Plan"]["Plan Rows"]
+
+        # reltuples は一度も ANALYZE されていないテーブルでは -1 になる
+        if estimate is None or estimate < 0:
+            return None
+        return int(estimate)
+
+    async def get_multi_by_cursor(
+        self,
+        *,
+        cursor: str | None = None,
+        per_page: int = 20,
+        load: str = "none",
+    ) -> dict[str, Any]:
+        """
+        キーセット（カーソル）方式でレコード一覧を取得する。
+
+        (created_at, id) の複合キーでシークするため、
+        OFFSET と異なりページの深さに関係なく一定のコストで取得できる。
+
+        Args:
+            cursor: 前ページの next_cursor（None の場合は先頭ページ）
+            per_page: 1ページあたりの件数
+            load: ローダープロファイル名
+
+        Returns:
+            items, per_page, next_cursor を含む辞書
+
+        Raises:
+            InvalidCursorError: カーソルが不正な場合
+        """
+        return await self._paginate_by_cursor(
+            self._apply_loader_profile(select(self.model), load),
+            key="created_at",
+            columns=[self.model.created_at, self.model.id],  # type: ignore[attr-defined]
+            cursor=cursor,
+            per_page=per_page,
+        )
+
+    async def _paginate_by_cursor(
+        self,
+        stmt: Select[Any],
+        *,
+        key: str,
+        columns: list[InstrumentedAttribute[Any]],
+        cursor: str | None,
+        per_page: int,
+        descending: bool = False,
+    ) -> dict[str, Any]:
+        """
+        キーセットページネーションの共通実装（内部ヘルパー）。
+
+        per_page + 1 件を取得して次ページの有無を判定し、
+        最終行のキー列の値から next_cursor を生成する。
+
+        Args:
+            stmt: フィルタ条件を適用済みの SELECT 文
+            key: ソートキー名（カーソルに埋め込まれる）
+            columns: シーク対象のキー列（インデックスと同じ並び）
+            cursor: 前ページの next_cursor
+            per_page: 1ページあたりの件数
+            descending: True の場合は降順でシーク
+
+        Returns:
+            items, per_page, next_cursor を含む辞書
+        """
+        if cursor:
+            values = decode_cursor(cursor, key, columns)
+            # 行値比較 (a, b) > (:a, :b) は複合インデックスでそのままシークできる
+            if descending:
+                stmt = stmt.where(tuple_(*columns) < tuple_(*values))
+            else:
+                stmt = stmt.where(tuple_(*columns) > tuple_(*values))
+
+        order_by = [c.desc() for c in columns] if descending else list(columns)
+        stmt = stmt.order_by(*order_by).limit(per_page + 1)
+        result = await self.session.execute(stmt)
+        items = list(result.scalars().all())
+
+        next_cursor = None
+        if len(items) > per_page:
+            items = items[:per_page]
+            last = items[-1]
+            next_cursor = encode_cursor(key, [getattr(last, c.key) for c in columns])
+
+        return {
+            "items": items,
+            "per_page": per_page,
+            "next_cursor": next_cursor,
         }
 
     async def update(
@@ -121,7 +576,7 @@ class BaseRepository(Generic[ModelType]):
         Returns:
             更新されたモデルインスタンス、見つからなければ None
         """
-        instance = await self.get_by_id(record_id)
+        instance = await self._fetch_by_id(record_id)
         if instance is None:
             return None
 
@@ -129,7 +584,9 @@ class BaseRepository(Generic[ModelType]):
         for key, value in data.items():
             setattr(instance, key, value)
 
+        await self._touch_list_version()
         await self.session.commit()
+        self._invalidate_cached(record_id)
         await self.session.refresh(instance)
         return instance
 
@@ -143,10 +600,13 @@ class BaseRepository(Generic[ModelType]):
         Returns:
             削除成功: True、レコードが見つからない: False
         """
-        instance = await self.get_by_id(record_id)
+        instance = await self._fetch_by_id(record_id)
         if instance is None:
             return False
 
         await self.session.delete(instance)
+        await self._touch_list_version()
         await self.session.commit()
+        self._invalidate_cached(record_id)
+        count_cache.incr((self.model.__tablename__,), -1)
         return True
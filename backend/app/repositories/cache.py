@@ -0,0 +1,157 @@
+"""
+エンティティキャッシュモジュール。
+
+BaseRepository.get_by_id のためのプロセス内リードスルーキャッシュを提供する。
+ORM インスタンスそのものではなく列値の不変スナップショットを保持し、
+取得のたびに各セッションへ新しいインスタンスとして取り込むことで、
+セッション間で状態が共有されないようにする。
+"""
+
+import time
+import uuid
+from collections import OrderedDict
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any
+
+from app.core.config import settings
+
+
+class EntityCache:
+    """
+    TTL 付き LRU エンティティキャッシュ（ワーカープロセス単位）。
+
+    - 最大件数を超えると最も古く参照されたエントリを追い出す
+    - 更新・削除時は invalidate で該当エントリを破棄する
+    - ロード中に無効化が発生した場合は、古い値を登録しない（世代番号で判定）
+
+    複数ワーカー間では共有されないため、他ワーカーの書き込みは TTL で収束する。
+    """
+
+    def __init__(self, name: str, *, max_size: int, ttl_seconds: float) -> None:
+        """
+        キャッシュを初期化する。
+
+        Args:
+            name: キャッシュ名（統計情報の識別用、通常はテーブル名）
+            max_size: 最大エントリ数
+            ttl_seconds: エントリの有効期間（秒）
+        """
+        self.name = name
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[uuid.UUID, tuple[Mapping[str, Any], float]] = (
+            OrderedDict()
+        )
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get(self, key: uuid.UUID) -> Mapping[str, Any] | None:
+        """
+        有効なスナップショットを取得する。
+
+        Args:
+            key: エンティティのUUID
+
+        Returns:
+            列値のスナップショット、未登録または期限切れの場合は None
+        """
+        entry = self._entries.get(key)
+        if entry is not None and entry[1] >= time.monotonic():
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+        if entry is not None:
+            del self._entries[key]
+        self.misses += 1
+        return None
+
+    def begin_load(self) -> int:
+        """
+        DB からのロード開始時に世代番号を取得する。
+
+        Returns:
+            現在の世代番号（put に渡す）
+        """
+        return self._generation
+
+    def put(self, key: uuid.UUID, values: dict[str, Any], generation: int) -> None:
+        """
+        スナップショットを登録する。
+
+        ロード開始後に無効化が発生していた場合は登録しない
+        （ロード中に更新された古い値をキャッシュしないため）。
+
+        Args:
+            key: エンティティのUUID
+            values: 列値の辞書
+            generation: begin_load で取得した世代番号
+        """
+        if generation != self._generation:
+            return
+        self._entries[key] = (
+            MappingProxyType(dict(values)),
+            time.monotonic() + self.ttl_seconds,
+        )
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, key: uuid.UUID) -> None:
+        """
+        エントリを破棄する。
+
+        Args:
+            key: エンティティのUUID
+        """
+        self._generation += 1
+        self.invalidations += 1
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """全エントリを破棄する"""
+        self._generation += 1
+        self._entries.clear()
+
+    def stats(self) -> dict[str, Any]:
+        """
+        統計情報を取得する。
+
+        Returns:
+            name, size, max_size, hits, misses, evictions, invalidations を含む辞書
+        """
+        return {
+            "name": self.name,
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
+
+
+def build_entity_cache(table_name: str) -> EntityCache | None:
+    """
+    設定に基づいてテーブル用のエンティティキャッシュを生成する。
+
+    ENTITY_CACHE_TTL_SECONDS に TTL が定義されたテーブルのみ有効になる。
+
+    Args:
+        table_name: 対象テーブル名
+
+    Returns:
+        エンティティキャッシュ、無効な場合は None
+    """
+    ttl_seconds = settings.ENTITY_CACHE_TTL_SECONDS.get(table_name)
+    if not settings.ENTITY_CACHE_ENABLED or not ttl_seconds:
+        return None
+    return EntityCache(
+        table_name,
+        max_size=settings.ENTITY_CACHE_MAX_SIZE,
+        ttl_seconds=ttl_seconds,
+    )
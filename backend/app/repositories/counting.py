@@ -0,0 +1,96 @@
+"""
+ページネーション総件数の算出戦略モジュール。
+
+一覧取得時の総件数（total）の求め方（app.core.pagination.CountStrategy）と、
+書き込み時に更新される件数キャッシュを提供する。
+
+戦略:
+    - exact: SELECT count(*) で正確に数える（従来の動作）
+    - estimated: プランナーの推定値（pg_class.reltuples / EXPLAIN）を使う
+    - cached: TTL 付きのプロセス内キャッシュを使い、書き込み時に更新する
+    - none: 件数を数えず、per_page + 1 件の取得で has_more のみ判定する
+"""
+
+import time
+from collections.abc import Hashable
+
+from app.core.config import settings
+
+
+class CountCache:
+    """
+    TTL 付きの件数キャッシュ（ワーカープロセス単位）。
+
+    キーはテーブル名とフィルタ条件のタプル（例: ("tasks", project_id, False)）。
+    書き込み時は incr で差分を反映し、差分が分からない場合は invalidate する。
+    複数ワーカー間では共有されないため、他ワーカーの書き込みは TTL で収束する。
+    """
+
+    def __init__(self, ttl_seconds: float) -> None:
+        """
+        キャッシュを初期化する。
+
+        Args:
+            ttl_seconds: エントリの有効期間（秒）
+        """
+        self.ttl_seconds = ttl_seconds
+        self._entries: dict[Hashable, tuple[int, float]] = {}
+
+    def get(self, key: Hashable) -> int | None:
+        """
+        有効なキャッシュ値を取得する。
+
+        Args:
+            key: キャッシュキー
+
+        Returns:
+            件数、未登録または期限切れの場合は None
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        count, expires_at = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        return count
+
+    def set(self, key: Hashable, count: int) -> None:
+        """
+        件数を登録する（TTL はこの時点から計測）。
+
+        Args:
+            key: キャッシュキー
+            count: 件数
+        """
+        self._entries[key] = (count, time.monotonic() + self.ttl_seconds)
+
+    def incr(self, key: Hashable, delta: int) -> None:
+        """
+        登録済みの件数に差分を反映する（未登録のキーは無視）。
+
+        Args:
+            key: キャッシュキー
+            delta: 増減数
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            count, expires_at = entry
+            self._entries[key] = (max(count + delta, 0), expires_at)
+
+    def invalidate(self, key: Hashable) -> None:
+        """
+        件数を破棄する（次回の cached 取得時に再計算される）。
+
+        Args:
+            key: キャッシュキー
+        """
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """全エントリを破棄する"""
+        self._entries.clear()
+
+
+# シングルトンインスタンス（ワーカープロセス内で共有）
+count_cache = CountCache(ttl_seconds=settings.COUNT_CACHE_TTL_SECONDS)
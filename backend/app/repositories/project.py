@@ -5,20 +5,50 @@ BaseRepository を継承し、Project モデル固有の
 データベース操作を追加する。
 """
 
+from typing import Literal
+
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload, with_expression
 
 from app.models.project import Project
+from app.models.task import TASK_IS_LIVE, Task
 from app.repositories.base import BaseRepository
+from app.repositories.cache import build_entity_cache
+
+# ProjectRepository で利用可能なローダープロファイル名
+ProjectLoad = Literal["none", "task_counts", "live_tasks"]
+
+# 未削除タスク数の相関サブクエリ（未削除タスクの部分インデックスを使用）
+_live_task_count = (
+    select(func.count(Task.id))
+    .where(Task.project_id == Project.id, TASK_IS_LIVE)
+    .correlate(Project)
+    .scalar_subquery()
+)
 
 
 class ProjectRepository(BaseRepository[Project]):
     """
     Project モデル用リポジトリ。
 
-    現時点では基底CRUDのみ。
-    将来的に名前検索やフィルタリングなどの
-    カスタムクエリを追加する場所。
+    基底CRUDに加え、以下のローダープロファイルを提供:
+    - none: プロジェクト行のみ（デフォルト）
+    - task_counts: 未削除タスク数のみを task_count に読み込む
+    - live_tasks: 未削除タスクのみを tasks に読み込む
     """
 
+    # TaskService の存在確認など、プロジェクトの ID 検索は頻度が高いためキャッシュする
+    entity_cache = build_entity_cache(Project.__tablename__)
+
+    # プロジェクト一覧の条件付き GET を主キー検索1回で判定する
+    list_version = Project.__tablename__
+
+    loader_profiles = {
+        "none": (),
+        "task_counts": (with_expression(Project.task_count, _live_task_count),),
+        "live_tasks": (selectinload(Project.tasks.and_(TASK_IS_LIVE)),),
+    }
+
     def __init__(self, session: AsyncSession) -> None:
         super().__init__(Project, session)
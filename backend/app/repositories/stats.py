@@ -0,0 +1,235 @@
+"""
+プロジェクト別タスク集計リポジトリ。
+
+project_task_stats（プロジェクト × ステータスの未削除タスク数）の
+差分更新・読み取り・再計算と、project_task_versions（タスク一覧のバージョン）の
+更新・読み取りを提供する。
+差分更新はタスクの書き込みと同じトランザクションで行うため、
+apply_deltas はコミットしない（コミットは呼び出し側のリポジトリが行う）。
+"""
+
+import uuid
+from collections import Counter
+from collections.abc import Iterable, Mapping
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import func, select, text
+from sqlalchemy.dialects.postgresql import Insert, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.project import Project
+from app.models.task import TASK_IS_LIVE, Task, TaskStatus
+from app.models.task_stats import ProjectTaskStats, ProjectTaskVersion
+
+# 集計キー: (プロジェクトUUID, ステータス)
+StatsKey = tuple[uuid.UUID, TaskStatus]
+
+
+def track_live(
+    deltas: Counter[StatsKey],
+    project_id: uuid.UUID,
+    task_status: TaskStatus | str,
+    is_deleted: bool,
+    amount: int,
+) -> None:
+    """
+    未削除タスクの増減を差分に加算する（論理削除済みの状態は集計対象外）。
+
+    Args:
+        deltas: 加算先の差分
+        project_id: 所属プロジェクトのUUID
+        task_status: タスクのステータス
+        is_deleted: タスクが論理削除済みか
+        amount: 増減数（作成・復元は正、削除は負）
+    """
+    if not is_deleted:
+        deltas[(project_id, TaskStatus(task_status))] += amount
+
+
+class TaskStatsRepository:
+    """
+    ProjectTaskStats 用リポジトリ。
+
+    - apply_deltas: 書き込み時の差分更新とバージョンの更新（コミットしない）
+    - get_by_project_ids: 複数プロジェクトの集計を1クエリで取得
+    - get_version: タスク一覧のバージョンを主キー検索1回で取得
+    - repair: タスクテーブルの GROUP BY 1回で集計を再計算
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    async def apply_deltas(
+        self,
+        deltas: Mapping[StatsKey, int],
+        *,
+        touched: Iterable[uuid.UUID] = (),
+    ) -> None:
+        """
+        INSERT ... ON CONFLICT DO UPDATE で集計値に差分を加算し、
+        タスクを書き込んだプロジェクトのタスク一覧のバージョンを進める。
+
+        同じ行を更新する並行トランザクション同士のデッドロックを避けるため、
+        キーの順序を揃えて1ステートメントで発行する
+        （バージョンの更新はデータ変更 CTE として同じステートメントに含める）。
+        コミットは行わない。
+
+        Args:
+            deltas: (プロジェクトUUID, ステータス) → 増減数
+            touched: タスクを作成・更新・削除したプロジェクトのUUID
+                （集計値の変わらない書き込みも含める）
+        """
+        stats_stmt = self._stats_upsert(deltas)
+        version_stmt = self._version_upsert(touched)
+        if stats_stmt is None:
+            if version_stmt is None:
+                return
+            await self.session.execute(version_stmt)
+            return
+        if version_stmt is not None:
+            stats_stmt = stats_stmt.add_cte(version_stmt.cte("touched"))
+        await self.session.execute(stats_stmt)
+
+    @staticmethod
+    def _stats_upsert(deltas: Mapping[StatsKey, int]) -> Insert | None:
+        """集計値に差分を加算する UPSERT（差分がなければ None、内部ヘルパー）"""
+        rows = [
+            {"project_id": project_id, "status": task_status, "task_count": amount}
+            for (project_id, task_status), amount in sorted(deltas.items())
+            if amount
+        ]
+        if not rows:
+            return None
+        stmt = insert(ProjectTaskStats).values(rows)
+        return stmt.on_conflict_do_update(
+            index_elements=[ProjectTaskStats.project_id, ProjectTaskStats.status],
+            set_={"task_count": ProjectTaskStats.task_count + stmt.excluded.task_count},
+        )
+
+    @staticmethod
+    def _version_upsert(project_ids: Iterable[uuid.UUID]) -> Insert | None:
+        """
+        タスク一覧のバージョンを進める UPSERT（対象がなければ None、内部ヘルパー）。
+
+        最終更新日時は max(updated_at) と同じく後退させない。
+        """
+        rows = [{"project_id": project_id} for project_id in sorted(set(project_ids))]
+        if not rows:
+            return None
+        stmt = insert(ProjectTaskVersion).values(rows)
+        return stmt.on_conflict_do_update(
+            index_elements=[ProjectTaskVersion.project_id],
+            set_={
+                "tasks_modified_at": func.greatest(
+                    ProjectTaskVersion.tasks_modified_at, func.now()
+                ),
+                "revision": ProjectTaskVersion.revision + 1,
+            },
+        )
+
+    async def get_version(self, project_id: uuid.UUID) -> tuple[datetime, int] | None:
+        """
+        プロジェクトのタスク一覧のバージョンを取得する。
+
+        Args:
+            project_id: 対象プロジェクトのUUID
+
+        Returns:
+            (最終更新日時, リビジョン) のタプル、タスクの書き込みが一度もなければ None
+        """
+        stmt = select(
+            ProjectTaskVersion.tasks_modified_at, ProjectTaskVersion.revision
+        ).where(ProjectTaskVersion.project_id == project_id)
+        row = (await self.session.execute(stmt)).one_or_none()
+        if row is None:
+            return None
+        return row.tasks_modified_at, row.revision
+
+    async def get_by_project_ids(
+        self, project_ids: Iterable[uuid.UUID]
+    ) -> dict[uuid.UUID, dict[TaskStatus, int]]:
+        """
+        複数プロジェクトのステータス別タスク数を取得する。
+
+        projects との外部結合で存在確認を兼ねるため、
+        存在しないプロジェクトは結果に含まれない。
+
+        Args:
+            project_ids: 対象プロジェクトのUUID
+
+        Returns:
+            プロジェクトUUID → (ステータス → 件数) の辞書（行のないステータスは 0）
+        """
+        stmt = (
+            select(Project.id, ProjectTaskStats.status, ProjectTaskStats.task_count)
+            .outerjoin(ProjectTaskStats, ProjectTaskStats.project_id == Project.id)
+            .where(Project.id.in_(list(project_ids)))
+        )
+        result = await self.session.execute(stmt)
+        stats: dict[uuid.UUID, dict[TaskStatus, int]] = {}
+        for project_id, task_status, task_count in result.all():
+            counts = stats.setdefault(project_id, dict.fromkeys(TaskStatus, 0))
+            if task_status is not None:
+                counts[task_status] = task_count
+        return stats
+
+    async def repair(self, project_id: uuid.UUID | None = None) -> list[dict[str, Any]]:
+        """
+        タスクテーブルから集計を再計算し、ずれている行を修正する。
+
+        集計テーブルを EXCLUSIVE モードでロックしてから GROUP BY を実行する。
+        実行中のタスク書き込みは差分の適用時に待機するため、
+        再計算の結果に後から差分が二重に加算されることはない。
+
+        Args:
+            project_id: 指定時はそのプロジェクトのみを再計算
+
+        Returns:
+            修正した行（project_id, status, expected, actual の辞書）のリスト
+        """
+        await self.session.execute(
+            text(f"LOCK TABLE {ProjectTaskStats.__tablename__} IN EXCLUSIVE MODE")
+        )
+
+        fresh_stmt = (
+            select(Task.project_id, Task.status, func.count())
+            .where(TASK_IS_LIVE)
+            .group_by(Task.project_id, Task.status)
+        )
+        current_stmt = select(
+            ProjectTaskStats.project_id,
+            ProjectTaskStats.status,
+            ProjectTaskStats.task_count,
+        )
+        if project_id is not None:
+            fresh_stmt = fresh_stmt.where(Task.project_id == project_id)
+            current_stmt = current_stmt.where(ProjectTaskStats.project_id == project_id)
+        expected: dict[StatsKey, int] = {
+            (row[0], row[1]): row[2]
+            for row in (await self.session.execute(fresh_stmt)).all()
+        }
+        actual: dict[StatsKey, int] = {
+            (row[0], row[1]): row[2]
+            for row in (await self.session.execute(current_stmt)).all()
+        }
+
+        drift: list[dict[str, Any]] = [
+            {
+                "project_id": key[0],
+                "status": key[1],
+                "expected": expected.get(key, 0),
+                "actual": actual.get(key, 0),
+            }
+            for key in sorted(expected.keys() | actual.keys())
+            if expected.get(key, 0) != actual.get(key, 0)
+        ]
+        if drift:
+            await self.apply_deltas(
+                {
+                    (row["project_id"], row["status"]): row["expected"] - row["actual"]
+                    for row in drift
+                }
+            )
+        await self.session.commit()
+        return drift
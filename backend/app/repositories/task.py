@@ -7,14 +7,61 @@ BaseRepository を継承し、Task モデル固有の
 """
 
 import math
+import operator
 import uuid
-from typing import Any
+from collections import Counter
+from collections.abc import AsyncIterator, Callable, Mapping
+from datetime import UTC, datetime
+from typing import Any, ClassVar, Literal
 
-from sqlalchemy import func, select
+from sqlalchemy import (
+    ColumnElement,
+    column,
+    delete,
+    func,
+    insert,
+    select,
+    update,
+    values,
+)
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
 
-from app.models.task import Task
+from app.core.pagination import CountStrategy
+from app.models.task import SEARCH_CONFIG, TASK_IS_LIVE, Task
 from app.repositories.base import BaseRepository
+from app.repositories.cache import build_entity_cache
+from app.repositories.counting import count_cache
+from app.repositories.stats import StatsKey, TaskStatsRepository, track_live
+
+# 一覧で使用可能なソートキー（"-" 付きは降順）
+TaskSortKey = Literal[
+    "created_at",
+    "-created_at",
+    "priority",
+    "-priority",
+    "due_date",
+    "-due_date",
+    "updated_at",
+    "-updated_at",
+]
+
+# 範囲フィルタ名 → (対象列, 比較演算子)。両端を含む
+_RANGE_FILTERS: dict[str, tuple[Any, Callable[[Any, Any], Any]]] = {
+    "priority_min": (Task.priority, operator.ge),
+    "priority_max": (Task.priority, operator.le),
+    "due_from": (Task.due_date, operator.ge),
+    "due_to": (Task.due_date, operator.le),
+    "created_since": (Task.created_at, operator.ge),
+    "updated_since": (Task.updated_at, operator.ge),
+}
+
+# 変更されるとステータス別集計（project_task_stats）が増減するフィールド
+_STATS_FIELDS = frozenset({"status", "is_deleted"})
+
+# PostgreSQL の外部キー制約違反（存在しない project_id への INSERT）
+_FOREIGN_KEY_VIOLATION = "23503"
 
 
 class TaskRepository(BaseRepository[Task]):
@@ -23,11 +70,128 @@ class TaskRepository(BaseRepository[Task]):
 
     基底CRUDに加え、以下のカスタムクエリを提供:
     - プロジェクトIDでのタスク一覧取得（ページネーション付き）
-    - 論理削除されたタスクのフィルタリング
+    - 論理削除・ステータス・優先度・期限日時などによる絞り込みとソート
+    - タイトル・説明の全文検索（関連度順、ハイライト付き）
+    - キーセット（カーソル）方式のタスク一覧取得
+    - プロジェクトスコープの単一ステートメント操作（*_in_project）
+    - プロジェクトスコープの一括操作（bulk_*_in_project、単一トランザクション）
+    - サーバーサイドカーソルによるタスクのストリーミング取得
+
+    書き込みメソッドはコミット前にステータス別集計（project_task_stats）へ
+    差分を適用し、タスクの変更と集計の更新を同一トランザクションにする。
     """
 
+    # ENTITY_CACHE_TTL_SECONDS に "tasks" を定義した場合のみ有効
+    entity_cache = build_entity_cache(Task.__tablename__)
+
+    # ソートキー → (キー列, 降順か)
+    # 各キー列は (project_id, ...) の複合インデックスと同じ並びにする
+    SORT_KEYS: ClassVar[dict[str, tuple[list[InstrumentedAttribute[Any]], bool]]] = {
+        "created_at": ([Task.created_at, Task.id], False),
+        "-created_at": ([Task.created_at, Task.id], True),
+        "priority": ([Task.priority, Task.id], False),
+        "-priority": ([Task.priority, Task.id], True),
+        "due_date": ([Task.due_date, Task.id], False),
+        "-due_date": ([Task.due_date, Task.id], True),
+        "updated_at": ([Task.updated_at, Task.id], False),
+        "-updated_at": ([Task.updated_at, Task.id], True),
+    }
+    # due_date は NULL を含み行値比較でシークできないため、オフセット方式のみ
+    CURSOR_KEYS = frozenset(SORT_KEYS) - {"due_date", "-due_date"}
+
     def __init__(self, session: AsyncSession) -> None:
         super().__init__(Task, session)
+        self.stats = TaskStatsRepository(session)
+
+    def _locked_old_state(self, *conditions: ColumnElement[bool]) -> Any:
+        """
+        更新前の status / is_deleted を行ロック付きで返すサブクエリ（内部ヘルパー）。
+
+        UPDATE の FROM に結合して RETURNING で更新前の値を返す。
+        FOR UPDATE により、並行する更新の完了を待ってから最新の値を読む。
+        """
+        return (
+            select(Task.id, Task.status, Task.is_deleted)
+            .where(*conditions)
+            .with_for_update()
+            .subquery("old")
+        )
+
+    def _count_key(
+        self,
+        project_id: uuid.UUID,
+        include_deleted: bool,
+        filters: Mapping[str, Any] | None = None,
+    ) -> tuple[Any, ...]:
+        """
+        プロジェクト別タスク件数のキャッシュキーを生成する（内部ヘルパー）。
+
+        書き込み時に増減されるのはフィルタなしのキーのみ。
+        フィルタ付きのキーは COUNT_CACHE_TTL_SECONDS の経過で更新される。
+        """
+        key: tuple[Any, ...] = (Task.__tablename__, project_id, include_deleted)
+        if filters:
+            key += tuple(
+                (name, tuple(value) if isinstance(value, list) else value)
+                for name, value in sorted(filters.items())
+            )
+        return key
+
+    def _conditions(
+        self,
+        project_id: uuid.UUID,
+        *,
+        include_deleted: bool,
+        filters: Mapping[str, Any] | None = None,
+    ) -> list[ColumnElement[bool]]:
+        """
+        タスク一覧の WHERE 条件を組み立てる（内部ヘルパー）。
+
+        Args:
+            project_id: 対象プロジェクトのUUID
+            include_deleted: 論理削除されたタスクを含めるか
+            filters: status（リスト）と _RANGE_FILTERS のキーを持つ辞書
+
+        Returns:
+            WHERE 条件のリスト
+        """
+        # 基本的な条件: プロジェクトIDでフィルタ
+        conditions = [Task.project_id == project_id]
+
+        # 論理削除フィルタ（デフォルトでは削除済みを除外）
+        if not include_deleted:
+            conditions.append(TASK_IS_LIVE)
+
+        if not filters:
+            return conditions
+        if filters.get("status"):
+            conditions.append(Task.status.in_(filters["status"]))
+        for name, (column_, compare) in _RANGE_FILTERS.items():
+            value = filters.get(name)
+            if value is None:
+                continue
+            # created_at / updated_at は timezone なし（UTC）の列のため、
+            # タイムゾーン付きの値は UTC に変換してから比較する
+            if (
+                isinstance(value, datetime)
+                and value.tzinfo is not None
+                and not column_.type.timezone
+            ):
+                value = value.astimezone(UTC).replace(tzinfo=None)
+            conditions.append(compare(column_, value))
+        return conditions
+
+    def invalidate_counts(self, project_id: uuid.UUID) -> None:
+        """
+        プロジェクト別タスク件数のキャッシュを破棄する。
+
+        リポジトリを経由しない書き込み（COPY など）の後に呼び出す。
+
+        Args:
+            project_id: 対象プロジェクトのUUID
+        """
+        count_cache.invalidate(self._count_key(project_id, True))
+        count_cache.invalidate(self._count_key(project_id, False))
 
     async def get_by_project_id(
         self,
@@ -36,6 +200,9 @@ class TaskRepository(BaseRepository[Task]):
         page: int = 1,
         per_page: int = 20,
         include_deleted: bool = False,
+        count: CountStrategy = "exact",
+        order_by: TaskSortKey = "created_at",
+        filters: Mapping[str, Any] | None = None,
     ) -> dict[str, Any]:
         """
         特定のプロジェクトに属するタスク一覧を取得する。
@@ -45,36 +212,586 @@ class TaskRepository(BaseRepository[Task]):
             page: ページ番号（1始まり）
             per_page: 1ページあたりの件数
             include_deleted: 論理削除されたタスクを含めるか
+            count: 総件数の算出戦略
+            order_by: ソートキー（SORT_KEYS のいずれか）
+            filters: 絞り込み条件（status, priority_min/max, due_from/to,
+                created_since, updated_since）
 
         Returns:
-            items, total, page, per_page, pages を含む辞書
+            items, total, page, per_page, pages, has_more, count_strategy を含む辞書
         """
-        # 基本的な条件: プロジェクトIDでフィルタ
-        conditions = [Task.project_id == project_id]
+        columns, descending = self.SORT_KEYS[order_by]
+        return await self._paginate_by_offset(
+            self._conditions(
+                project_id, include_deleted=include_deleted, filters=filters
+            ),
+            page=page,
+            per_page=per_page,
+            load="none",
+            count=count,
+            cache_key=self._count_key(project_id, include_deleted, filters),
+            order_by=[c.desc() for c in columns] if descending else columns,
+        )
 
-        # 論理削除フィルタ（デフォルトでは削除済みを除外）
-        if not include_deleted:
-            conditions.append(Task.is_deleted == False)  # noqa: E712
+    async def get_by_project_id_by_cursor(
+        self,
+        project_id: uuid.UUID,
+        *,
+        cursor: str | None = None,
+        per_page: int = 20,
+        order_by: TaskSortKey = "created_at",
+        include_deleted: bool = False,
+        filters: Mapping[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """
+        特定のプロジェクトに属するタスク一覧をカーソル方式で取得する。
 
-        # 全件数を取得
-        count_stmt = select(func.count()).select_from(Task).where(*conditions)
-        total_result = await self.session.execute(count_stmt)
-        total = total_result.scalar_one()
+        Args:
+            project_id: 対象プロジェクトのUUID
+            cursor: 前ページの next_cursor（None の場合は先頭ページ）
+            per_page: 1ページあたりの件数
+            order_by: ソートキー（CURSOR_KEYS のいずれか）
+            include_deleted: 論理削除されたタスクを含めるか
+            filters: 絞り込み条件（get_by_project_id と同じ）
+
+        Returns:
+            items, per_page, next_cursor を含む辞書
 
-        # ページネーション付きでデータを取得
+        Raises:
+            InvalidCursorError: カーソルが不正な場合
+        """
+        conditions = self._conditions(
+            project_id, include_deleted=include_deleted, filters=filters
+        )
+        columns, descending = self.SORT_KEYS[order_by]
+        return await self._paginate_by_cursor(
+            select(Task).where(*conditions),
+            key=order_by,
+            columns=columns,
+            cursor=cursor,
+            per_page=per_page,
+            descending=descending,
+        )
+
+    async def search(
+        self,
+        query: str,
+        *,
+        project_id: uuid.UUID | None = None,
+        page: int = 1,
+        per_page: int = 20,
+        highlight: tuple[str, str] = ("<b>", "</b>"),
+    ) -> dict[str, Any]:
+        """
+        タイトル・説明を全文検索し、関連度順に取得する（未削除タスクのみ）。
+
+        検索語は websearch_to_tsquery で解釈する（"..." でフレーズ、-語 で除外、or）。
+        ts_headline は重いため、ページ分の行を絞り込んだ後にのみ計算する。
+
+        Args:
+            query: 検索語
+            project_id: 指定時はそのプロジェクト内のみを検索
+            page: ページ番号（1始まり）
+            per_page: 1ページあたりの件数
+            highlight: 一致箇所を囲む開始・終了マーカー
+
+        Returns:
+            items（task, rank, title_highlight, description_highlight の辞書）,
+            total, page, per_page, pages, has_more, count_strategy を含む辞書
+        """
+        tsquery = func.websearch_to_tsquery(SEARCH_CONFIG, query)
+        conditions = [Task.search_vector.bool_op("@@")(tsquery), TASK_IS_LIVE]
+        if project_id is not None:
+            conditions.append(Task.project_id == project_id)
+
+        # 関連度（ts_rank_cd）でページ分の ID を先に確定する（次ページ判定用に1件多く）
+        rank = func.ts_rank_cd(Task.search_vector, tsquery).label("rank")
         offset = (page - 1) * per_page
-        stmt = select(Task).where(*conditions).offset(offset).limit(per_page)
+        hits = (
+            select(Task.id, rank)
+            .where(*conditions)
+            .order_by(rank.desc(), Task.id)
+            .offset(offset)
+            .limit(per_page + 1)
+            .subquery()
+        )
+
+        start, stop = highlight
+        options = f"StartSel={start}, StopSel={stop}"
+        stmt = (
+            select(
+                Task,
+                hits.c.rank,
+                func.ts_headline(
+                    SEARCH_CONFIG, Task.title, tsquery, f"{options}, HighlightAll=true"
+                ),
+                func.ts_headline(
+                    SEARCH_CONFIG,
+                    Task.description,
+                    tsquery,
+                    f"{options}, MaxFragments=2, MaxWords=30, MinWords=10",
+                ),
+            )
+            .join(hits, Task.id == hits.c.id)
+            .order_by(hits.c.rank.desc(), Task.id)
+        )
         result = await self.session.execute(stmt)
-        items = list(result.scalars().all())
+        rows = result.all()
+        has_more = len(rows) > per_page
+        rows = rows[:per_page]
+
+        # 最終ページまで取得できた場合は件数が確定する
+        if not has_more and (rows or page == 1):
+            total = offset + len(rows)
+        else:
+            total = await self._exact_count(conditions)
 
         return {
-            "items": items,
+            "items": [
+                {
+                    "task": task,
+                    "rank": task_rank,
+                    "title_highlight": title_highlight,
+                    "description_highlight": description_highlight,
+                }
+                for task, task_rank, title_highlight, description_highlight in rows
+            ],
             "total": total,
             "page": page,
             "per_page": per_page,
-            "pages": math.ceil(total / per_page) if total > 0 else 0,
+            "pages": math.ceil(total / per_page),
+            "has_more": has_more,
+            "count_strategy": "exact",
         }
 
+    async def get_version_by_project_id(
+        self, project_id: uuid.UUID
+    ) -> tuple[datetime, int] | None:
+        """
+        条件付き GET 用に、プロジェクトのタスク一覧のバージョンを取得する。
+
+        タスクの書き込みのたびに project_task_versions が更新されるため、
+        タスクを集計せず主キー検索1回で作成・更新・削除のいずれも検出できる。
+
+        Args:
+            project_id: 対象プロジェクトのUUID
+
+        Returns:
+            (最終更新日時, リビジョン) のタプル、タスクの書き込みが一度もなければ None
+        """
+        return await self.stats.get_version(project_id)
+
+    async def get_updated_at_in_project(
+        self, project_id: uuid.UUID, task_id: uuid.UUID
+    ) -> datetime | None:
+        """
+        条件付き GET 用に、所属プロジェクトを条件に含めてタスクの更新日時を取得する。
+
+        Args:
+            project_id: 所属プロジェクトのUUID
+            task_id: 対象タスクのUUID
+
+        Returns:
+            updated_at、見つからないか別プロジェクトのタスクなら None
+        """
+        stmt = select(Task.updated_at).where(
+            Task.id == task_id, Task.project_id == project_id
+        )
+        result = await self.session.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def stream_by_project_id(
+        self,
+        project_id: uuid.UUID,
+        *,
+        include_deleted: bool = False,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[Task]:
+        """
+        プロジェクトの全タスクをサーバーサイドカーソルで逐次取得する。
+
+        yield_per によりバッチ単位でフェッチするため、
+        プロジェクトの規模に関わらずメモリ使用量は一定。
+
+        Args:
+            project_id: 対象プロジェクトのUUID
+            include_deleted: 論理削除されたタスクを含めるか
+            batch_size: 1回のフェッチで取得する行数
+
+        Yields:
+            タスクインスタンス（created_at, id の昇順）
+        """
+        stmt = (
+            select(Task)
+            .where(*self._conditions(project_id, include_deleted=include_deleted))
+            .order_by(Task.created_at, Task.id)
+            .execution_options(yield_per=batch_size)
+        )
+        result = await self.session.stream_scalars(stmt)
+        async for task in result:
+            yield task
+
+    async def create_in_project(
+        self, project_id: uuid.UUID, data: dict[str, Any]
+    ) -> Task | None:
+        """
+        INSERT ... RETURNING でタスクを1往復で作成する。
+
+        プロジェクトの存在確認は外部キー制約に任せる。
+
+        Args:
+            project_id: 所属プロジェクトのUUID
+            data: タスクのフィールド名と値の辞書
+
+        Returns:
+            作成されたタスク、プロジェクトが存在しなければ None
+        """
+        stmt = insert(Task).values(**data, project_id=project_id).returning(Task)
+        try:
+            result = await self.session.execute(stmt)
+            task = result.scalar_one()
+            deltas: Counter[StatsKey] = Counter()
+            track_live(deltas, project_id, task.status, task.is_deleted, 1)
+            await self.stats.apply_deltas(deltas, touched=[project_id])
+            await self.session.commit()
+        except IntegrityError as e:
+            await self.session.rollback()
+            if getattr(e.orig, "sqlstate", None) == _FOREIGN_KEY_VIOLATION:
+                return None
+            raise
+        count_cache.incr(self._count_key(project_id, True), 1)
+        count_cache.incr(self._count_key(project_id, False), 1)
+        return task
+
+    async def get_in_project(
+        self, project_id: uuid.UUID, task_id: uuid.UUID
+    ) -> Task | None:
+        """
+        所属プロジェクトを条件に含めてタスクを取得する。
+
+        Args:
+            project_id: 所属プロジェクトのUUID
+            task_id: 対象タスクのUUID
+
+        Returns:
+            タスク、見つからないか別プロジェクトのタスクなら None
+        """
+        stmt = select(Task).where(Task.id == task_id, Task.project_id == project_id)
+        result = await self.session.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def update_in_project(
+        self, project_id: uuid.UUID, task_id: uuid.UUID, data: dict[str, Any]
+    ) -> Task | None:
+        """
+        UPDATE ... WHERE id AND project_id RETURNING で所有確認と更新を1往復で行う。
+
+        Args:
+            project_id: 所属プロジェクトのUUID
+            task_id: 対象タスクのUUID
+            data: 更新するフィールド名と値の辞書
+
+        Returns:
+            更新後のタスク、該当行がなければ None
+        """
+        # 更新項目がなければ UPDATE は発行せず取得のみ
+        if not data:
+            return await self.get_in_project(project_id, task_id)
+
+        conditions = [Task.id == task_id, Task.project_id == project_id]
+        deltas: Counter[StatsKey] = Counter()
+        task: Task | None
+        if _STATS_FIELDS.isdisjoint(data):
+            update_stmt = (
+                update(Task)
+                .where(*conditions)
+                .values(**data)
+                .returning(Task)
+                .execution_options(populate_existing=True)
+            )
+            task = (await self.session.execute(update_stmt)).scalar_one_or_none()
+        else:
+            # ステータス・論理削除の変更は更新前の値との差分を集計に反映する
+            old = self._locked_old_state(*conditions)
+            stats_update_stmt = (
+                update(Task)
+                .where(Task.id == old.c.id)
+                .values(**data)
+                .returning(Task, old.c.status, old.c.is_deleted)
+                .execution_options(synchronize_session=False, populate_existing=True)
+            )
+            row = (await self.session.execute(stats_update_stmt)).one_or_none()
+            if row is None:
+                task = None
+            else:
+                task, old_status, old_is_deleted = row
+                track_live(deltas, project_id, old_status, old_is_deleted, -1)
+                track_live(deltas, project_id, task.status, task.is_deleted, 1)
+        if task is not None:
+            await self.stats.apply_deltas(deltas, touched=[project_id])
+        await self.session.commit()
+        self._invalidate_cached(task_id)
+        return task
+
+    async def soft_delete_in_project(
+        self, project_id: uuid.UUID, task_id: uuid.UUID
+    ) -> Task | None:
+        """
+        プロジェクトスコープでタスクを論理削除する（1往復）。
+
+        Args:
+            project_id: 所属プロジェクトのUUID
+            task_id: 対象タスクのUUID
+
+        Returns:
+            更新後のタスク、該当行がなければ None
+        """
+        task = await self.update_in_project(project_id, task_id, {"is_deleted": True})
+        # 削除前の状態が分からないため、未削除件数は差分ではなく破棄する
+        count_cache.invalidate(self._count_key(project_id, False))
+        return task
+
+    async def delete_in_project(
+        self, project_id: uuid.UUID, task_id: uuid.UUID
+    ) -> bool:
+        """
+        DELETE ... WHERE id AND project_id でタスクを物理削除する（1往復）。
+
+        Args:
+            project_id: 所属プロジェクトのUUID
+            task_id: 対象タスクのUUID
+
+        Returns:
+            削除成功: True、該当行がない: False
+        """
+        stmt = (
+            delete(Task)
+            .where(Task.id == task_id, Task.project_id == project_id)
+            .returning(Task.status, Task.is_deleted)
+        )
+        result = await self.session.execute(stmt)
+        row = result.one_or_none()
+        deleted = row is not None
+        if row is not None:
+            deltas: Counter[StatsKey] = Counter()
+            track_live(deltas, project_id, row.status, row.is_deleted, -1)
+            await self.stats.apply_deltas(deltas, touched=[project_id])
+        await self.session.commit()
+        self._invalidate_cached(task_id)
+        if deleted:
+            count_cache.incr(self._count_key(project_id, True), -1)
+            count_cache.invalidate(self._count_key(project_id, False))
+        return deleted
+
+    async def bulk_create_in_project(
+        self, project_id: uuid.UUID, items: list[dict[str, Any]]
+    ) -> list[Task] | None:
+        """
+        複数行 INSERT ... RETURNING でタスクを一括作成する。
+
+        Args:
+            project_id: 所属プロジェクトのUUID
+            items: タスクのフィールド名と値の辞書のリスト
+
+        Returns:
+            作成されたタスク（items と同じ順序）、プロジェクトが存在しなければ None
+        """
+        rows = [{**item, "project_id": project_id} for item in items]
+        stmt = insert(Task).returning(Task, sort_by_parameter_order=True)
+        try:
+            result = await self.session.scalars(stmt, rows)
+            tasks = list(result.all())
+            deltas: Counter[StatsKey] = Counter()
+            for task in tasks:
+                track_live(deltas, project_id, task.status, task.is_deleted, 1)
+            await self.stats.apply_deltas(deltas, touched=[project_id] if tasks else ())
+            await self.session.commit()
+        except IntegrityError as e:
+            await self.session.rollback()
+            if getattr(e.orig, "sqlstate", None) == _FOREIGN_KEY_VIOLATION:
+                return None
+            raise
+        count_cache.incr(self._count_key(project_id, True), len(tasks))
+        count_cache.incr(self._count_key(project_id, False), len(tasks))
+        return tasks
+
+    async def bulk_update_in_project(
+        self, project_id: uuid.UUID, items: list[tuple[uuid.UUID, dict[str, Any]]]
+    ) -> dict[uuid.UUID, Task]:
+        """
+        UPDATE ... FROM (VALUES ...) でタスクを一括部分更新する。
+
+        更新対象フィールドの組み合わせごとに1ステートメントを発行し、
+        全グループを単一トランザクションでコミットする。
+
+        Args:
+            project_id: 所属プロジェクトのUUID
+            items: (タスクUUID, 更新するフィールド名と値の辞書) のリスト
+
+        Returns:
+            更新されたタスクの辞書（キーはタスクUUID、該当なしの ID は含まれない）
+        """
+        # 更新フィールドの組み合わせでグループ化（各グループが1つの UPDATE になる）
+        groups: dict[tuple[str, ...], list[tuple[uuid.UUID, dict[str, Any]]]] = {}
+        for task_id, data in items:
+            groups.setdefault(tuple(sorted(data)), []).append((task_id, data))
+
+        table = Task.__table__
+        updated: dict[uuid.UUID, Task] = {}
+        deltas: Counter[StatsKey] = Counter()
+        for fields, group in groups.items():
+            ids = [task_id for task_id, _ in group]
+            if not fields:
+                # 更新項目なし: 所有確認のみ
+                stmt = select(Task).where(
+                    Task.id.in_(ids), Task.project_id == project_id
+                )
+                result = await self.session.scalars(stmt)
+            else:
+                rows = values(
+                    column("id", table.c.id.type),
+                    *(column(name, table.c[name].type) for name in fields),
+                    name="v",
+                ).data(
+                    [(task_id, *(data[f] for f in fields)) for task_id, data in group]
+                )
+                update_stmt = (
+                    update(Task)
+                    .where(Task.id == rows.c.id, Task.project_id == project_id)
+                    .values({name: rows.c[name] for name in fields})
+                    .execution_options(
+                        synchronize_session=False, populate_existing=True
+                    )
+                )
+                if _STATS_FIELDS.isdisjoint(fields):
+                    result = await self.session.scalars(update_stmt.returning(Task))
+                else:
+                    # 更新前の値との差分を集計に反映する
+                    old = self._locked_old_state(
+                        Task.id.in_(ids), Task.project_id == project_id
+                    )
+                    old_result = await self.session.execute(
+                        update_stmt.where(Task.id == old.c.id).returning(
+                            Task, old.c.status, old.c.is_deleted
+                        )
+                    )
+                    for task, old_status, old_is_deleted in old_result.all():
+                        track_live(deltas, project_id, old_status, old_is_deleted, -1)
+                        track_live(deltas, project_id, task.status, task.is_deleted, 1)
+                        updated[task.id] = task
+                    continue
+            for task in result.all():
+                updated[task.id] = task
+
+        await self.stats.apply_deltas(deltas, touched=[project_id] if updated else ())
+        await self.session.commit()
+        self._invalidate_cached(*updated)
+        return updated
+
+    async def bulk_delete_in_project(
+        self, project_id: uuid.UUID, task_ids: list[uuid.UUID], *, soft: bool = True
+    ) -> set[uuid.UUID]:
+        """
+        ID リストでタスクを一括削除する（1ステートメント）。
+
+        Args:
+            project_id: 所属プロジェクトのUUID
+            task_ids: 削除対象のタスクUUIDのリスト
+            soft: True=論理削除、False=物理削除
+
+        Returns:
+            削除されたタスクのUUIDの集合（該当なしの ID は含まれない）
+        """
+        conditions = [Task.id.in_(task_ids), Task.project_id == project_id]
+        if soft:
+            # 更新前に未削除だった行のみが集計から減る
+            old = self._locked_old_state(*conditions)
+            soft_delete_stmt = (
+                update(Task)
+                .where(Task.id == old.c.id)
+                .values(is_deleted=True)
+                .returning(Task.id, old.c.status, old.c.is_deleted)
+                .execution_options(synchronize_session=False)
+            )
+            rows = (await self.session.execute(soft_delete_stmt)).all()
+        else:
+            hard_delete_stmt = (
+                delete(Task)
+                .where(*conditions)
+                .returning(Task.id, Task.status, Task.is_deleted)
+                .execution_options(synchronize_session=False)
+            )
+            rows = (await self.session.execute(hard_delete_stmt)).all()
+        deleted: set[uuid.UUID] = set()
+        deltas: Counter[StatsKey] = Counter()
+        for task_id, task_status, is_deleted in rows:
+            deleted.add(task_id)
+            track_live(deltas, project_id, task_status, is_deleted, -1)
+        await self.stats.apply_deltas(deltas, touched=[project_id] if deleted else ())
+        await self.session.commit()
+        self._invalidate_cached(*deleted)
+
+        if deleted:
+            if not soft:
+                count_cache.incr(self._count_key(project_id, True), -len(deleted))
+            count_cache.invalidate(self._count_key(project_id, False))
+        return deleted
+
+    async def create(self, data: dict[str, Any]) -> Task:
+        """
+        タスクを作成する（集計を保つため create_in_project に委譲する）。
+
+        Args:
+            data: project_id を含むタスクのフィールド名と値の辞書
+
+        Returns:
+            作成されたタスク
+
+        Raises:
+            ValueError: project_id のプロジェクトが存在しない場合
+        """
+        fields = dict(data)
+        project_id = fields.pop("project_id")
+        task = await self.create_in_project(project_id, fields)
+        if task is None:
+            raise ValueError(f"プロジェクトが存在しません: {project_id}")
+        return task
+
+    async def update(self, record_id: uuid.UUID, data: dict[str, Any]) -> Task | None:
+        """
+        タスクを部分更新する（集計を保つため update_in_project に委譲する）。
+
+        Args:
+            record_id: 対象タスクのUUID
+            data: 更新するフィールド名と値の辞書
+
+        Returns:
+            更新後のタスク、見つからなければ None
+        """
+        project_id = await self.session.scalar(
+            select(Task.project_id).where(Task.id == record_id)
+        )
+        if project_id is None:
+            return None
+        return await self.update_in_project(project_id, record_id, data)
+
+    async def delete(self, record_id: uuid.UUID) -> bool:
+        """
+        タスクを物理削除する（集計を保つため delete_in_project に委譲する）。
+
+        Args:
+            record_id: 対象タスクのUUID
+
+        Returns:
+            削除成功: True、見つからない: False
+        """
+        project_id = await self.session.scalar(
+            select(Task.project_id).where(Task.id == record_id)
+        )
+        if project_id is None:
+            return False
+        return await self.delete_in_project(project_id, record_id)
+
     async def soft_delete(self, record_id: uuid.UUID) -> Task | None:
         """
         タスクを論理削除する（is_deleted = True に設定）。
@@ -0,0 +1,63 @@
+"""
+一覧バージョンリポジトリ。
+
+list_versions（テーブル全体を対象とする一覧のバージョン）の更新と読み取りを提供する。
+更新は一覧の行の書き込みと同じトランザクションで行うため、touch はコミットしない。
+"""
+
+from datetime import datetime
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.list_version import ListVersion
+
+
+class ListVersionRepository:
+    """
+    ListVersion 用リポジトリ。
+
+    - touch: 書き込み時にバージョンを進める（コミットしない）
+    - get: 主キー検索1回でバージョンを取得する
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    async def touch(self, name: str) -> None:
+        """
+        INSERT ... ON CONFLICT DO UPDATE で一覧のバージョンを進める。
+
+        最終更新日時は max(updated_at) と同じく後退させない。コミットは行わない。
+
+        Args:
+            name: 一覧名
+        """
+        stmt = insert(ListVersion).values(name=name)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[ListVersion.name],
+            set_={
+                "modified_at": func.greatest(ListVersion.modified_at, func.now()),
+                "revision": ListVersion.revision + 1,
+            },
+        )
+        await self.session.execute(stmt)
+
+    async def get(self, name: str) -> tuple[datetime, int] | None:
+        """
+        一覧のバージョンを取得する。
+
+        Args:
+            name: 一覧名
+
+        Returns:
+            (最終更新日時, リビジョン) のタプル、書き込みが一度もなければ None
+        """
+        stmt = select(ListVersion.modified_at, ListVersion.revision).where(
+            ListVersion.name == name
+        )
+        row = (await self.session.execute(stmt)).one_or_none()
+        if row is None:
+            return None
+        return row.modified_at, row.revision
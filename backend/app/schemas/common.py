@@ -9,6 +9,8 @@ from typing import Generic, TypeVar
 
 from pydantic import BaseModel, Field
 
+from app.core.pagination import CountStrategy
+
 # ジェネリック型パラメータ（ページネーションレスポンス用）
 T = TypeVar("T")
 
@@ -18,6 +20,8 @@ class PaginatedResponse(BaseModel, Generic[T]):
     ページネーション付きレスポンススキーマ。
 
     全てのリスト取得エンドポイントで使用する共通形式。
+    total / pages の精度は count_strategy で示す
+    （estimated / cached は概算、none の場合は null）。
 
     属性:
         items: 現在のページのデータ一覧
@@ -25,10 +29,36 @@ class PaginatedResponse(BaseModel, Generic[T]):
         page: 現在のページ番号（1始まり）
         per_page: 1ページあたりの件数
         pages: 総ページ数
+        has_more: 次のページが存在するか（戦略に関わらず正確）
+        count_strategy: total の算出に実際に使用した戦略
     """
 
     items: list[T]
-    total: int = Field(ge=0, description="全件数")
+    total: int | None = Field(ge=0, description="全件数")
     page: int = Field(ge=1, description="現在のページ番号")
     per_page: int = Field(ge=1, le=100, description="1ページあたりの件数")
-    pages: int = Field(ge=0, description="総ページ数")
+    pages: int | None = Field(ge=0, description="総ページ数")
+    has_more: bool = Field(default=False, description="次のページが存在するか")
+    count_strategy: CountStrategy = Field(
+        default="exact", description="total の算出に使用した戦略"
+    )
+
+
+class CursorPaginatedResponse(BaseModel, Generic[T]):
+    """
+    カーソル（キーセット）ページネーション付きレスポンススキーマ。
+
+    OFFSET を使わないため深いページでも取得コストが一定。
+    次ページは next_cursor をそのまま cursor クエリに渡して取得する。
+
+    属性:
+        items: 現在のページのデータ一覧
+        per_page: 1ページあたりの件数
+        next_cursor: 次ページ取得用の不透明なカーソル（最終ページでは None）
+    """
+
+    items: list[T]
+    per_page: int = Field(ge=1, le=100, description="1ページあたりの件数")
+    next_cursor: str | None = Field(
+        default=None, description="次ページ取得用カーソル（最終ページでは null）"
+    )
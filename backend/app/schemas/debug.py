@@ -0,0 +1,84 @@
+"""
+デバッグ API 用スキーマ定義。
+"""
+
+from datetime import datetime
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+
+class SlowQueryPlan(BaseModel):
+    """
+    スロークエリの実行計画（1件分）。
+
+    属性:
+        captured_at: 取得日時
+        route: SQL を実行したリクエストのルート（リクエスト外は "-"）
+        duration_ms: 元の SQL の実行時間（ミリ秒）
+        sql: 正規化した SQL 文（パラメータ・リテラルは ?）
+        params: パラメータの型（値は含まない）
+        analyzed: EXPLAIN ANALYZE による実測値を含むか
+        plan: EXPLAIN (FORMAT JSON) の結果
+    """
+
+    captured_at: datetime
+    route: str
+    duration_ms: float
+    sql: str
+    params: list[str] | dict[str, str]
+    analyzed: bool
+    plan: Any
+
+
+class SlowQueryPlanList(BaseModel):
+    """スロークエリの実行計画一覧（このワーカーが保持するもの、新しい順）"""
+
+    threshold_ms: float | None = Field(
+        description="スロークエリのしきい値（ミリ秒、null の場合は無効）"
+    )
+    explain_sample_rate: float = Field(description="EXPLAIN を再実行する割合")
+    items: list[SlowQueryPlan]
+
+
+class AdmissionLimiterStatus(BaseModel):
+    """
+    ルートの種類ごとのアドミッション制御の設定と状態（このワーカーの値）。
+
+    属性:
+        route_class: ルートの種類（read / write / export）
+        limit: 同時実行数の上限（null の場合は制限しない）
+        queue_size: 待ち行列の最大長
+        queue_timeout_ms: 待ち行列での待ち時間の期限（ミリ秒）
+        in_flight: 処理中のリクエスト数
+        queue_depth: 待ち行列で待機中のリクエスト数
+    """
+
+    route_class: str
+    limit: int | None
+    queue_size: int
+    queue_timeout_ms: float
+    in_flight: int
+    queue_depth: int
+
+
+class AdmissionStatusList(BaseModel):
+    """アドミッション制御の設定と状態の一覧"""
+
+    enabled: bool = Field(description="アドミッション制御が有効か")
+    items: list[AdmissionLimiterStatus]
+
+
+class AdmissionLimitUpdate(BaseModel):
+    """
+    アドミッション制御の設定変更リクエスト（指定した項目のみ変更）。
+
+    属性:
+        limit: 同時実行数の上限
+        queue_size: 待ち行列の最大長
+        queue_timeout_ms: 待ち行列での待ち時間の期限（ミリ秒）
+    """
+
+    limit: int | None = Field(default=None, ge=0)
+    queue_size: int | None = Field(default=None, ge=0)
+    queue_timeout_ms: float | None = Field(default=None, ge=0)
@@ -5,16 +5,65 @@
 from pydantic import BaseModel
 
 
+class DatabasePoolStatus(BaseModel):
+    """
+    DB コネクションプールの状態（ワーカープロセス単位）。
+
+    属性:
+        size: 常時保持するコネクション数（DB_POOL_SIZE）
+        max_overflow: 一時的に作成できるコネクション数の上限
+        checked_in: 空きコネクション数
+        checked_out: 貸し出し中のコネクション数
+        overflow: 作成中のオーバーフローコネクション数
+        waiters: 空きコネクションを待っている要求数
+        avg_hold_ms: コネクションの平均貸し出し時間（ミリ秒、未計測の場合は None）
+        wait_budget_ms: バックプレッシャーの待ち時間の上限（無効の場合は None）
+    """
+
+    size: int
+    max_overflow: int
+    checked_in: int
+    checked_out: int
+    overflow: int
+    waiters: int
+    avg_hold_ms: float | None
+    wait_budget_ms: float | None
+
+
+class ReplicaStatus(BaseModel):
+    """
+    リードレプリカの状態（ワーカープロセス単位）。
+
+    属性:
+        name: 表示名（host:port/database）
+        healthy: 読み取りの振り分け先として使用中か
+        lag_seconds: 最後に計測した複製遅延（秒、未計測の場合は None）
+        last_error: 異常と判定した理由（正常な場合は None）
+        checked_at: 最後にヘルスチェックを行った時刻（UNIX 時刻、未実施の場合は None）
+    """
+
+    name: str
+    healthy: bool
+    lag_seconds: float | None
+    last_error: str | None
+    checked_at: float | None
+
+
 class HealthCheckResponse(BaseModel):
     """
     ヘルスチェックエンドポイントのレスポンススキーマ。
 
     属性:
-        status: アプリケーションの状態（"healthy" / "unhealthy"）
-        database: データベース接続の状態（"connected" / "disconnected"）
+        status: アプリケーションの状態（"healthy" / "degraded" / "unhealthy"）
+        database: データベース接続の状態
+            （"connected" / "saturated" / "disconnected"）
         version: アプリケーションバージョン
+        pool: DB コネクションプールの状態
+        replicas: リードレプリカの状態（未設定の場合は空）
     """
 
     status: str
     database: str
     version: str
+    pool: DatabasePoolStatus
+    replicas: list[ReplicaStatus] = []
@@ -10,6 +10,8 @@ from datetime import datetime
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from app.models.task import TaskStatus
+
 
 class ProjectCreate(BaseModel):
     """プロジェクト作成リクエストスキーマ"""
@@ -63,3 +65,30 @@ class ProjectRead(BaseModel):
     description: str | None
     created_at: datetime
     updated_at: datetime
+    task_count: int | None = Field(
+        default=None,
+        description="未削除タスク数（with_task_count=true 指定時のみ）",
+    )
+
+
+class ProjectTaskStatsRead(BaseModel):
+    """
+    プロジェクトのタスク集計レスポンススキーマ。
+
+    論理削除済みを除くタスク数をステータス別に返す。
+    集計テーブルから読み込むため、タスク数に関わらず一定コストで取得できる。
+    """
+
+    project_id: uuid.UUID
+    counts: dict[TaskStatus, int] = Field(
+        ...,
+        description="ステータス別の未削除タスク数（全ステータスを含む）",
+        examples=[{"todo": 3, "in_progress": 1, "done": 5}],
+    )
+    total: int = Field(ge=0, description="未削除タスク数の合計")
+
+
+class ProjectTaskStatsList(BaseModel):
+    """複数プロジェクトのタスク集計レスポンススキーマ（存在するプロジェクトのみ）"""
+
+    items: list[ProjectTaskStatsRead]
@@ -7,9 +7,11 @@ TaskStatus enum をスキーマ層でも共有。
 
 import uuid
 from datetime import datetime
+from typing import Literal, Self
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
+from app.core.config import settings
 from app.models.task import TaskStatus
 
 
@@ -89,3 +91,175 @@ class TaskRead(BaseModel):
     is_deleted: bool
     created_at: datetime
     updated_at: datetime
+
+
+class TaskListFilter(BaseModel):
+    """
+    タスク一覧のフィルタ条件（クエリパラメータ）。
+
+    範囲指定はいずれも両端を含む。未指定（None）の条件は適用しない。
+    """
+
+    status: list[TaskStatus] | None = Field(
+        default=None,
+        description="ステータス（複数指定可）",
+    )
+    priority_min: int | None = Field(default=None, ge=0, description="優先度の下限")
+    priority_max: int | None = Field(default=None, ge=0, description="優先度の上限")
+    due_from: datetime | None = Field(default=None, description="期限日時の下限")
+    due_to: datetime | None = Field(default=None, description="期限日時の上限")
+    created_since: datetime | None = Field(
+        default=None, description="この日時以降に作成されたタスク"
+    )
+    updated_since: datetime | None = Field(
+        default=None, description="この日時以降に更新されたタスク"
+    )
+
+    @model_validator(mode="after")
+    def _check_ranges(self) -> Self:
+        """範囲指定の下限が上限を超えていないことを検証する"""
+        if (
+            self.priority_min is not None
+            and self.priority_max is not None
+            and self.priority_min > self.priority_max
+        ):
+            raise ValueError("priority_min は priority_max 以下にしてください")
+        if (
+            self.due_from is not None
+            and self.due_to is not None
+            and self.due_from > self.due_to
+        ):
+            raise ValueError("due_from は due_to 以前にしてください")
+        return self
+
+
+class TaskSearchHit(BaseModel):
+    """タスク全文検索の1件分の結果"""
+
+    task: TaskRead
+    rank: float = Field(..., description="関連度（大きいほど一致度が高い）")
+    title_highlight: str = Field(
+        ...,
+        description="一致箇所を <mark> で囲んだタイトル（HTML エスケープ済み）",
+    )
+    description_highlight: str | None = Field(
+        default=None,
+        description="一致箇所を含む説明の抜粋（HTML エスケープ済み）",
+    )
+
+
+class TaskBulkCreate(BaseModel):
+    """タスク一括作成リクエストスキーマ"""
+
+    items: list[TaskCreate] = Field(
+        ...,
+        min_length=1,
+        max_length=settings.BULK_MAX_ITEMS,
+        description="作成するタスクの一覧",
+    )
+
+
+class TaskBulkUpdateItem(TaskUpdate):
+    """タスク一括更新の各要素（ID + 部分更新フィールド）"""
+
+    id: uuid.UUID = Field(..., description="更新対象のタスクID")
+
+
+class TaskBulkUpdate(BaseModel):
+    """タスク一括更新リクエストスキーマ"""
+
+    items: list[TaskBulkUpdateItem] = Field(
+        ...,
+        min_length=1,
+        max_length=settings.BULK_MAX_ITEMS,
+        description="更新するタスクの一覧（ID の重複不可）",
+    )
+
+    @field_validator("items")
+    @classmethod
+    def _reject_duplicate_ids(
+        cls, items: list[TaskBulkUpdateItem]
+    ) -> list[TaskBulkUpdateItem]:
+        """同一タスクへの更新が1リクエスト内で重複していないことを検証する"""
+        if len({item.id for item in items}) != len(items):
+            raise ValueError("タスクIDが重複しています")
+        return items
+
+
+class TaskBulkDelete(BaseModel):
+    """タスク一括削除リクエストスキーマ"""
+
+    ids: list[uuid.UUID] = Field(
+        ...,
+        min_length=1,
+        max_length=settings.BULK_MAX_ITEMS,
+        description="削除するタスクIDの一覧（重複不可）",
+    )
+    soft: bool = Field(
+        default=True,
+        description="True=論理削除、False=物理削除",
+    )
+
+    @field_validator("ids")
+    @classmethod
+    def _reject_duplicate_ids(cls, ids: list[uuid.UUID]) -> list[uuid.UUID]:
+        """同一タスクの削除が1リクエスト内で重複していないことを検証する"""
+        if len(set(ids)) != len(ids):
+            raise ValueError("タスクIDが重複しています")
+        return ids
+
+
+class TaskBulkItemResult(BaseModel):
+    """
+    一括操作の要素ごとの結果。
+
+    属性:
+        index: リクエスト内の要素の位置（0始まり）
+        id: 対象タスクID
+        status: 処理結果（created / updated / deleted / not_found）
+        task: 作成・更新後のタスク（削除・該当なしの場合は None）
+    """
+
+    index: int
+    id: uuid.UUID
+    status: Literal["created", "updated", "deleted", "not_found"]
+    task: TaskRead | None = None
+
+
+class TaskBulkResponse(BaseModel):
+    """
+    一括操作レスポンススキーマ。
+
+    属性:
+        results: 要素ごとの結果（リクエストと同じ順序）
+        succeeded: 成功件数
+        failed: 失敗件数（該当なし）
+    """
+
+    results: list[TaskBulkItemResult]
+    succeeded: int = Field(ge=0, description="成功件数")
+    failed: int = Field(ge=0, description="失敗件数")
+
+
+class TaskImportError(BaseModel):
+    """インポートで除外された行"""
+
+    line: int = Field(ge=1, description="入力の行番号（1始まり）")
+    error: str = Field(description="エラー内容")
+
+
+class TaskImportResult(BaseModel):
+    """
+    タスクインポート結果スキーマ。
+
+    属性:
+        imported: 取り込んだ件数
+        rejected: 検証エラーで除外した件数
+        errors: 除外した行の詳細（最大 IMPORT_MAX_REPORTED_ERRORS 件）
+        errors_truncated: errors が上限で切り捨てられたか
+    """
+
+    imported: int = Field(ge=0)
+    rejected: int = Field(ge=0)
+    errors: list[TaskImportError]
+    errors_truncated: bool
@@ -0,0 +1,235 @@
+"""
+本番用サーバー起動 CLI エントリーポイント。
+
+uvicorn をマルチワーカーで起動する。設定は Settings（SERVER_* / DB_*）から読み込む。
+
+- ワーカー数は SERVER_WORKERS（未設定の場合はコンテナの CPU 制限を考慮した CPU 数）
+- イベントループに uvloop、HTTP パーサーに httptools を使用する
+  （インストールされていない場合は標準の実装）
+- SERVER_MAX_REQUESTS 件ごとにワーカーを再起動してメモリの増加を抑える
+  （終了したワーカーは uvicorn が起動し直す。時期は SERVER_MAX_REQUESTS_JITTER で分散）
+- 終了シグナル（SIGTERM / SIGINT）の受信後は新しい接続を受け付けず、
+  処理中のリクエストを SERVER_GRACEFUL_TIMEOUT_SECONDS まで待ってから終了する
+- 全ワーカーの DB コネクション数の合計が PostgreSQL の max_connections を超えないよう、
+  ワーカーごとの DB_POOL_SIZE / DB_MAX_OVERFLOW を縮小する
+- 複数ワーカーの場合は PROMETHEUS_MULTIPROC_DIR を用意する
+
+ワーカーは設定を環境変数から読み直すため、調整した値は環境変数で引き渡す。
+
+使用例:
+    python -m app.serve
+    SERVER_WORKERS=8 DB_MAX_CONNECTIONS=200 python -m app.serve
+    python -m app.serve --dry-run
+"""
+
+import argparse
+import asyncio
+import importlib.util
+import math
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+import uvicorn
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import NullPool
+
+from app.core.config import settings
+
+# cgroup v2 の CPU 制限（"<quota> <period>" または "max <period>"）
+_CGROUP_CPU_MAX = Path("/sys/fs/cgroup/cpu.max")
+
+
+def cpu_limit() -> int:
+    """
+    このプロセスが利用できる CPU 数を返す。
+
+    CPU アフィニティと cgroup v2 の CPU 制限（コンテナの --cpus）の小さい方を使う。
+
+    Returns:
+        CPU 数（1 以上）
+    """
+    if hasattr(os, "sched_getaffinity"):
+        count = len(os.sched_getaffinity(0))
+    else:
+        count = os.cpu_count() or 1
+    try:
+        quota, period = _CGROUP_CPU_MAX.read_text().split()
+        if quota != "max":
+            count = min(count, math.ceil(int(quota) / int(period)))
+    except (OSError, ValueError):
+        pass  # cgroup v2 でない環境では制限なしとみなす
+    return max(count, 1)
+
+
+async def _server_connection_limit() -> int:
+    """PostgreSQL の max_connections からスーパーユーザー予約分を除いた接続数"""
+    engine = create_async_engine(settings.DATABASE_URL, poolclass=NullPool)
+    try:
+        async with engine.connect() as conn:
+            max_connections = await conn.scalar(text("SHOW max_connections"))
+            reserved = await conn.scalar(text("SHOW superuser_reserved_connections"))
+    finally:
+        await engine.dispose()
+    return int(max_connections) - int(reserved)
+
+
+def connection_budget() -> int | None:
+    """
+    このサーバーの全ワーカーで使用できる DB 接続数を返す。
+
+    DB_MAX_CONNECTIONS（未設定の場合は PostgreSQL から取得した値）から
+    DB_CONNECTION_HEADROOM を除き、SERVER_INSTANCES で等分する。
+
+    Returns:
+        接続数（PostgreSQL に接続できず上限が不明な場合は None）
+    """
+    limit = settings.DB_MAX_CONNECTIONS
+    if limit is None:
+        try:
+            limit = asyncio.run(_server_connection_limit())
+        except Exception as e:
+            print(
+                f"max_connections を取得できません（プールは設定値のまま）: {e}",
+                file=sys.stderr,
+            )
+            return None
+    instances = max(settings.SERVER_INSTANCES, 1)
+    return (limit - settings.DB_CONNECTION_HEADROOM) // instances
+
+
+def size_pool(
+    budget: int, workers: int, pool_size: int, max_overflow: int
+) -> tuple[int, int]:
+    """
+    ワーカーごとのプールの大きさを接続数の上限に収める。
+
+    設定値が上限内であればそのまま使い、超える場合は pool_size、
+    max_overflow の順に縮小する（max_overflow < 0 の無制限も上限までに制限する）。
+
+    Args:
+        budget: 全ワーカーで使用できる接続数
+        workers: ワーカー数
+        pool_size: 設定された DB_POOL_SIZE
+        max_overflow: 設定された DB_MAX_OVERFLOW
+
+    Returns:
+        (pool_size, max_overflow) のタプル
+
+    Raises:
+        ValueError: ワーカーに1接続も割り当てられない場合
+    """
+    per_worker = budget // workers
+    if per_worker < 1:
+        raise ValueError(
+            f"DB 接続数が不足しています（使用可能 {budget}、ワーカー {workers}）"
+        )
+    size = min(pool_size, per_worker)
+    overflow = per_worker - size
+    if max_overflow >= 0:
+        overflow = min(max_overflow, overflow)
+    return size, overflow
+
+
+def _prepare_multiprocess_dir() -> str:
+    """PROMETHEUS_MULTIPROC_DIR を用意して空にする（未指定の場合は一時ディレクトリ）"""
+    path = os.environ.get("PROMETHEUS_MULTIPROC_DIR")
+    if path is None:
+        path = tempfile.mkdtemp(prefix="prometheus-multiproc-")
+        os.environ["PROMETHEUS_MULTIPROC_DIR"] = path
+    else:
+        Path(path).mkdir(parents=True, exist_ok=True)
+        # 前回起動時のワーカーの値を集計に含めない
+        for db_file in Path(path).glob("*.db"):
+            db_file.unlink()
+    return path
+
+
+def _override(name: str, value: int) -> None:
+    """設定値を上書きする（ワーカーには環境変数で引き渡す）"""
+    os.environ[name] = str(value)
+    setattr(settings, name, value)
+
+
+def _parse_args(argv: list[str] | None) -> argparse.Namespace:
+    """コマンドライン引数を解析する"""
+    parser = argparse.ArgumentParser(
+        prog="python -m app.serve",
+        description="本番用の設定で uvicorn をマルチワーカーで起動する",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="ワーカー数とプールの大きさを表示して終了する（起動しない）",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> None:
+    """CLI エントリーポイント"""
+    args = _parse_args(argv)
+    workers = settings.SERVER_WORKERS or cpu_limit()
+    loop = "uvloop" if importlib.util.find_spec("uvloop") else "asyncio"
+    http = "httptools" if importlib.util.find_spec("httptools") else "h11"
+
+    budget = connection_budget()
+    if budget is not None:
+        try:
+            pool_size, max_overflow = size_pool(
+                budget, workers, settings.DB_POOL_SIZE, settings.DB_MAX_OVERFLOW
+            )
+        except ValueError as e:
+            print(f"{e}（SERVER_WORKERS を減らしてください）", file=sys.stderr)
+            sys.exit(1)
+        if (pool_size, max_overflow) != (
+            settings.DB_POOL_SIZE,
+            settings.DB_MAX_OVERFLOW,
+        ):
+            print(
+                f"DB プールを縮小: pool_size {settings.DB_POOL_SIZE} → {pool_size}、"
+                f"max_overflow {settings.DB_MAX_OVERFLOW} → {max_overflow}",
+                file=sys.stderr,
+            )
+            _override("DB_POOL_SIZE", pool_size)
+            _override("DB_MAX_OVERFLOW", max_overflow)
+
+    # 単一ワーカーは uvicorn が再起動しないため、リクエスト数での再起動は行わない
+    max_requests = settings.SERVER_MAX_REQUESTS if workers > 1 else None
+
+    print(f"ワーカー: {workers}（ループ: {loop} / HTTP: {http}）", file=sys.stderr)
+    print(
+        f"DB プール（ワーカーあたり）: pool_size {settings.DB_POOL_SIZE} / "
+        f"max_overflow {settings.DB_MAX_OVERFLOW}"
+        f"（全ワーカーで使用可能な接続数: {budget if budget is not None else '不明'}）",
+        file=sys.stderr,
+    )
+    print(
+        f"ワーカーの再起動: {f'{max_requests:,} 件ごと' if max_requests else 'なし'} / "
+        f"終了時の待機: 最大 {settings.SERVER_GRACEFUL_TIMEOUT_SECONDS} 秒",
+        file=sys.stderr,
+    )
+    if args.dry_run:
+        return
+
+    if workers > 1 and settings.METRICS_ENABLED:
+        _prepare_multiprocess_dir()
+
+    uvicorn.run(
+        "app.main:app",
+        host=settings.BACKEND_HOST,
+        port=settings.BACKEND_PORT,
+        workers=workers,
+        loop=loop,
+        http=http,
+        limit_max_requests=max_requests,
+        limit_max_requests_jitter=settings.SERVER_MAX_REQUESTS_JITTER,
+        timeout_graceful_shutdown=settings.SERVER_GRACEFUL_TIMEOUT_SECONDS,
+        timeout_keep_alive=settings.SERVER_KEEP_ALIVE_SECONDS,
+        proxy_headers=True,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,244 @@
+"""
+読み取りの同時実行の合流（シングルフライト）モジュール。
+
+同じ引数の読み取りが同時に実行された場合、最初の呼び出し（リーダー）だけが
+DB にクエリを発行し、実行中に到着した同じキーの呼び出し（フォロワー）は
+リーダーの完了を待って同じ結果（または同じ内容の例外）を受け取る。
+人気のプロジェクトのボードを多数のクライアントが同時に開いた場合などに、
+同じ件数・ページのクエリが重複して実行されるのを防ぐ。
+
+- 合流はワーカープロセス内のみ（完了後は結果を保持しない。キャッシュではない）
+- 1つの実行に合流できるフォロワー数は COALESCING_MAX_WAITERS まで
+  （超えた呼び出しは合流せず自分でクエリを実行する）
+- リーダーがキャンセルされた場合（クライアントの切断など）、
+  待機中のフォロワーは改めて実行し直す（キャンセルを伝播させない）
+- 結果はフォロワー間で同じオブジェクトを共有するため、呼び出し側は読み取りのみ行い
+  変更しないこと（ORM インスタンスはリーダーのセッションに属する。ルートは
+  レスポンススキーマへの変換・検証子の参照にのみ使う）
+- 例外はフォロワーごとに複製して送出する（トレースバックや属性を共有しない）
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable, Mapping
+from typing import Any, TypeVar, cast
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.metrics import COALESCED_CALLS_TOTAL
+from app.db.session import READ_REPLICA_INFO_KEY
+
+T = TypeVar("T")
+
+
+class _Flight:
+    """実行中の1つの呼び出しと、合流しているフォロワー数（内部用）"""
+
+    def __init__(self, future: asyncio.Future[Any]) -> None:
+        self.future = future
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    同じキーの同時実行を1回の実行に合流させる（ワーカープロセス単位）。
+
+    属性:
+        name: 識別名（メトリクスのラベル、通常はサービスのメソッド名）
+        max_waiters: 1つの実行に合流できるフォロワー数の上限
+        enabled: 合流を行うか（False の場合は常に各自で実行する）
+    """
+
+    def __init__(self, name: str, *, max_waiters: int, enabled: bool = True) -> None:
+        """
+        初期化する。
+
+        Args:
+            name: 識別名
+            max_waiters: 1つの実行に合流できるフォロワー数の上限
+            enabled: 合流を行うか
+        """
+        self.name = name
+        self.max_waiters = max_waiters
+        self.enabled = enabled
+        self._flights: dict[Hashable, _Flight] = {}
+
+    @property
+    def in_flight(self) -> int:
+        """実行中のキーの数"""
+        return len(self._flights)
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        キーが同じ実行中の呼び出しがあれば合流し、なければ fn を実行する。
+
+        Args:
+            key: 呼び出しを識別するキー（正規化済みの引数）
+            fn: 実行する処理
+
+        Returns:
+            fn の結果（合流した場合はリーダーの結果）
+
+        Raises:
+            Exception: fn が送出した例外（合流した場合はリーダーの例外の複製）
+        """
+        if not self.enabled:
+            return await fn()
+
+        while (flight := self._flights.get(key)) is not None:
+            if flight.waiters >= self.max_waiters:
+                self._record("overflow")
+                return await fn()
+            self._record("follower")
+            flight.waiters += 1
+            try:
+                # 自分がキャンセルされてもリーダーの実行は止めない
+                return await asyncio.shield(flight.future)
+            except asyncio.CancelledError:
+                if not flight.future.cancelled():
+                    raise  # 自分自身のキャンセル
+                # リーダーがキャンセルされた場合は改めて実行する
+            except Exception as e:
+                clone = _clone_exception(e)
+                if clone is e:
+                    raise
+                # 元の例外（リーダーのトレースバック）は原因として残す
+                raise clone from e
+            finally:
+                flight.waiters -= 1
+
+        self._record("leader")
+        future: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+        flight = _Flight(future)
+        self._flights[key] = flight
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # フォロワーがいない場合に「未取得の例外」として記録されないようにする
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            if self._flights.get(key) is flight:
+                del self._flights[key]
+
+    def _record(self, role: str) -> None:
+        """呼び出しの種類を記録する（内部ヘルパー）"""
+        if settings.METRICS_ENABLED:
+            COALESCED_CALLS_TOTAL.labels(self.name, role).inc()
+
+
+def _clone_exception(exc: Exception) -> Exception:
+    """
+    フォロワーに送出する例外を複製する（内部ヘルパー）。
+
+    キーワード引数で作成された例外（HTTPException など）は args から
+    再構築できないため、__init__ を呼ばずに args と属性（浅いコピー）を引き継ぐ。
+    複製できない例外はそのまま返す。
+
+    Args:
+        exc: リーダーが送出した例外
+
+    Returns:
+        属性を引き継いだ新しい例外オブジェクト
+    """
+    cls = type(exc)
+    try:
+        clone = cls.__new__(cls, *exc.args)
+        clone.args = exc.args
+        clone.__dict__.update(exc.__dict__)
+    except Exception:
+        return exc
+    return clone
+
+
+def freeze(value: Any) -> Hashable:
+    """
+    引数の値をキーに使えるハッシュ可能な値に正規化する。
+
+    辞書は項目の順序、リスト・集合は要素の順序を問わない
+    （一覧の絞り込み条件は IN 条件として扱うため）。
+
+    Args:
+        value: 正規化する値
+
+    Returns:
+        ハッシュ可能な値
+    """
+    if isinstance(value, Mapping):
+        return tuple(sorted((k, freeze(v)) for k, v in value.items()))
+    if isinstance(value, list | tuple | set | frozenset):
+        return tuple(sorted((freeze(v) for v in value), key=repr))
+    return cast(Hashable, value)
+
+
+def session_scope(session: AsyncSession) -> Hashable | None:
+    """
+    セッションから合流の範囲（キーの一部）を決める。
+
+    リードレプリカとプライマリの結果は合流させない（書き込み直後の読み取りを
+    プライマリに固定したリクエストに、レプリカの古い結果を返さないため）。
+    未フラッシュの変更があるセッションは、その変更が結果に含まれうるため合流しない。
+
+    Args:
+        session: 呼び出し元のセッション
+
+    Returns:
+        "replica" / "primary"（合流しない場合は None）
+    """
+    if session.new or session.dirty or session.deleted:
+        return None
+    return "replica" if session.info.get(READ_REPLICA_INFO_KEY) else "primary"
+
+
+async def coalesce(
+    flight: SingleFlight,
+    session: AsyncSession,
+    key: Hashable,
+    fn: Callable[[], Awaitable[T]],
+) -> T:
+    """
+    セッションの範囲を含めたキーで fn の同時実行を合流させる。
+
+    Args:
+        flight: 使用する SingleFlight
+        session: 呼び出し元のセッション
+        key: 正規化済みの引数
+        fn: 実行する処理
+
+    Returns:
+        fn の結果
+    """
+    scope = session_scope(session)
+    if scope is None:
+        return await fn()
+    return await flight.do((scope, key), fn)
+
+
+# --- ワーカープロセス単位の合流（COALESCING_* 設定から作成） ---
+project_reads = SingleFlight(
+    "get_project",
+    max_waiters=settings.COALESCING_MAX_WAITERS,
+    enabled=settings.COALESCING_ENABLED,
+)
+task_list_reads = SingleFlight(
+    "get_tasks",
+    max_waiters=settings.COALESCING_MAX_WAITERS,
+    enabled=settings.COALESCING_ENABLED,
+)
+project_version_reads = SingleFlight(
+    "get_project_version",
+    max_waiters=settings.COALESCING_MAX_WAITERS,
+    enabled=settings.COALESCING_ENABLED,
+)
+task_list_version_reads = SingleFlight(
+    "get_tasks_version",
+    max_waiters=settings.COALESCING_MAX_WAITERS,
+    enabled=settings.COALESCING_ENABLED,
+)
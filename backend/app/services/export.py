@@ -0,0 +1,131 @@
+"""
+Task エクスポートサービス。
+
+プロジェクトの全タスクを NDJSON / CSV としてストリーミング出力する。
+リクエストスコープのセッションはレスポンス送信前に閉じられる可能性があるため、
+ストリーム用に専用のセッションを開き、サーバーサイドカーソルで逐次読み出す。
+"""
+
+import csv
+import io
+import uuid
+from collections.abc import AsyncIterator
+from typing import Literal
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.config import settings
+from app.db.session import async_session_factory
+from app.repositories.task import TaskRepository
+from app.schemas.task import TaskRead
+
+# エクスポート形式
+ExportFormat = Literal["ndjson", "csv"]
+
+# エクスポート形式 → Content-Type
+EXPORT_MEDIA_TYPES: dict[ExportFormat, str] = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+
+# Accept ヘッダのメディアタイプ → エクスポート形式
+_ACCEPT_FORMATS: dict[str, ExportFormat] = {
+    "application/x-ndjson": "ndjson",
+    "application/ndjson": "ndjson",
+    "application/jsonl": "ndjson",
+    "application/json": "ndjson",
+    "text/csv": "csv",
+    "*/*": "ndjson",
+    "application/*": "ndjson",
+    "text/*": "csv",
+}
+
+# 1回の送信にまとめる行数（チャンクが細かすぎると送信オーバーヘッドが増える）
+_ROWS_PER_CHUNK = 500
+
+
+def negotiate_export_format(accept: str | None) -> ExportFormat | None:
+    """
+    Accept ヘッダからエクスポート形式を決定する。
+
+    q 値が最も高い対応メディアタイプを選択する。
+    ヘッダがない場合は NDJSON とする。
+
+    Args:
+        accept: Accept ヘッダの値
+
+    Returns:
+        エクスポート形式、対応する形式がない場合は None
+    """
+    if not accept:
+        return "ndjson"
+
+    best: tuple[float, ExportFormat] | None = None
+    for part in accept.split(","):
+        media_type, *params = (p.strip() for p in part.split(";"))
+        export_format = _ACCEPT_FORMATS.get(media_type.lower())
+        if export_format is None:
+            continue
+        q = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        if q > 0 and (best is None or q > best[0]):
+            best = (q, export_format)
+    return best[1] if best is not None else None
+
+
+async def stream_tasks(
+    project_id: uuid.UUID,
+    export_format: ExportFormat,
+    *,
+    include_deleted: bool = False,
+    session_factory: async_sessionmaker[AsyncSession] = async_session_factory,
+) -> AsyncIterator[str]:
+    """
+    プロジェクトのタスクを指定形式でストリーミング出力する。
+
+    プロジェクトの存在確認は呼び出し側で事前に行うこと。
+
+    Args:
+        project_id: 対象プロジェクトのUUID
+        export_format: 出力形式（ndjson / csv）
+        include_deleted: 論理削除されたタスクを含めるか
+        session_factory: 読み取りに使うセッションファクトリ（リードレプリカなど）
+
+    Yields:
+        出力テキストのチャンク
+    """
+    async with session_factory() as session:
+        tasks = TaskRepository(session).stream_by_project_id(
+            project_id,
+            include_deleted=include_deleted,
+            batch_size=settings.EXPORT_BATCH_SIZE,
+        )
+
+        buffer = io.StringIO()
+        writer = csv.writer(buffer) if export_format == "csv" else None
+        if writer is not None:
+            writer.writerow(TaskRead.model_fields)
+
+        rows = 0
+        async for task in tasks:
+            read = TaskRead.model_validate(task)
+            if writer is not None:
+                writer.writerow(read.model_dump(mode="json").values())
+            else:
+                buffer.write(read.model_dump_json())
+                buffer.write("\n")
+
+            rows += 1
+            if rows % _ROWS_PER_CHUNK == 0:
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+
+        if buffer.tell():
+            yield buffer.getvalue()
@@ -0,0 +1,297 @@
+"""
+Task 一括インポートサービス。
+
+NDJSON / CSV のストリームをチャンク単位で解析・検証し、
+PostgreSQL の COPY（asyncpg copy_records_to_table）で単一トランザクション内に
+高速ロードする。不正な行はエラーとして記録し、ロード全体は中断しない。
+
+パイプライン:
+    1. バイトストリームを行に分割し、レコード（行番号 + 辞書）に変換
+    2. chunk_size 件ごとに TaskCreate で検証（workers > 0 の場合は別プロセスで並列）
+    3. 検証済みチャンクを入力順に COPY でロード
+"""
+
+import asyncio
+import codecs
+import csv
+import json
+import logging
+import uuid
+from collections import Counter
+from collections.abc import AsyncIterator, Callable
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any, Literal
+
+from pydantic import ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.task import Task
+from app.repositories.stats import StatsKey, TaskStatsRepository, track_live
+from app.repositories.task import TaskRepository
+from app.schemas.task import TaskCreate
+
+logger = logging.getLogger(__name__)
+
+# インポート形式
+ImportFormat = Literal["ndjson", "csv"]
+
+# COPY 対象の列（created_at / updated_at / is_deleted はサーバーデフォルトを使用）
+COPY_COLUMNS = (
+    "id",
+    "project_id",
+    "title",
+    "description",
+    "status",
+    "priority",
+    "due_date",
+)
+
+# 検証済みレコード内のステータスの位置（集計の差分計算に使用）
+_STATUS_INDEX = COPY_COLUMNS.index("status")
+
+# CSV で空文字を None として扱う任意項目
+_NULLABLE_FIELDS = ("description", "due_date")
+
+# チャンク検証結果: (COPY 用レコードのリスト, エラーのリスト)
+ChunkResult = tuple[list[tuple[Any, ...]], list[dict[str, Any]]]
+
+
+def import_format_from_content_type(content_type: str | None) -> ImportFormat | None:
+    """
+    Content-Type ヘッダからインポート形式を決定する。
+
+    Args:
+        content_type: Content-Type ヘッダの値
+
+    Returns:
+        インポート形式、対応していない場合は None
+    """
+    media_type = (content_type or "").split(";")[0].strip().lower()
+    if media_type in ("text/csv", "application/csv"):
+        return "csv"
+    if media_type in (
+        "application/x-ndjson",
+        "application/ndjson",
+        "application/jsonl",
+        "application/json",
+    ):
+        return "ndjson"
+    return None
+
+
+async def _iter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    """バイトチャンクを UTF-8 として逐次デコードし、行単位に分割する"""
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    pending = ""
+    async for chunk in chunks:
+        pending += decoder.decode(chunk)
+        *lines, pending = pending.split("\n")
+        for line in lines:
+            yield line + "\n"
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        yield pending
+
+
+async def _iter_records(
+    chunks: AsyncIterator[bytes], import_format: ImportFormat
+) -> AsyncIterator[tuple[int, Any]]:
+    """
+    入力ストリームを (行番号, レコード) に変換する。
+
+    CSV は引用符内の改行を考慮し、引用符の数が偶数になるまで
+    物理行を連結して1レコードとする。解析できない行は文字列のまま返し、
+    検証段階でエラーとして扱う。
+    """
+    line_no = 0
+    if import_format == "ndjson":
+        async for line in _iter_lines(chunks):
+            line_no += 1
+            if not line.strip():
+                continue
+            try:
+                yield line_no, json.loads(line)
+            except json.JSONDecodeError as e:
+                yield line_no, f"JSON の解析に失敗しました: {e.msg}"
+        return
+
+    header: list[str] | None = None
+    buffered = ""
+    start = 0
+    async for line in _iter_lines(chunks):
+        line_no += 1
+        if not buffered:
+            start = line_no
+        buffered += line
+        if buffered.count('"') % 2:
+            continue  # 引用符内の改行: 次の物理行と連結する
+        record, buffered = buffered, ""
+        if not record.strip():
+            continue
+        values = next(csv.reader([record]))
+        if header is None:
+            header = [name.strip() for name in values]
+            continue
+        if len(values) != len(header):
+            yield start, f"列数がヘッダと一致しません: {len(values)} != {len(header)}"
+            continue
+        yield start, dict(zip(header, values, strict=True))
+    if buffered.strip():
+        yield start, "引用符が閉じられていません"
+
+
+def validate_chunk(rows: list[tuple[int, Any]], project_id: uuid.UUID) -> ChunkResult:
+    """
+    レコードのチャンクを TaskCreate で検証し、COPY 用のタプルに変換する。
+
+    別プロセスで実行できるようモジュールレベルの関数として定義する。
+
+    Args:
+        rows: (行番号, レコード) のリスト
+        project_id: 所属プロジェクトのUUID
+
+    Returns:
+        (COPY 用レコードのリスト, エラーのリスト)
+    """
+    records: list[tuple[Any, ...]] = []
+    errors: list[dict[str, Any]] = []
+    for line_no, row in rows:
+        if isinstance(row, str):
+            errors.append({"line": line_no, "error": row})
+            continue
+        if not isinstance(row, dict):
+            errors.append({"line": line_no, "error": "オブジェクト形式ではありません"})
+            continue
+        for field in _NULLABLE_FIELDS:
+            if row.get(field) == "":
+                row[field] = None
+        try:
+            task = TaskCreate.model_validate(row)
+        except ValidationError as e:
+            message = "; ".join(
+                f"{'.'.join(str(p) for p in err['loc'])}: {err['msg']}"
+                for err in e.errors()
+            )
+            errors.append({"line": line_no, "error": message})
+            continue
+        records.append(
+            (
+                uuid.uuid4(),
+                project_id,
+                task.title,
+                task.description,
+                task.status.value,
+                task.priority,
+                task.due_date,
+            )
+        )
+    return records, errors
+
+
+async def import_tasks(
+    session: AsyncSession,
+    project_id: uuid.UUID,
+    chunks: AsyncIterator[bytes],
+    import_format: ImportFormat,
+    *,
+    chunk_size: int,
+    workers: int = 0,
+    max_reported_errors: int = 100,
+    on_progress: Callable[[dict[str, Any]], None] | None = None,
+) -> dict[str, Any]:
+    """
+    タスクを COPY で一括インポートする（単一トランザクション）。
+
+    プロジェクトの存在確認は呼び出し側で事前に行うこと。
+
+    Args:
+        session: 非同期DBセッション
+        project_id: 所属プロジェクトのUUID
+        chunks: 入力のバイトストリーム
+        import_format: 入力形式（ndjson / csv）
+        chunk_size: 検証・ロードの単位となる行数
+        workers: 検証用プロセス数（0 の場合はイベントループ上で検証）
+        max_reported_errors: 結果に含めるエラーの最大件数
+        on_progress: チャンクのロードごとに呼ばれる進捗コールバック
+
+    Returns:
+        imported, rejected, errors, errors_truncated を含む辞書
+    """
+    connection = await session.connection()
+    raw_connection = await connection.get_raw_connection()
+    driver_connection: Any = raw_connection.driver_connection
+
+    stats: dict[str, Any] = {"imported": 0, "rejected": 0, "chunks": 0}
+    errors: list[dict[str, Any]] = []
+    # ステータス別集計の差分（コミット前に同じトランザクションで適用する）
+    deltas: Counter[StatsKey] = Counter()
+    executor: Executor | None = (
+        ProcessPoolExecutor(max_workers=workers) if workers > 0 else None
+    )
+    # 検証中のチャンク（入力順）。workers 件まで先行して検証する
+    in_flight: list[asyncio.Future[ChunkResult]] = []
+    loop = asyncio.get_running_loop()
+
+    async def load(future: asyncio.Future[ChunkResult]) -> None:
+        records, chunk_errors = await future
+        if records:
+            await driver_connection.copy_records_to_table(
+                Task.__tablename__, records=records, columns=COPY_COLUMNS
+            )
+            for record in records:
+                track_live(deltas, project_id, record[_STATUS_INDEX], False, 1)
+        stats["imported"] += len(records)
+        stats["rejected"] += len(chunk_errors)
+        stats["chunks"] += 1
+        errors.extend(chunk_errors[: max(max_reported_errors - len(errors), 0)])
+        logger.info(
+            "タスクインポート進捗: project=%s imported=%d rejected=%d",
+            project_id,
+            stats["imported"],
+            stats["rejected"],
+        )
+        if on_progress is not None:
+            on_progress(dict(stats))
+
+    def submit(rows: list[tuple[int, Any]]) -> None:
+        if executor is None:
+            future = loop.create_future()
+            future.set_result(validate_chunk(rows, project_id))
+        else:
+            future = loop.run_in_executor(executor, validate_chunk, rows, project_id)
+        in_flight.append(future)
+
+    try:
+        rows: list[tuple[int, Any]] = []
+        async for record in _iter_records(chunks, import_format):
+            rows.append(record)
+            if len(rows) >= chunk_size:
+                submit(rows)
+                rows = []
+                if len(in_flight) > max(workers, 1):
+                    await load(in_flight.pop(0))
+        if rows:
+            submit(rows)
+        while in_flight:
+            await load(in_flight.pop(0))
+        await TaskStatsRepository(session).apply_deltas(
+            deltas, touched=[project_id] if stats["imported"] else ()
+        )
+        await session.commit()
+    except BaseException:
+        for future in in_flight:
+            future.cancel()
+        await session.rollback()
+        raise
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    TaskRepository(session).invalidate_counts(project_id)
+
+    return {
+        "imported": stats["imported"],
+        "rejected": stats["rejected"],
+        "errors": errors,
+        "errors_truncated": stats["rejected"] > len(errors),
+    }
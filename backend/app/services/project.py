@@ -7,13 +7,24 @@ Project サービス層。
 """
 
 import uuid
+from collections.abc import Sequence
 from typing import Any
 
 from fastapi import HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.repositories.project import ProjectRepository
+from app.core.pagination import CountStrategy
+from app.models.task import TaskStatus
+from app.repositories.base import InvalidCursorError
+from app.repositories.project import ProjectLoad, ProjectRepository
+from app.repositories.stats import TaskStatsRepository
+from app.repositories.task import TaskRepository
 from app.schemas.project import ProjectCreate, ProjectUpdate
+from app.services.coalescing import (
+    coalesce,
+    project_reads,
+    project_version_reads,
+)
 
 
 class ProjectService:
@@ -25,7 +36,10 @@ class ProjectService:
     """
 
     def __init__(self, session: AsyncSession) -> None:
+        self.session = session
         self.repository = ProjectRepository(session)
+        self.task_repository = TaskRepository(session)
+        self.stats_repository = TaskStatsRepository(session)
 
     async def create_project(self, data: ProjectCreate) -> Any:
         """
@@ -39,14 +53,19 @@ class ProjectService:
         """
         return await self.repository.create(data.model_dump())
 
-    async def get_project(self, project_id: uuid.UUID) -> Any:
+    async def get_project(
+        self, project_id: uuid.UUID, *, load: ProjectLoad = "none"
+    ) -> Any:
         """
         IDでプロジェクトを取得する。
 
         見つからない場合は 404 エラーを返す。
+        同じ引数の同時実行中の呼び出しとは1回のクエリに合流し、
+        結果（404 を含む）を共有する（app.services.coalescing）。
 
         Args:
             project_id: 対象のUUID
+            load: ローダープロファイル（none / task_counts / live_tasks）
 
         Returns:
             プロジェクトインスタンス
@@ -54,19 +73,123 @@ class ProjectService:
         Raises:
             HTTPException: プロジェクトが見つからない場合
         """
-        project = await self.repository.get_by_id(project_id)
-        if project is None:
+
+        async def fetch() -> Any:
+            project = await self.repository.get_by_id(project_id, load=load)
+            if project is None:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail=f"プロジェクトが見つかりません: {project_id}",
+                )
+            return project
+
+        return await coalesce(project_reads, self.session, (project_id, load), fetch)
+
+    async def get_project_version(
+        self, project_id: uuid.UUID, *, with_task_count: bool = False
+    ) -> dict[str, Any] | None:
+        """
+        条件付き GET 用のバージョン情報（検証子）を取得する。
+
+        行全体は読み込まず、updated_at（と必要ならタスクの集計）のみを取得する。
+        同じ引数の同時実行中の呼び出しとは1回のクエリに合流する。
+
+        Args:
+            project_id: 対象のUUID
+            with_task_count: タスク数を含むレスポンスか（タスクの変更も検出する）
+
+        Returns:
+            last_modified, tag を含む辞書。見つからない場合は None
+        """
+
+        async def fetch() -> dict[str, Any] | None:
+            updated_at = await self.repository.get_updated_at(project_id)
+            if updated_at is None:
+                return None
+            tag = f"{project_id}:{updated_at.isoformat()}"
+            if not with_task_count:
+                return {"last_modified": updated_at, "tag": tag}
+
+            # task_count は論理削除済みを含むタスクの書き込みごとに
+            # 進むバージョンで検出する
+            tasks_version = await self.task_repository.get_version_by_project_id(
+                project_id
+            )
+            if tasks_version is None:
+                return {"last_modified": updated_at, "tag": tag}
+            tasks_modified, tasks_revision = tasks_version
+            return {
+                "last_modified": max(updated_at, tasks_modified),
+                "tag": f"{tag}:{tasks_revision}",
+            }
+
+        return await coalesce(
+            project_version_reads, self.session, (project_id, with_task_count), fetch
+        )
+
+    @staticmethod
+    def _stats_response(
+        project_id: uuid.UUID, counts: dict[TaskStatus, int]
+    ) -> dict[str, Any]:
+        """集計値をレスポンス用の辞書に変換する（内部ヘルパー）"""
+        return {
+            "project_id": project_id,
+            "counts": counts,
+            "total": sum(counts.values()),
+        }
+
+    async def get_project_stats(self, project_id: uuid.UUID) -> dict[str, Any]:
+        """
+        プロジェクトのステータス別タスク数を集計テーブルから取得する。
+
+        Args:
+            project_id: 対象のUUID
+
+        Returns:
+            project_id, counts, total を含む辞書
+
+        Raises:
+            HTTPException: プロジェクトが見つからない場合
+        """
+        stats = await self.stats_repository.get_by_project_ids([project_id])
+        if project_id not in stats:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"プロジェクトが見つかりません: {project_id}",
             )
-        return project
+        return self._stats_response(project_id, stats[project_id])
+
+    async def get_projects_stats(
+        self, project_ids: Sequence[uuid.UUID]
+    ) -> dict[str, Any]:
+        """
+        複数プロジェクトのステータス別タスク数を1クエリで取得する。
+
+        存在しないプロジェクトは結果から除外する（エラーにはしない）。
+
+        Args:
+            project_ids: 対象のUUID（重複は1件にまとめる）
+
+        Returns:
+            items（指定順の集計辞書のリスト）を含む辞書
+        """
+        unique_ids = list(dict.fromkeys(project_ids))
+        stats = await self.stats_repository.get_by_project_ids(unique_ids)
+        return {
+            "items": [
+                self._stats_response(project_id, stats[project_id])
+                for project_id in unique_ids
+                if project_id in stats
+            ]
+        }
 
     async def get_projects(
         self,
         *,
         page: int = 1,
         per_page: int = 20,
+        load: ProjectLoad = "none",
+        count: CountStrategy = "exact",
     ) -> dict[str, Any]:
         """
         プロジェクト一覧をページネーション付きで取得する。
@@ -74,11 +197,56 @@ class ProjectService:
         Args:
             page: ページ番号
             per_page: 1ページあたりの件数
+            load: ローダープロファイル
+            count: 総件数の算出戦略
 
         Returns:
             ページネーションレスポンス辞書
         """
-        return await self.repository.get_multi(page=page, per_page=per_page)
+        return await self.repository.get_multi(
+            page=page, per_page=per_page, load=load, count=count
+        )
+
+    async def get_projects_version(self) -> dict[str, Any]:
+        """
+        条件付き GET 用に、プロジェクト一覧全体のバージョン情報を取得する。
+
+        Returns:
+            last_modified, tag を含む辞書
+        """
+        last_modified, revision = await self.repository.get_multi_version()
+        return {"last_modified": last_modified, "tag": f"{last_modified}:{revision}"}
+
+    async def get_projects_by_cursor(
+        self,
+        *,
+        cursor: str | None = None,
+        per_page: int = 20,
+        load: ProjectLoad = "none",
+    ) -> dict[str, Any]:
+        """
+        プロジェクト一覧をカーソル方式で取得する。
+
+        Args:
+            cursor: 前ページの next_cursor
+            per_page: 1ページあたりの件数
+            load: ローダープロファイル
+
+        Returns:
+            カーソルページネーションレスポンス辞書
+
+        Raises:
+            HTTPException: カーソルが不正な場合
+        """
+        try:
+            return await self.repository.get_multi_by_cursor(
+                cursor=cursor, per_page=per_page, load=load
+            )
+        except InvalidCursorError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="不正なカーソルです",
+            ) from None
 
     async def update_project(
         self, project_id: uuid.UUID, data: ProjectUpdate
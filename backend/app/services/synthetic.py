@@ -0,0 +1,366 @@
+"""
+合成データセット生成サービス。
+
+本番規模の挙動をローカルで再現するため、タスク件数が Zipf 分布に従う
+多数のプロジェクトと、ステータスの比率・期限日の分布・論理削除率を
+指定したタスクを生成し、COPY（asyncpg copy_records_to_table）でロードする。
+乱数は seed からのみ決まるため、同じ引数であれば毎回同じデータになる。
+
+ロードの流れ:
+    1. プロジェクトを COPY でロードしてコミット
+    2. （defer_indexes 指定時）tasks のインデックスを削除
+    3. タスクを chunk_size 行ごとに COPY し、ステータス別集計の差分と
+       同じトランザクションでコミット
+    4. （defer_indexes 指定時）インデックスを一括作成
+    5. ANALYZE で統計情報を更新（実行計画を本番データに近づける）
+"""
+
+import itertools
+import logging
+import random
+import uuid
+from collections import Counter
+from collections.abc import Callable, Iterator, Mapping
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from sqlalchemy import delete, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.project import Project
+from app.models.task import Task, TaskStatus
+from app.models.task_stats import ProjectTaskStats
+from app.repositories.stats import StatsKey, TaskStatsRepository, track_live
+from app.repositories.version import ListVersionRepository
+from app.services.importer import COPY_COLUMNS
+
+logger = logging.getLogger(__name__)
+
+# COPY 対象の列（インポートの列に論理削除フラグと作成・更新日時を加える）
+PROJECT_COLUMNS = ("id", "name", "description", "created_at", "updated_at")
+TASK_COLUMNS = (*COPY_COLUMNS, "is_deleted", "created_at", "updated_at")
+
+# 生成レコード内の位置（集計の差分計算に使用）
+_STATUS_INDEX = TASK_COLUMNS.index("status")
+_IS_DELETED_INDEX = TASK_COLUMNS.index("is_deleted")
+
+# 既定のステータス比率
+DEFAULT_STATUS_WEIGHTS: dict[TaskStatus, float] = {
+    TaskStatus.TODO: 0.5,
+    TaskStatus.IN_PROGRESS: 0.2,
+    TaskStatus.DONE: 0.3,
+}
+
+# 作成日時の終端の既定値（固定値にしてデータを seed のみで決める）
+DEFAULT_CREATED_UNTIL = datetime(2025, 1, 1)
+
+
+def _random_uuid(rng: random.Random) -> uuid.UUID:
+    """乱数生成器から UUID v4 を生成する（seed で再現可能）"""
+    return uuid.UUID(int=rng.getrandbits(128), version=4)
+
+
+def zipf_counts(
+    total: int, buckets: int, exponent: float, rng: random.Random
+) -> list[int]:
+    """
+    total 件を Zipf 分布（k 番目の重みが 1 / k^exponent）で buckets 個に配分する。
+
+    最大剰余法で丸めるため、合計は常に total と一致する。
+    順位はシャッフルし、件数の多いバケットが先頭に偏らないようにする。
+
+    Args:
+        total: 配分する総件数
+        buckets: バケット数
+        exponent: Zipf 分布の指数（大きいほど上位に偏る、0 で均等）
+        rng: 乱数生成器
+
+    Returns:
+        各バケットの件数のリスト
+    """
+    weights = [1 / (rank**exponent) for rank in range(1, buckets + 1)]
+    scale = total / sum(weights)
+    exact = [weight * scale for weight in weights]
+    counts = [int(value) for value in exact]
+    by_remainder = sorted(
+        range(buckets), key=lambda i: exact[i] - counts[i], reverse=True
+    )
+    for i in by_remainder[: total - sum(counts)]:
+        counts[i] += 1
+    rng.shuffle(counts)
+    return counts
+
+
+def task_records(
+    project_id: uuid.UUID,
+    count: int,
+    rng: random.Random,
+    *,
+    status_weights: Mapping[TaskStatus, float] = DEFAULT_STATUS_WEIGHTS,
+    deleted_ratio: float = 0.0,
+    due_ratio: float = 0.7,
+    due_spread_days: int = 60,
+    created_until: datetime = DEFAULT_CREATED_UNTIL,
+    created_span_days: int = 365,
+) -> Iterator[tuple[Any, ...]]:
+    """
+    1プロジェクト分のタスクを TASK_COLUMNS の順のタプルで生成する。
+
+    Args:
+        project_id: 所属プロジェクトのUUID
+        count: 生成する件数
+        rng: 乱数生成器
+        status_weights: ステータス → 比率
+        deleted_ratio: 論理削除済みにする割合
+        due_ratio: 期限日を設定する割合
+        due_spread_days: 期限日を作成日時から何日後までに分散させるか
+        created_until: 作成日時の終端（タイムゾーンなし、UTC）
+        created_span_days: 作成日時を分散させる日数
+
+    Yields:
+        COPY 用のレコード
+    """
+    statuses = [task_status.value for task_status in status_weights]
+    cum_weights = list(itertools.accumulate(status_weights.values()))
+    span = timedelta(days=created_span_days).total_seconds()
+    created_from = created_until - timedelta(days=created_span_days)
+    due_spread = timedelta(days=due_spread_days).total_seconds()
+    for i in range(count):
+        created_at = created_from + timedelta(seconds=rng.random() * span)
+        # due_date はタイムゾーン付きの列、created_at / updated_at はタイムゾーンなし
+        due_date = (
+            (created_at + timedelta(seconds=rng.random() * due_spread)).replace(
+                tzinfo=UTC
+            )
+            if rng.random() < due_ratio
+            else None
+        )
+        yield (
+            _random_uuid(rng),
+            project_id,
+            f"タスク {i + 1}",
+            "説明文" * rng.randint(0, 20) or None,
+            rng.choices(statuses, cum_weights=cum_weights)[0],
+            rng.randint(0, 4),
+            due_date,
+            rng.random() < deleted_ratio,
+            created_at,
+            created_at + (created_until - created_at) * rng.random(),
+        )
+
+
+async def _driver_connection(session: AsyncSession) -> Any:
+    """
+    セッションの現在のトランザクションの asyncpg コネクションを返す（内部ヘルパー）。
+
+    コミットするとコネクションはプールに返却されるため、トランザクションごとに取得する。
+    """
+    connection = await session.connection()
+    raw_connection = await connection.get_raw_connection()
+    return raw_connection.driver_connection
+
+
+async def drop_secondary_indexes(session: AsyncSession) -> list[str]:
+    """
+    tasks の制約以外のインデックスを削除し、再作成用の定義を返す。
+
+    大量ロードでは行ごとのインデックス更新（特に全文検索の GIN）より、
+    ロード後の一括作成の方が速い。ロード中は一覧・検索が遅くなるため、
+    他の利用者がいない DB でのみ使用する。
+
+    Args:
+        session: 非同期DBセッション
+
+    Returns:
+        削除したインデックスの CREATE INDEX 文のリスト
+    """
+    result = await session.execute(
+        text(
+            "SELECT i.indexrelid::regclass::text, pg_get_indexdef(i.indexrelid)"
+            " FROM pg_index i"
+            " WHERE i.indrelid = CAST(:table AS regclass)"
+            " AND NOT EXISTS ("
+            "  SELECT 1 FROM pg_constraint c WHERE c.conindid = i.indexrelid"
+            " )"
+        ),
+        {"table": Task.__tablename__},
+    )
+    indexes = result.all()
+    for name, _ in indexes:
+        await session.execute(text(f"DROP INDEX {name}"))
+    await session.commit()
+    return [definition for _, definition in indexes]
+
+
+async def create_indexes(session: AsyncSession, definitions: list[str]) -> None:
+    """
+    drop_secondary_indexes が返した定義からインデックスを再作成する。
+
+    Args:
+        session: 非同期DBセッション
+        definitions: CREATE INDEX 文のリスト
+    """
+    for definition in definitions:
+        logger.info("インデックスを再作成: %s", definition)
+        await session.execute(text(definition))
+        await session.commit()
+
+
+async def delete_projects_by_prefix(session: AsyncSession, name_prefix: str) -> int:
+    """
+    名前が name_prefix で始まるプロジェクトを削除する（タスク・集計は CASCADE）。
+
+    削除した場合はプロジェクト一覧のバージョンも進める。
+
+    Args:
+        session: 非同期DBセッション
+        name_prefix: 削除対象のプロジェクト名の接頭辞
+
+    Returns:
+        削除したプロジェクト数
+    """
+    result = await session.execute(
+        delete(Project)
+        .where(Project.name.startswith(name_prefix, autoescape=True))
+        .returning(Project.id)
+    )
+    deleted = len(result.all())
+    if deleted:
+        await ListVersionRepository(session).touch(Project.__tablename__)
+    await session.commit()
+    return deleted
+
+
+async def generate_dataset(
+    session: AsyncSession,
+    *,
+    projects: int,
+    tasks: int,
+    seed: int,
+    name_prefix: str,
+    zipf_exponent: float = 1.1,
+    status_weights: Mapping[TaskStatus, float] = DEFAULT_STATUS_WEIGHTS,
+    deleted_ratio: float = 0.05,
+    due_ratio: float = 0.7,
+    due_spread_days: int = 60,
+    created_until: datetime = DEFAULT_CREATED_UNTIL,
+    created_span_days: int = 365,
+    chunk_size: int = 50_000,
+    defer_indexes: bool = False,
+    on_progress: Callable[[dict[str, Any]], None] | None = None,
+) -> dict[str, Any]:
+    """
+    合成データセットを生成して COPY でロードし、ANALYZE を実行する。
+
+    同じ接頭辞のプロジェクトが既に存在する場合の扱いは呼び出し側で決めること
+    （delete_projects_by_prefix で削除してから呼び出す）。
+
+    Args:
+        session: 非同期DBセッション
+        projects: プロジェクト数
+        tasks: タスクの総件数（Zipf 分布でプロジェクトに配分）
+        seed: 乱数シード
+        name_prefix: プロジェクト名の接頭辞（名前は接頭辞 + 連番）
+        zipf_exponent: タスク件数の Zipf 分布の指数
+        status_weights: ステータス → 比率
+        deleted_ratio: 論理削除済みにする割合
+        due_ratio: 期限日を設定する割合
+        due_spread_days: 期限日を作成日時から何日後までに分散させるか
+        created_until: 作成日時の終端（タイムゾーンなし、UTC）
+        created_span_days: 作成日時を分散させる日数
+        chunk_size: COPY とコミットの単位となるタスク数
+        defer_indexes: tasks のインデックスをロード後に一括作成するか
+            （drop_secondary_indexes を参照。失敗時も再作成する）
+        on_progress: チャンクのロードごとに呼ばれる進捗コールバック
+
+    Returns:
+        projects, tasks, live_tasks, largest_project を含む辞書
+    """
+    rng = random.Random(seed)
+
+    # --- プロジェクト ---
+    project_records = [
+        (
+            _random_uuid(rng),
+            f"{name_prefix}{number:0{len(str(projects))}d}",
+            None,
+            created_until - timedelta(days=created_span_days),
+            created_until - timedelta(days=created_span_days),
+        )
+        for number in range(1, projects + 1)
+    ]
+    driver_connection = await _driver_connection(session)
+    await driver_connection.copy_records_to_table(
+        Project.__tablename__, records=project_records, columns=PROJECT_COLUMNS
+    )
+    await ListVersionRepository(session).touch(Project.__tablename__)
+    await session.commit()
+    counts = zipf_counts(tasks, projects, zipf_exponent, rng)
+
+    # --- タスク（chunk_size 行ごとに集計の差分と一緒にコミット） ---
+    stats: dict[str, Any] = {
+        "projects": projects,
+        "tasks": 0,
+        "live_tasks": 0,
+        "largest_project": max(counts, default=0),
+    }
+    stats_repository = TaskStatsRepository(session)
+    records: list[tuple[Any, ...]] = []
+    deltas: Counter[StatsKey] = Counter()
+    # チャンクにタスクを含むプロジェクト（タスク一覧のバージョンを進める）
+    touched: set[uuid.UUID] = set()
+
+    async def load() -> None:
+        driver_connection = await _driver_connection(session)
+        await driver_connection.copy_records_to_table(
+            Task.__tablename__, records=records, columns=TASK_COLUMNS
+        )
+        await stats_repository.apply_deltas(deltas, touched=touched)
+        await session.commit()
+        stats["tasks"] += len(records)
+        stats["live_tasks"] += sum(deltas.values())
+        records.clear()
+        deltas.clear()
+        touched.clear()
+        logger.info("合成データ生成進捗: tasks=%d", stats["tasks"])
+        if on_progress is not None:
+            on_progress(dict(stats))
+
+    index_definitions = await drop_secondary_indexes(session) if defer_indexes else []
+    try:
+        for (project_id, *_), count in zip(project_records, counts, strict=True):
+            for record in task_records(
+                project_id,
+                count,
+                rng,
+                status_weights=status_weights,
+                deleted_ratio=deleted_ratio,
+                due_ratio=due_ratio,
+                due_spread_days=due_spread_days,
+                created_until=created_until,
+                created_span_days=created_span_days,
+            ):
+                records.append(record)
+                touched.add(project_id)
+                track_live(
+                    deltas,
+                    project_id,
+                    record[_STATUS_INDEX],
+                    record[_IS_DELETED_INDEX],
+                    1,
+                )
+                if len(records) >= chunk_size:
+                    await load()
+        if records:
+            await load()
+    except BaseException:
+        await session.rollback()
+        raise
+    finally:
+        await create_indexes(session, index_definitions)
+
+    # --- 統計情報の更新（COPY 直後はプランナーの推定値が実データと乖離する） ---
+    for table in (Project, Task, ProjectTaskStats):
+        await session.execute(text(f"ANALYZE {table.__tablename__}"))
+    await session.commit()
+    return stats
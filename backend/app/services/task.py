@@ -2,29 +2,64 @@
 Task サービス層。
 
 タスク操作のビジネスロジック。
-プロジェクトの存在確認を含むバリデーションを提供。
+プロジェクトスコープの単一ステートメント操作と、
+該当なし時のプロジェクト存在確認（404 の切り分け）を提供。
 """
 
+import html
 import uuid
-from typing import Any
+from typing import Any, NoReturn
 
 from fastapi import HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.pagination import CountStrategy
+from app.repositories.base import InvalidCursorError
 from app.repositories.project import ProjectRepository
-from app.repositories.task import TaskRepository
-from app.schemas.task import TaskCreate, TaskUpdate
+from app.repositories.task import TaskRepository, TaskSortKey
+from app.schemas.task import (
+    TaskBulkCreate,
+    TaskBulkDelete,
+    TaskBulkUpdate,
+    TaskCreate,
+    TaskListFilter,
+    TaskUpdate,
+)
+from app.services.coalescing import (
+    coalesce,
+    freeze,
+    task_list_reads,
+    task_list_version_reads,
+)
+
+# ts_headline の一致マーカー（本文に現れない私用領域の文字を使用し、
+# HTML エスケープ後に <mark> へ置き換える）
+_HIGHLIGHT_START = "\ue000"
+_HIGHLIGHT_STOP = "\ue001"
+
+
+def _render_highlight(text: str | None) -> str | None:
+    """ハイライト結果を HTML エスケープし、マーカーを <mark> タグに変換する"""
+    if text is None:
+        return None
+    return (
+        html.escape(text)
+        .replace(_HIGHLIGHT_START, "<mark>")
+        .replace(_HIGHLIGHT_STOP, "</mark>")
+    )
 
 
 class TaskService:
     """
     タスク関連のビジネスロジック。
 
-    タスク操作の前にプロジェクトの存在を確認し、
-    整合性を保証する。
+    単一タスクの操作はプロジェクトIDを条件に含めた1ステートメントで
+    所有確認と処理を同時に行い、該当行がない場合（まれなケース）にのみ
+    プロジェクトの存在を確認して 404 の原因を切り分ける。
     """
 
     def __init__(self, session: AsyncSession) -> None:
+        self.session = session
         self.repository = TaskRepository(session)
         self.project_repository = ProjectRepository(session)
 
@@ -45,13 +80,34 @@ class TaskService:
                 detail=f"プロジェクトが見つかりません: {project_id}",
             )
 
+    async def _raise_not_found(
+        self, project_id: uuid.UUID, task_id: uuid.UUID
+    ) -> NoReturn:
+        """
+        該当行なしだった場合の 404 を送出する（内部ヘルパー）。
+
+        プロジェクト自体が存在しない場合はプロジェクトの 404 を優先する。
+
+        Args:
+            project_id: 所属プロジェクトのUUID
+            task_id: 対象タスクのUUID
+
+        Raises:
+            HTTPException: 常に送出（プロジェクトまたはタスクが見つからない）
+        """
+        await self._ensure_project_exists(project_id)
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"タスクが見つかりません: {task_id}",
+        )
+
     async def create_task(
         self, project_id: uuid.UUID, data: TaskCreate
     ) -> Any:
         """
         新しいタスクを作成する。
 
-        事前にプロジェクトの存在を確認する。
+        プロジェクトの存在は外部キー制約で確認する（INSERT 1往復）。
 
         Args:
             project_id: 所属プロジェクトのUUID
@@ -59,11 +115,17 @@ class TaskService:
 
         Returns:
             作成されたタスクインスタンス
+
+        Raises:
+            HTTPException: プロジェクトが見つからない場合
         """
-        await self._ensure_project_exists(project_id)
-        task_data = data.model_dump()
-        task_data["project_id"] = project_id
-        return await self.repository.create(task_data)
+        task = await self.repository.create_in_project(project_id, data.model_dump())
+        if task is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"プロジェクトが見つかりません: {project_id}",
+            )
+        return task
 
     async def get_task(
         self, project_id: uuid.UUID, task_id: uuid.UUID
@@ -81,15 +143,64 @@ class TaskService:
         Raises:
             HTTPException: タスクが見つからないか、プロジェクトに属していない場合
         """
-        await self._ensure_project_exists(project_id)
-        task = await self.repository.get_by_id(task_id)
-        if task is None or task.project_id != project_id:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"タスクが見つかりません: {task_id}",
-            )
+        task = await self.repository.get_in_project(project_id, task_id)
+        if task is None:
+            await self._raise_not_found(project_id, task_id)
         return task
 
+    async def get_task_version(
+        self, project_id: uuid.UUID, task_id: uuid.UUID
+    ) -> dict[str, Any] | None:
+        """
+        条件付き GET 用のバージョン情報（検証子）を取得する。
+
+        Args:
+            project_id: 所属プロジェクトのUUID
+            task_id: 対象タスクのUUID
+
+        Returns:
+            last_modified, tag を含む辞書。見つからない場合は None
+            （404 の切り分けは通常の取得処理に任せる）
+        """
+        updated_at = await self.repository.get_updated_at_in_project(
+            project_id, task_id
+        )
+        if updated_at is None:
+            return None
+        return {
+            "last_modified": updated_at,
+            "tag": f"{task_id}:{updated_at.isoformat()}",
+        }
+
+    async def get_tasks_version(self, project_id: uuid.UUID) -> dict[str, Any] | None:
+        """
+        条件付き GET 用に、タスク一覧全体のバージョン情報を取得する。
+
+        バージョンは論理削除済みを含むタスクの書き込みのたびに進むため、
+        include_deleted の有無によらず共通（ETag はクエリパラメータで区別する）。
+        同じプロジェクトの同時実行中の呼び出しとは1回のクエリに合流する
+        （一覧の絞り込み条件によらずキーはプロジェクトのみ）。
+
+        Args:
+            project_id: 対象プロジェクトのUUID
+
+        Returns:
+            last_modified, tag を含む辞書。タスクの書き込みが一度もない場合は None
+            （空のプロジェクトと存在しないプロジェクトの区別は通常の取得処理に任せる）
+        """
+
+        async def fetch() -> dict[str, Any] | None:
+            version = await self.repository.get_version_by_project_id(project_id)
+            if version is None:
+                return None
+            last_modified, revision = version
+            return {
+                "last_modified": last_modified,
+                "tag": f"{project_id}:{revision}",
+            }
+
+        return await coalesce(task_list_version_reads, self.session, project_id, fetch)
+
     async def get_tasks(
         self,
         project_id: uuid.UUID,
@@ -97,26 +208,149 @@ class TaskService:
         page: int = 1,
         per_page: int = 20,
         include_deleted: bool = False,
+        count: CountStrategy = "exact",
+        order_by: TaskSortKey = "created_at",
+        filters: TaskListFilter | None = None,
     ) -> dict[str, Any]:
         """
         プロジェクトに属するタスク一覧をページネーション付きで取得する。
 
+        同じ引数（絞り込み条件は正規化して比較）の同時実行中の呼び出しとは
+        1回のクエリに合流し、結果を共有する（app.services.coalescing）。
+
         Args:
             project_id: 対象プロジェクトのUUID
             page: ページ番号
             per_page: 1ページあたりの件数
             include_deleted: 論理削除されたタスクを含めるか
+            count: 総件数の算出戦略
+            order_by: ソートキー
+            filters: 絞り込み条件
 
         Returns:
             ページネーションレスポンス辞書
+
+        Raises:
+            HTTPException: プロジェクトが見つからない場合
         """
-        await self._ensure_project_exists(project_id)
-        return await self.repository.get_by_project_id(
+        conditions = filters.model_dump(exclude_none=True) if filters else None
+
+        async def fetch() -> dict[str, Any]:
+            result = await self.repository.get_by_project_id(
+                project_id,
+                page=page,
+                per_page=per_page,
+                include_deleted=include_deleted,
+                count=count,
+                order_by=order_by,
+                filters=conditions,
+            )
+            # 0件の場合のみ「空のプロジェクト」と「存在しないプロジェクト」を区別する
+            if not result["items"]:
+                await self._ensure_project_exists(project_id)
+            return result
+
+        key = (
             project_id,
+            page,
+            per_page,
+            include_deleted,
+            count,
+            order_by,
+            freeze(conditions or {}),
+        )
+        return await coalesce(task_list_reads, self.session, key, fetch)
+
+    async def get_tasks_by_cursor(
+        self,
+        project_id: uuid.UUID,
+        *,
+        cursor: str | None = None,
+        per_page: int = 20,
+        order_by: TaskSortKey = "created_at",
+        include_deleted: bool = False,
+        filters: TaskListFilter | None = None,
+    ) -> dict[str, Any]:
+        """
+        プロジェクトに属するタスク一覧をカーソル方式で取得する。
+
+        Args:
+            project_id: 対象プロジェクトのUUID
+            cursor: 前ページの next_cursor
+            per_page: 1ページあたりの件数
+            order_by: ソートキー（due_date 系はカーソル方式では使用不可）
+            include_deleted: 論理削除されたタスクを含めるか
+            filters: 絞り込み条件
+
+        Returns:
+            カーソルページネーションレスポンス辞書
+
+        Raises:
+            HTTPException: プロジェクトが見つからない、ソートキーがカーソル方式に
+                対応していない、またはカーソルが不正な場合
+        """
+        if order_by not in TaskRepository.CURSOR_KEYS:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"カーソル方式では使用できないソートキーです: {order_by}",
+            )
+        try:
+            result = await self.repository.get_by_project_id_by_cursor(
+                project_id,
+                cursor=cursor,
+                per_page=per_page,
+                order_by=order_by,
+                include_deleted=include_deleted,
+                filters=filters.model_dump(exclude_none=True) if filters else None,
+            )
+        except InvalidCursorError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="不正なカーソルです",
+            ) from None
+        if not result["items"]:
+            await self._ensure_project_exists(project_id)
+        return result
+
+    async def search_tasks(
+        self,
+        query: str,
+        *,
+        project_id: uuid.UUID | None = None,
+        page: int = 1,
+        per_page: int = 20,
+    ) -> dict[str, Any]:
+        """
+        タスクを全文検索する（未削除タスクのみ）。
+
+        Args:
+            query: 検索語（websearch_to_tsquery 構文）
+            project_id: 指定時はそのプロジェクト内のみを検索
+            page: ページ番号
+            per_page: 1ページあたりの件数
+
+        Returns:
+            ページネーションレスポンス辞書（items は検索ヒットの辞書）
+
+        Raises:
+            HTTPException: 指定されたプロジェクトが見つからない場合
+        """
+        result = await self.repository.search(
+            query,
+            project_id=project_id,
             page=page,
             per_page=per_page,
-            include_deleted=include_deleted,
+            highlight=(_HIGHLIGHT_START, _HIGHLIGHT_STOP),
         )
+        if project_id is not None and not result["items"]:
+            await self._ensure_project_exists(project_id)
+
+        for hit in result["items"]:
+            hit["title_highlight"] = _render_highlight(hit["title_highlight"])
+            hit["description_highlight"] = _render_highlight(
+                hit["description_highlight"]
+            )
+        return result
 
     async def update_task(
         self,
@@ -127,6 +361,8 @@ class TaskService:
         """
         タスクを部分更新する。
 
+        所有確認と更新を UPDATE ... RETURNING の1往復で行う。
+
         Args:
             project_id: 所属プロジェクトのUUID
             task_id: 対象タスクのUUID
@@ -136,17 +372,14 @@ class TaskService:
             更新されたタスクインスタンス
 
         Raises:
-            HTTPException: タスクが見つからない場合
+            HTTPException: プロジェクトまたはタスクが見つからない場合
         """
-        # プロジェクト存在確認 & タスクがそのプロジェクトに属しているか確認
-        await self.get_task(project_id, task_id)
         update_data = data.model_dump(exclude_unset=True)
-        task = await self.repository.update(task_id, update_data)
+        task = await self.repository.update_in_project(
+            project_id, task_id, update_data
+        )
         if task is None:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"タスクが見つかりません: {task_id}",
-            )
+            await self._raise_not_found(project_id, task_id)
         return task
 
     async def delete_task(
@@ -166,19 +399,125 @@ class TaskService:
             project_id: 所属プロジェクトのUUID
             task_id: 対象タスクのUUID
             soft: True=論理削除、False=物理削除
+
+        Raises:
+            HTTPException: プロジェクトまたはタスクが見つからない場合
         """
-        await self.get_task(project_id, task_id)
         if soft:
-            result = await self.repository.soft_delete(task_id)
-            if result is None:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail=f"タスクが見つかりません: {task_id}",
-                )
+            found = (
+                await self.repository.soft_delete_in_project(project_id, task_id)
+                is not None
+            )
         else:
-            deleted = await self.repository.delete(task_id)
-            if not deleted:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail=f"タスクが見つかりません: {task_id}",
-                )
+            found = await self.repository.delete_in_project(project_id, task_id)
+        if not found:
+            await self._raise_not_found(project_id, task_id)
+
+    async def bulk_create_tasks(
+        self, project_id: uuid.UUID, data: TaskBulkCreate
+    ) -> dict[str, Any]:
+        """
+        タスクを一括作成する（複数行 INSERT 1回）。
+
+        Args:
+            project_id: 所属プロジェクトのUUID
+            data: 一括作成リクエストスキーマ
+
+        Returns:
+            results, succeeded, failed を含む辞書
+
+        Raises:
+            HTTPException: プロジェクトが見つからない場合
+        """
+        await self._ensure_project_exists(project_id)
+        tasks = await self.repository.bulk_create_in_project(
+            project_id, [item.model_dump() for item in data.items]
+        )
+        if tasks is None:
+            # 存在確認後にプロジェクトが削除された場合
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"プロジェクトが見つかりません: {project_id}",
+            )
+        results = [
+            {"index": i, "id": task.id, "status": "created", "task": task}
+            for i, task in enumerate(tasks)
+        ]
+        return {"results": results, "succeeded": len(results), "failed": 0}
+
+    async def bulk_update_tasks(
+        self, project_id: uuid.UUID, data: TaskBulkUpdate
+    ) -> dict[str, Any]:
+        """
+        タスクを一括部分更新する（UPDATE ... FROM VALUES、単一トランザクション）。
+
+        Args:
+            project_id: 所属プロジェクトのUUID
+            data: 一括更新リクエストスキーマ
+
+        Returns:
+            results, succeeded, failed を含む辞書
+
+        Raises:
+            HTTPException: プロジェクトが見つからない場合
+        """
+        await self._ensure_project_exists(project_id)
+        items = [
+            (item.id, item.model_dump(exclude_unset=True, exclude={"id"}))
+            for item in data.items
+        ]
+        updated = await self.repository.bulk_update_in_project(project_id, items)
+
+        results = []
+        for i, (task_id, _) in enumerate(items):
+            task = updated.get(task_id)
+            results.append(
+                {
+                    "index": i,
+                    "id": task_id,
+                    "status": "updated" if task is not None else "not_found",
+                    "task": task,
+                }
+            )
+        return {
+            "results": results,
+            "succeeded": len(updated),
+            "failed": len(results) - len(updated),
+        }
+
+    async def bulk_delete_tasks(
+        self, project_id: uuid.UUID, data: TaskBulkDelete
+    ) -> dict[str, Any]:
+        """
+        タスクを ID リストで一括削除する（1ステートメント）。
+
+        Args:
+            project_id: 所属プロジェクトのUUID
+            data: 一括削除リクエストスキーマ
+
+        Returns:
+            results, succeeded, failed を含む辞書
+
+        Raises:
+            HTTPException: プロジェクトが見つからない場合
+        """
+        await self._ensure_project_exists(project_id)
+        deleted = await self.repository.bulk_delete_in_project(
+            project_id, data.ids, soft=data.soft
+        )
+
+        results = [
+            {
+                "index": i,
+                "id": task_id,
+                "status": "deleted" if task_id in deleted else "not_found",
+                "task": None,
+            }
+            for i, task_id in enumerate(data.ids)
+        ]
+        succeeded = sum(1 for r in results if r["status"] == "deleted")
+        return {
+            "results": results,
+            "succeeded": succeeded,
+            "failed": len(results) - succeeded,
+        }
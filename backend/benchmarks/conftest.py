@@ -0,0 +1,225 @@
+"""
+DB ベンチマーク共通のフィクスチャ。
+
+ローカルの PostgreSQL（settings.DATABASE_URL）に、タスク件数の異なる
+ベンチマーク専用プロジェクト（benchmark-dataset-<サイズ>）を COPY で投入し、
+実行をまたいで再利用する。件数が一致しない場合（中断した実行の後など）は
+投入し直す。DB に接続できない場合、DB を使うベンチマークはスキップする。
+
+pytest-benchmark は同期関数を計測するため、非同期のリポジトリ呼び出しは
+セッション単位のイベントループ上で run_until_complete して計測する。
+
+オプション:
+    --dataset-sizes: 使用するデータセット（1k / 100k / 1m のカンマ区切り、既定 1k）
+    --reseed: 件数が一致していてもデータセットを投入し直す
+"""
+
+import asyncio
+import itertools
+import random
+import uuid
+from collections.abc import Awaitable, Callable, Iterator
+from dataclasses import dataclass
+from typing import Any
+
+import pytest
+from sqlalchemy import delete, func, select, text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+
+from app.core.config import settings
+from app.models.project import Project
+from app.models.task import Task
+from app.repositories.stats import TaskStatsRepository
+from app.services.synthetic import TASK_COLUMNS, task_records
+
+# データセット名 → タスク件数
+DATASET_SIZES = {"1k": 1_000, "100k": 100_000, "1m": 1_000_000}
+
+# データセットのプロジェクト名の接頭辞
+DATASET_PREFIX = "benchmark-dataset-"
+
+# 生成データの乱数シード（同じサイズなら毎回同じ内容になる）
+SEED = 20240501
+
+# COPY 1回あたりの行数
+_COPY_CHUNK = 10_000
+
+# get / update で使用するタスクIDの件数
+_SAMPLE_SIZE = 1_000
+
+
+@dataclass(frozen=True)
+class Dataset:
+    """
+    投入済みのベンチマーク用データセット。
+
+    属性:
+        label: データセット名（1k / 100k / 1m）
+        project_id: データセットのプロジェクトUUID
+        size: タスク件数
+        task_ids: 未削除タスクのIDの無作為サンプル
+    """
+
+    label: str
+    project_id: uuid.UUID
+    size: int
+    task_ids: list[uuid.UUID]
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    group = parser.getgroup("benchmark-datasets")
+    group.addoption(
+        "--dataset-sizes",
+        default="1k",
+        help="使用するデータセット（1k,100k,1m のカンマ区切り、既定: 1k）",
+    )
+    group.addoption(
+        "--reseed",
+        action="store_true",
+        default=False,
+        help="件数が一致していてもデータセットを投入し直す",
+    )
+
+
+def pytest_generate_tests(metafunc: pytest.Metafunc) -> None:
+    """dataset フィクスチャを使うベンチマークを --dataset-sizes で展開する"""
+    if "dataset" not in metafunc.fixturenames:
+        return
+    labels = [
+        label.strip().lower()
+        for label in metafunc.config.getoption("--dataset-sizes").split(",")
+        if label.strip()
+    ]
+    unknown = sorted(set(labels) - DATASET_SIZES.keys())
+    if unknown:
+        raise pytest.UsageError(
+            f"不明なデータセット: {', '.join(unknown)}"
+            f"（{', '.join(DATASET_SIZES)} から選択）"
+        )
+    metafunc.parametrize("dataset", labels, indirect=True, scope="session")
+
+
+@pytest.fixture(scope="session")
+def event_loop_runner() -> Iterator[Callable[[Awaitable[Any]], Any]]:
+    """コルーチンを完了まで実行する関数（セッション単位のイベントループ）"""
+    loop = asyncio.new_event_loop()
+    yield loop.run_until_complete
+    loop.close()
+
+
+@pytest.fixture(scope="session")
+def engine(
+    event_loop_runner: Callable[[Awaitable[Any]], Any],
+) -> Iterator[AsyncEngine]:
+    """
+    ベンチマーク用エンジン。
+
+    アプリのエンジンと異なりメトリクス・クエリ計測のフックを登録しないため、
+    リポジトリと DB 自体のコストを計測する。
+    """
+    bench_engine = create_async_engine(settings.DATABASE_URL, pool_size=2)
+
+    async def ping() -> None:
+        async with bench_engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    try:
+        event_loop_runner(ping())
+    except (OperationalError, OSError) as e:
+        event_loop_runner(bench_engine.dispose())
+        pytest.skip(f"PostgreSQL に接続できません: {e}")
+    yield bench_engine
+    event_loop_runner(bench_engine.dispose())
+
+
+@pytest.fixture(scope="session")
+def session_factory(engine: AsyncEngine) -> async_sessionmaker[AsyncSession]:
+    """アプリと同じ設定のセッションファクトリ"""
+    return async_sessionmaker(
+        bind=engine,
+        class_=AsyncSession,
+        expire_on_commit=False,
+        autocommit=False,
+        autoflush=False,
+    )
+
+
+@pytest.fixture
+def session(
+    session_factory: async_sessionmaker[AsyncSession],
+    event_loop_runner: Callable[[Awaitable[Any]], Any],
+) -> Iterator[AsyncSession]:
+    """ベンチマーク1件分のセッション"""
+    bench_session = session_factory()
+    yield bench_session
+    event_loop_runner(bench_session.close())
+
+
+async def _seed(session: AsyncSession, label: str, size: int, reseed: bool) -> Dataset:
+    """データセットを投入（件数が一致すれば再利用）し、IDのサンプルを返す"""
+    name = f"{DATASET_PREFIX}{label}"
+    project_id = await session.scalar(select(Project.id).where(Project.name == name))
+    if project_id is not None:
+        existing = await session.scalar(
+            select(func.count()).select_from(Task).where(Task.project_id == project_id)
+        )
+        if reseed or existing != size:
+            await session.execute(delete(Project).where(Project.id == project_id))
+            await session.commit()
+            project_id = None
+
+    if project_id is None:
+        project = Project(name=name, description=f"ベンチマーク用 ({size} 件)")
+        session.add(project)
+        await session.flush()
+        project_id = project.id
+
+        connection = await session.connection()
+        raw_connection = await connection.get_raw_connection()
+        driver_connection: Any = raw_connection.driver_connection
+        records = task_records(project_id, size, random.Random(f"{SEED}-{size}"))
+        while chunk := list(itertools.islice(records, _COPY_CHUNK)):
+            await driver_connection.copy_records_to_table(
+                Task.__tablename__, records=chunk, columns=TASK_COLUMNS
+            )
+        # COPY はリポジトリを経由しないため、集計はタスクから再計算する
+        await TaskStatsRepository(session).repair(project_id)
+        await session.execute(text(f"ANALYZE {Task.__tablename__}"))
+
+    sample = await session.scalars(
+        select(Task.id)
+        .where(Task.project_id == project_id, Task.is_deleted.is_(False))
+        .order_by(func.random())
+        .limit(_SAMPLE_SIZE)
+    )
+    task_ids = list(sample)
+    await session.commit()
+    return Dataset(label=label, project_id=project_id, size=size, task_ids=task_ids)
+
+
+@pytest.fixture(scope="session")
+def dataset(
+    request: pytest.FixtureRequest,
+    session_factory: async_sessionmaker[AsyncSession],
+    event_loop_runner: Callable[[Awaitable[Any]], Any],
+) -> Dataset:
+    """--dataset-sizes で指定したサイズのデータセット（間接パラメータ）"""
+    label: str = request.param
+
+    async def seed() -> Dataset:
+        async with session_factory() as seed_session:
+            return await _seed(
+                seed_session,
+                label,
+                DATASET_SIZES[label],
+                request.config.getoption("--reseed"),
+            )
+
+    result: Dataset = event_loop_runner(seed())
+    return result
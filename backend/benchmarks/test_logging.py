@@ -0,0 +1,203 @@
+"""
+ロギングの性能ベンチマーク。
+
+呼び出し元（イベントループ）でハンドラが直接出力する従来の同期ハンドラと、
+キューに入れるだけでフォーマット・出力をバックグラウンドスレッドで行う
+パイプライン（app.core.log.create_queue_pipeline）を比較する。DB には接続しない。
+
+- ログ出力のスループット: 1,000 件のログ呼び出しにかかる呼び出し元の時間
+- イベントループの停止時間: 書き込みの遅い出力先（1件あたり約1ミリ秒）に
+  ログを出しながら、1ミリ秒ごとに起きるタスクの遅れの最大値を計測する
+  （extra_info の max_stall_ms に記録する）
+
+実行例:
+    pytest benchmarks/test_logging.py --benchmark-only
+"""
+
+import asyncio
+import io
+import logging
+import time
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from app.core.log import JsonFormatter, create_queue_pipeline
+
+RECORDS_PER_ROUND = 1_000
+
+# イベントループの停止時間の計測条件
+_TICK_SECONDS = 0.001
+_BURSTS = 20
+_RECORDS_PER_BURST = 10
+_SLOW_WRITE_SECONDS = 0.001
+
+
+class _SlowStream(io.StringIO):
+    """書き込みのたびに一定時間ブロックする出力先（詰まった標準出力の代わり）"""
+
+    def write(self, s: str) -> int:
+        time.sleep(_SLOW_WRITE_SECONDS)
+        return super().write(s)
+
+
+def _text_formatter() -> logging.Formatter:
+    """テキスト形式のフォーマッタ（setup_logging と同じ形式）"""
+    return logging.Formatter(
+        "%(asctime)s | %(levelname)-8s | %(name)s | %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S",
+    )
+
+
+def _make_logger(name: str, handler: logging.Handler) -> logging.Logger:
+    """ハンドラを1つだけ持つベンチマーク用ロガー"""
+    logger = logging.getLogger(f"benchmark.{name}")
+    logger.handlers.clear()
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    return logger
+
+
+def _log_request(logger: logging.Logger, i: int) -> None:
+    """リクエストログ相当の1件を出力する"""
+    logger.info(
+        "GET %s status=%d duration_ms=%.1f",
+        "/api/v1/projects/{project_id}/tasks",
+        200,
+        12.3,
+        extra={"status": 200, "duration_ms": 12.3, "db_queries": 2, "seq": i},
+    )
+
+
+@pytest.fixture(params=["text", "json"])
+def formatter(request: pytest.FixtureRequest) -> logging.Formatter:
+    """出力形式ごとのフォーマッタ"""
+    return JsonFormatter() if request.param == "json" else _text_formatter()
+
+
+@pytest.fixture
+def file_handler(
+    tmp_path: Path, formatter: logging.Formatter
+) -> Iterator[logging.Handler]:
+    """一時ファイルに書き込むハンドラ"""
+    stream = (tmp_path / "app.log").open("w", encoding="utf-8")
+    handler = logging.StreamHandler(stream)
+    handler.setFormatter(formatter)
+    yield handler
+    stream.close()
+
+
+@pytest.mark.benchmark(group="log-1000-records")
+def test_sync_handler_throughput(benchmark: Any, file_handler: logging.Handler) -> None:
+    """同期ハンドラ: 呼び出し元でフォーマットと書き込みを行う"""
+    logger = _make_logger("sync", file_handler)
+
+    def run() -> None:
+        for i in range(RECORDS_PER_ROUND):
+            _log_request(logger, i)
+
+    benchmark(run)
+
+
+@pytest.mark.benchmark(group="log-1000-records")
+def test_queue_pipeline_throughput(
+    benchmark: Any, file_handler: logging.Handler
+) -> None:
+    """キュー経由: 呼び出し元はキューに入れるだけ（ラウンドごとに出力完了を待つ）"""
+    queue_handler, listener = create_queue_pipeline(
+        file_handler, queue_size=RECORDS_PER_ROUND * 10
+    )
+    logger = _make_logger("queue", queue_handler)
+    listener.start()
+
+    def run() -> None:
+        for i in range(RECORDS_PER_ROUND):
+            _log_request(logger, i)
+
+    def drain() -> None:
+        # 前のラウンドの出力が残ったまま次のラウンドを計測しない
+        queue_handler.queue.join()  # type: ignore[attr-defined]
+
+    try:
+        benchmark.pedantic(run, setup=drain, rounds=50, iterations=1)
+    finally:
+        listener.stop()
+
+
+async def _max_stall(logger: logging.Logger) -> float:
+    """
+    ログを出力しながら、1ミリ秒ごとに起きるタスクの遅れの最大値を計測する。
+
+    Returns:
+        最大の遅れ（秒）
+    """
+    max_stall = 0.0
+    done = asyncio.Event()
+
+    async def ticker() -> None:
+        nonlocal max_stall
+        while not done.is_set():
+            expected = time.perf_counter() + _TICK_SECONDS
+            await asyncio.sleep(_TICK_SECONDS)
+            max_stall = max(max_stall, time.perf_counter() - expected)
+
+    task = asyncio.create_task(ticker())
+    await asyncio.sleep(_TICK_SECONDS * 5)
+    for burst in range(_BURSTS):
+        for i in range(_RECORDS_PER_BURST):
+            _log_request(logger, burst * _RECORDS_PER_BURST + i)
+        await asyncio.sleep(_TICK_SECONDS * 2)
+    done.set()
+    await task
+    return max_stall
+
+
+def _measure_stall(benchmark: Any, logger: logging.Logger) -> float:
+    """停止時間の計測を繰り返し、最大値を extra_info に記録する"""
+    stalls: list[float] = []
+
+    def run() -> None:
+        stalls.append(asyncio.run(_max_stall(logger)))
+
+    benchmark.pedantic(run, rounds=3, iterations=1)
+    benchmark.extra_info["max_stall_ms"] = round(max(stalls) * 1000, 2)
+    return max(stalls)
+
+
+@pytest.fixture(scope="module")
+def stall_results() -> dict[str, float]:
+    """パイプラインごとの最大停止時間（秒。比較テスト用）"""
+    return {}
+
+
+@pytest.mark.benchmark(group="event-loop-stall")
+def test_sync_handler_stall(benchmark: Any, stall_results: dict[str, float]) -> None:
+    """同期ハンドラ: 出力先の遅さがそのままイベントループを止める"""
+    handler = logging.StreamHandler(_SlowStream())
+    handler.setFormatter(JsonFormatter())
+    stall_results["sync"] = _measure_stall(benchmark, _make_logger("sync", handler))
+
+
+@pytest.mark.benchmark(group="event-loop-stall")
+def test_queue_pipeline_stall(benchmark: Any, stall_results: dict[str, float]) -> None:
+    """キュー経由: 出力先が遅くてもイベントループは止まらない"""
+    handler = logging.StreamHandler(_SlowStream())
+    handler.setFormatter(JsonFormatter())
+    queue_handler, listener = create_queue_pipeline(handler, queue_size=10_000)
+    listener.start()
+    try:
+        stall_results["queue"] = _measure_stall(
+            benchmark, _make_logger("queue", queue_handler)
+        )
+    finally:
+        listener.stop()
+
+
+def test_queue_pipeline_stalls_less(stall_results: dict[str, float]) -> None:
+    """キュー経由の最大停止時間が同期ハンドラより短いこと"""
+    if {"sync", "queue"} - stall_results.keys():
+        pytest.skip("停止時間のベンチマークが実行されていません")
+    assert stall_results["queue"] < stall_results["sync"]
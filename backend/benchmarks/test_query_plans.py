@@ -0,0 +1,263 @@
+"""
+タスク一覧のクエリプランのテスト（PostgreSQL を使用）。
+
+conftest.py が投入したデータセットに対して TaskRepository が発行する一覧のクエリを
+記録して EXPLAIN し、フィルタ・ソートキーごとに想定した複合インデックスの
+インデックススキャンが使われることを確認する。件数のクエリについては、
+未削除タスクの部分インデックスだけで数えられること（論理削除フラグを行ごとに
+判定しないこと）を確認する。計測は行わない。
+
+実行例:
+    pytest benchmarks/test_query_plans.py --dataset-sizes 1k,100k
+"""
+
+import json
+from collections.abc import Awaitable, Callable, Iterator, Mapping
+from contextlib import contextmanager
+from datetime import UTC, datetime
+from typing import Any
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from app.models.task import TaskStatus
+from app.repositories.task import TaskRepository, TaskSortKey
+from benchmarks.conftest import Dataset
+
+Runner = Callable[[Awaitable[Any]], Any]
+
+# インデックスを使うスキャンのノード種別
+INDEX_SCAN_NODES = frozenset({"Index Scan", "Index Only Scan", "Bitmap Index Scan"})
+
+# 未削除タスクの部分インデックス名の接頭辞（app.models.task の __table_args__）
+LIVE_INDEX_PREFIX = "ix_tasks_live_"
+
+# 合成データの作成日時の範囲内（app.services.synthetic.DEFAULT_CREATED_UNTIL の1か月前）
+_RECENT = datetime(2024, 12, 1)
+
+# (ソートキー, 絞り込み条件, 使われるべきインデックス)
+LIST_CASES: list[tuple[TaskSortKey, dict[str, Any], str]] = [
+    ("created_at", {}, "ix_tasks_live_project_id_created_at_id"),
+    ("-created_at", {}, "ix_tasks_live_project_id_created_at_id"),
+    ("priority", {}, "ix_tasks_live_project_id_priority_id"),
+    ("-priority", {}, "ix_tasks_live_project_id_priority_id"),
+    ("due_date", {}, "ix_tasks_live_project_id_due_date_id"),
+    ("-due_date", {}, "ix_tasks_live_project_id_due_date_id"),
+    ("updated_at", {}, "ix_tasks_live_project_id_updated_at_id"),
+    ("-updated_at", {}, "ix_tasks_live_project_id_updated_at_id"),
+    (
+        "-priority",
+        {"status": [TaskStatus.TODO]},
+        "ix_tasks_live_project_id_status_priority_id",
+    ),
+    (
+        "priority",
+        {"status": [TaskStatus.IN_PROGRESS]},
+        "ix_tasks_live_project_id_status_priority_id",
+    ),
+    (
+        "priority",
+        {"priority_min": 3, "priority_max": 4},
+        "ix_tasks_live_project_id_priority_id",
+    ),
+    (
+        "due_date",
+        {
+            "due_from": _RECENT.replace(tzinfo=UTC),
+            "due_to": datetime(2025, 1, 15, tzinfo=UTC),
+        },
+        "ix_tasks_live_project_id_due_date_id",
+    ),
+    (
+        "-created_at",
+        {"created_since": _RECENT},
+        "ix_tasks_live_project_id_created_at_id",
+    ),
+    (
+        "-updated_at",
+        {"updated_since": _RECENT},
+        "ix_tasks_live_project_id_updated_at_id",
+    ),
+]
+
+
+@contextmanager
+def recorded_selects(engine: AsyncEngine) -> Iterator[list[tuple[str, Any]]]:
+    """エンジンが発行した SELECT 文とパラメータを記録する"""
+    statements: list[tuple[str, Any]] = []
+
+    def record(
+        conn: Any,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: Any,
+        executemany: bool,
+    ) -> None:
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, parameters))
+
+    event.listen(engine.sync_engine, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", record)
+
+
+async def explain(session: AsyncSession, statement: str, parameters: Any) -> Any:
+    """記録した文をドライバで直接 EXPLAIN し、プランの JSON を返す"""
+    connection = await session.connection()
+    raw_connection = await connection.get_raw_connection()
+    driver_connection: Any = raw_connection.driver_connection
+    # SQLAlchemy の asyncpg 方言は json 型のデコーダを登録済みのため、結果はリスト
+    plan = await driver_connection.fetchval(
+        f"EXPLAIN (FORMAT JSON) {statement}", *(parameters or ())
+    )
+    return plan[0]["Plan"]
+
+
+def plan_nodes(plan: Mapping[str, Any]) -> Iterator[Mapping[str, Any]]:
+    """プランのノードを深さ優先で列挙する"""
+    yield plan
+    for child in plan.get("Plans", ()):
+        yield from plan_nodes(child)
+
+
+def index_scans(plan: Mapping[str, Any]) -> set[str]:
+    """プラン中でインデックススキャンに使われたインデックス名"""
+    return {
+        node["Index Name"]
+        for node in plan_nodes(plan)
+        if node["Node Type"] in INDEX_SCAN_NODES
+    }
+
+
+def row_filters(plan: Mapping[str, Any]) -> list[str]:
+    """プラン中で行ごとに評価される条件（インデックス条件以外）"""
+    return [node["Filter"] for node in plan_nodes(plan) if "Filter" in node]
+
+
+async def list_plans(
+    engine: AsyncEngine,
+    session: AsyncSession,
+    call: Callable[[], Awaitable[Any]],
+) -> list[Any]:
+    """リポジトリ呼び出しが発行した SELECT ごとのプラン"""
+    with recorded_selects(engine) as statements:
+        await call()
+    return [await explain(session, *recorded) for recorded in statements]
+
+
+@pytest.mark.parametrize(
+    ("order_by", "filters", "index_name"),
+    LIST_CASES,
+    ids=[
+        f"{order_by}-{'+'.join(filters) or 'all'}"
+        for order_by, filters, _ in LIST_CASES
+    ],
+)
+def test_list_uses_index(
+    event_loop_runner: Runner,
+    engine: AsyncEngine,
+    session: AsyncSession,
+    dataset: Dataset,
+    order_by: TaskSortKey,
+    filters: dict[str, Any],
+    index_name: str,
+) -> None:
+    """オフセット方式の一覧: ソートキーと絞り込みに対応するインデックスを使う"""
+    repository = TaskRepository(session)
+    plans = event_loop_runner(
+        list_plans(
+            engine,
+            session,
+            lambda: repository.get_by_project_id(
+                dataset.project_id, order_by=order_by, filters=filters, count="none"
+            ),
+        )
+    )
+    assert len(plans) == 1
+    assert index_name in index_scans(plans[0]), json.dumps(plans[0], indent=2)
+
+
+@pytest.mark.parametrize("order_by", sorted(TaskRepository.CURSOR_KEYS))
+def test_cursor_page_uses_index(
+    event_loop_runner: Runner,
+    engine: AsyncEngine,
+    session: AsyncSession,
+    dataset: Dataset,
+    order_by: TaskSortKey,
+) -> None:
+    """カーソル方式の2ページ目: キー列の複合インデックスでシークする"""
+    repository = TaskRepository(session)
+    first = event_loop_runner(
+        repository.get_by_project_id_by_cursor(dataset.project_id, order_by=order_by)
+    )
+    plans = event_loop_runner(
+        list_plans(
+            engine,
+            session,
+            lambda: repository.get_by_project_id_by_cursor(
+                dataset.project_id, order_by=order_by, cursor=first["next_cursor"]
+            ),
+        )
+    )
+    index_name = next(name for key, _, name in LIST_CASES if key == order_by)
+    assert len(plans) == 1
+    assert index_name in index_scans(plans[0]), json.dumps(plans[0], indent=2)
+
+
+@pytest.mark.parametrize(
+    "filters",
+    [{}, {"status": [TaskStatus.DONE]}],
+    ids=["all", "status"],
+)
+def test_count_uses_partial_index(
+    event_loop_runner: Runner,
+    engine: AsyncEngine,
+    session: AsyncSession,
+    dataset: Dataset,
+    filters: dict[str, Any],
+) -> None:
+    """未削除タスクの件数: 部分インデックスで数え、is_deleted を行ごとに判定しない"""
+    repository = TaskRepository(session)
+    plans = event_loop_runner(
+        list_plans(
+            engine,
+            session,
+            lambda: repository.get_by_project_id(
+                dataset.project_id, filters=filters, count="exact"
+            ),
+        )
+    )
+    count_plans = [plan for plan in plans if plan["Node Type"] == "Aggregate"]
+    assert len(count_plans) == 1
+    count_plan = count_plans[0]
+    scans = index_scans(count_plan)
+    assert scans, json.dumps(count_plan, indent=2)
+    assert all(name.startswith(LIVE_INDEX_PREFIX) for name in scans), scans
+    assert not any("is_deleted" in f for f in row_filters(count_plan))
+
+
+def test_include_deleted_skips_partial_indexes(
+    event_loop_runner: Runner,
+    engine: AsyncEngine,
+    session: AsyncSession,
+    dataset: Dataset,
+) -> None:
+    """論理削除済みを含む一覧と件数: 部分インデックスの述語に一致しないため使わない"""
+    repository = TaskRepository(session)
+    plans = event_loop_runner(
+        list_plans(
+            engine,
+            session,
+            lambda: repository.get_by_project_id(
+                dataset.project_id, include_deleted=True, count="exact"
+            ),
+        )
+    )
+    assert len(plans) == 2
+    for plan in plans:
+        scans = index_scans(plan)
+        assert not any(name.startswith(LIVE_INDEX_PREFIX) for name in scans), scans
@@ -0,0 +1,209 @@
+"""
+タスクのリポジトリ操作とシリアライズのベンチマーク（PostgreSQL を使用）。
+
+conftest.py が投入したデータセット（1k / 100k / 1m 件）ごとに、
+作成・ID取得・一覧（先頭ページ / 深いオフセット）・更新・論理削除と、
+DB から取得した1ページ分の TaskRead シリアライズを計測する。
+作成・論理削除したタスクは計測後に元に戻し、データセットの件数を保つ。
+
+一覧は総件数の算出戦略ごとに計測する。count=exact は毎回 COUNT(*) を実行し、
+count=cached は件数キャッシュ（COUNT_CACHE_TTL_SECONDS）を経由するため
+2回目以降の COUNT(*) は省略される。
+
+実行例:
+    pytest benchmarks/test_repositories.py --benchmark-only
+    pytest benchmarks/test_repositories.py --benchmark-only \\
+        --dataset-sizes 1k,100k,1m --benchmark-autosave
+    pytest-benchmark compare --group-by group,param
+"""
+
+import itertools
+import uuid
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.responses import PydanticJSONResponse
+from app.core.pagination import CountStrategy
+from app.models.task import TaskStatus
+from app.repositories.task import TaskRepository
+from app.schemas.common import PaginatedResponse
+from app.schemas.task import TaskRead
+from benchmarks.conftest import Dataset
+
+# 一覧の1ページあたりの件数（API の既定値）
+PER_PAGE = 20
+
+# シリアライズを計測する1ページの件数
+SERIALIZE_PER_PAGE = 100
+
+# 一覧の計測で比較する総件数の算出戦略
+LIST_COUNT_STRATEGIES = ["exact", "cached"]
+
+# 論理削除の計測回数（対象タスクはサンプルから重複なく選ぶ）
+SOFT_DELETE_ROUNDS = 200
+
+Runner = Callable[[Awaitable[Any]], Any]
+
+
+@pytest.fixture
+def repository(session: AsyncSession) -> TaskRepository:
+    return TaskRepository(session)
+
+
+@pytest.mark.benchmark(group="task-create")
+def test_create(
+    benchmark: Any,
+    event_loop_runner: Runner,
+    repository: TaskRepository,
+    dataset: Dataset,
+) -> None:
+    """INSERT ... RETURNING と集計の差分更新（1件あたり）"""
+    created: list[uuid.UUID] = []
+    counter = itertools.count()
+
+    def create() -> None:
+        task = event_loop_runner(
+            repository.create_in_project(
+                dataset.project_id,
+                {
+                    "title": f"ベンチマーク作成 {next(counter)}",
+                    "status": TaskStatus.TODO,
+                    "priority": 2,
+                },
+            )
+        )
+        created.append(task.id)
+
+    try:
+        benchmark(create)
+    finally:
+        if created:
+            event_loop_runner(
+                repository.bulk_delete_in_project(
+                    dataset.project_id, created, soft=False
+                )
+            )
+
+
+@pytest.mark.benchmark(group="task-get-by-id")
+def test_get_by_id(
+    benchmark: Any,
+    event_loop_runner: Runner,
+    repository: TaskRepository,
+    dataset: Dataset,
+) -> None:
+    """主キーによる1件取得"""
+    task_ids = itertools.cycle(dataset.task_ids)
+    benchmark(lambda: event_loop_runner(repository.get_by_id(next(task_ids))))
+
+
+@pytest.mark.benchmark(group="task-list-shallow")
+@pytest.mark.parametrize("count", LIST_COUNT_STRATEGIES)
+def test_list_first_page(
+    benchmark: Any,
+    event_loop_runner: Runner,
+    repository: TaskRepository,
+    dataset: Dataset,
+    count: CountStrategy,
+) -> None:
+    """一覧の先頭ページ（created_at 順）"""
+    benchmark(
+        lambda: event_loop_runner(
+            repository.get_by_project_id(
+                dataset.project_id, per_page=PER_PAGE, count=count
+            )
+        )
+    )
+
+
+@pytest.mark.benchmark(group="task-list-deep")
+@pytest.mark.parametrize("count", LIST_COUNT_STRATEGIES)
+def test_list_deep_offset(
+    benchmark: Any,
+    event_loop_runner: Runner,
+    repository: TaskRepository,
+    dataset: Dataset,
+    count: CountStrategy,
+) -> None:
+    """一覧の深いページ（全体の 90% の位置までオフセットで読み飛ばす）"""
+    page = max(dataset.size * 9 // 10 // PER_PAGE, 1)
+    benchmark(
+        lambda: event_loop_runner(
+            repository.get_by_project_id(
+                dataset.project_id, page=page, per_page=PER_PAGE, count=count
+            )
+        )
+    )
+
+
+@pytest.mark.benchmark(group="task-update")
+def test_update(
+    benchmark: Any,
+    event_loop_runner: Runner,
+    repository: TaskRepository,
+    dataset: Dataset,
+) -> None:
+    """UPDATE ... RETURNING（集計に影響しない項目の更新）"""
+    task_ids = itertools.cycle(dataset.task_ids)
+    priorities = itertools.cycle(range(5))
+    benchmark(
+        lambda: event_loop_runner(
+            repository.update_in_project(
+                dataset.project_id, next(task_ids), {"priority": next(priorities)}
+            )
+        )
+    )
+
+
+@pytest.mark.benchmark(group="task-soft-delete")
+def test_soft_delete(
+    benchmark: Any,
+    event_loop_runner: Runner,
+    repository: TaskRepository,
+    dataset: Dataset,
+) -> None:
+    """行ロック付きの論理削除と集計の差分更新（毎回別のタスク）"""
+    rounds = min(SOFT_DELETE_ROUNDS, len(dataset.task_ids))
+    task_ids = iter(dataset.task_ids[:rounds])
+    deleted: list[uuid.UUID] = []
+
+    def setup() -> tuple[tuple[uuid.UUID], dict[str, Any]]:
+        return (next(task_ids),), {}
+
+    def soft_delete(task_id: uuid.UUID) -> None:
+        event_loop_runner(
+            repository.soft_delete_in_project(dataset.project_id, task_id)
+        )
+        deleted.append(task_id)
+
+    try:
+        benchmark.pedantic(soft_delete, setup=setup, rounds=rounds)
+    finally:
+        for task_id in deleted:
+            event_loop_runner(
+                repository.update_in_project(
+                    dataset.project_id, task_id, {"is_deleted": False}
+                )
+            )
+
+
+@pytest.mark.benchmark(group="task-serialize-page")
+def test_serialize_page(
+    benchmark: Any,
+    event_loop_runner: Runner,
+    repository: TaskRepository,
+    dataset: Dataset,
+) -> None:
+    """DB から取得した1ページ（100件）の TaskRead 検証と JSON 化"""
+    result = event_loop_runner(
+        repository.get_by_project_id(dataset.project_id, per_page=SERIALIZE_PER_PAGE)
+    )
+
+    def serialize() -> bytes:
+        model = PaginatedResponse[TaskRead].model_validate(result)
+        return PydanticJSONResponse(model).body
+
+    benchmark(serialize)
@@ -0,0 +1,103 @@
+"""
+一覧レスポンスのシリアライズ性能ベンチマーク。
+
+100件の TaskRead を含む PaginatedResponse について、
+FastAPI の従来経路（モデル構築 → response_model で再検証 → 標準 json で
+エンコード）と、PydanticJSONResponse による高速経路（一度だけ検証 →
+pydantic-core で直接バイト列化）を比較する。DB には接続しない。
+
+実行例:
+    pytest benchmarks/test_serialization.py --benchmark-only
+"""
+
+import json
+import uuid
+from datetime import UTC, datetime
+from typing import Any
+
+import pytest
+from pydantic import TypeAdapter
+
+from app.api.responses import PydanticJSONResponse
+from app.models.task import Task, TaskStatus
+from app.schemas.common import PaginatedResponse
+from app.schemas.task import TaskRead
+
+ITEMS_PER_PAGE = 100
+
+_ADAPTER = TypeAdapter(PaginatedResponse[TaskRead])
+
+
+@pytest.fixture(scope="module")
+def page_result() -> dict[str, Any]:
+    """リポジトリが返す形式の1ページ分の結果（ORM インスタンス100件）"""
+    now = datetime.now(UTC)
+    project_id = uuid.uuid4()
+    items = [
+        Task(
+            id=uuid.uuid4(),
+            project_id=project_id,
+            title=f"ベンチマーク用タスク {i}",
+            description="説明文" * 10,
+            status=TaskStatus.TODO,
+            priority=i % 5,
+            due_date=now,
+            is_deleted=False,
+            created_at=now,
+            updated_at=now,
+        )
+        for i in range(ITEMS_PER_PAGE)
+    ]
+    return {
+        "items": items,
+        "total": 1000,
+        "page": 1,
+        "per_page": ITEMS_PER_PAGE,
+        "pages": 10,
+        "has_more": True,
+        "count_strategy": "exact",
+    }
+
+
+def _standard_path(result: dict[str, Any]) -> bytes:
+    """従来経路: 要素ごとに検証 → response_model で再検証 → 標準 json でエンコード"""
+    model = PaginatedResponse[TaskRead](
+        items=[TaskRead.model_validate(t) for t in result["items"]],
+        total=result["total"],
+        page=result["page"],
+        per_page=result["per_page"],
+        pages=result["pages"],
+        has_more=result["has_more"],
+        count_strategy=result["count_strategy"],
+    )
+    # FastAPI の serialize_response 相当（dict 化 → 再検証 → JSON 互換化）
+    revalidated = _ADAPTER.validate_python(model.model_dump())
+    content = _ADAPTER.dump_python(revalidated, mode="json")
+    return json.dumps(
+        content, ensure_ascii=False, allow_nan=False, separators=(",", ":")
+    ).encode("utf-8")
+
+
+def _fast_path(result: dict[str, Any]) -> bytes:
+    """高速経路: from_attributes で一度だけ検証 → pydantic-core で直接バイト列化"""
+    model = PaginatedResponse[TaskRead].model_validate(result)
+    return PydanticJSONResponse(model).body
+
+
+def test_fast_path_matches_standard_path(page_result: dict[str, Any]) -> None:
+    """両経路が同じ JSON を生成すること"""
+    assert json.loads(_fast_path(page_result)) == json.loads(
+        _standard_path(page_result)
+    )
+
+
+@pytest.mark.benchmark(group="serialize-100-tasks")
+def test_standard_path(benchmark: Any, page_result: dict[str, Any]) -> None:
+    """従来経路のシリアライズコスト（100件あたり）"""
+    benchmark(_standard_path, page_result)
+
+
+@pytest.mark.benchmark(group="serialize-100-tasks")
+def test_fast_path(benchmark: Any, page_result: dict[str, Any]) -> None:
+    """高速経路のシリアライズコスト（100件あたり）"""
+    benchmark(_fast_path, page_result)
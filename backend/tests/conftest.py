@@ -0,0 +1,61 @@
+"""
+テスト共通のフィクスチャ。
+
+ローカルの PostgreSQL（settings.DATABASE_URL）をプライマリとして使い、
+リードレプリカの代わりに同じサーバー上の別データベース
+（TEST_REPLICA_DB、既定は <POSTGRES_DB>_replica。なければ作成する）を使う。
+DB に接続できない場合、DB を使うテストはスキップする。
+"""
+
+import os
+from collections.abc import AsyncIterator
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import text
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.core.config import settings
+from app.db.session import async_engine
+
+# リードレプリカの代わりに使うデータベース名
+REPLICA_DB = os.environ.get("TEST_REPLICA_DB", f"{settings.POSTGRES_DB}_replica")
+
+
+@pytest_asyncio.fixture
+async def replica_url() -> str:
+    """リードレプリカの代わりに使う別データベースの接続URL（なければ作成する）"""
+    admin_engine = create_async_engine(
+        settings.DATABASE_URL, isolation_level="AUTOCOMMIT"
+    )
+    try:
+        async with admin_engine.connect() as conn:
+            exists = await conn.scalar(
+                text("SELECT 1 FROM pg_database WHERE datname = :name"),
+                {"name": REPLICA_DB},
+            )
+            if not exists:
+                await conn.execute(text(f'CREATE DATABASE "{REPLICA_DB}"'))
+    except (DBAPIError, OSError) as e:
+        pytest.skip(f"レプリカ用のデータベースを用意できません: {e}")
+    finally:
+        await admin_engine.dispose()
+    return (
+        make_url(settings.DATABASE_URL)
+        .set(database=REPLICA_DB)
+        .render_as_string(hide_password=False)
+    )
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def dispose_primary_engine() -> AsyncIterator[None]:
+    """
+    テストごとにプライマリのコネクションプールを破棄する。
+
+    pytest-asyncio はテストごとにイベントループを作り直すため、
+    前のループで作った接続を次のテストで再利用しないようにする。
+    """
+    yield
+    await async_engine.dispose()
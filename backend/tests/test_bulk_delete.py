@@ -0,0 +1,93 @@
+"""
+タスク一括削除 API のテスト（PostgreSQL を使用）。
+
+アプリ全体（app.main.app）にリクエストを送り、要素ごとの結果・件数と
+ステータス別タスク集計（project_task_stats）の整合を確認する。
+テストごとにプロジェクトを作成し、終了時に削除する。
+"""
+
+import uuid
+from collections.abc import AsyncIterator
+from typing import Any
+
+import httpx
+import pytest
+import pytest_asyncio
+
+from app.main import app
+
+pytestmark = pytest.mark.asyncio
+
+# テスト用プロジェクトに作成するタスク数
+TASKS = 3
+
+
+@pytest_asyncio.fixture
+async def client() -> AsyncIterator[httpx.AsyncClient]:
+    """アプリに直接リクエストを送るクライアント"""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as c:
+        yield c
+
+
+@pytest_asyncio.fixture
+async def project(client: httpx.AsyncClient) -> AsyncIterator[dict[str, Any]]:
+    """タスクを TASKS 件持つプロジェクト（id と task_ids）"""
+    try:
+        response = await client.post(
+            "/api/v1/projects", json={"name": f"bulk-delete-{uuid.uuid4()}"}
+        )
+    except OSError as e:
+        pytest.skip(f"データベースに接続できません: {e}")
+    assert response.status_code == 201, response.text
+    project_id = response.json()["id"]
+    response = await client.post(
+        f"/api/v1/projects/{project_id}/tasks/bulk",
+        json={"items": [{"title": f"task-{i}"} for i in range(TASKS)]},
+    )
+    assert response.status_code == 201, response.text
+    task_ids = [result["id"] for result in response.json()["results"]]
+    yield {"id": project_id, "task_ids": task_ids}
+    await client.delete(f"/api/v1/projects/{project_id}")
+
+
+async def stats_total(client: httpx.AsyncClient, project_id: str) -> int:
+    """集計テーブルから取得した未削除タスク数"""
+    response = await client.get(f"/api/v1/projects/{project_id}/stats")
+    assert response.status_code == 200, response.text
+    total: int = response.json()["total"]
+    return total
+
+
+async def test_bulk_delete_counts(
+    client: httpx.AsyncClient, project: dict[str, Any]
+) -> None:
+    """削除できた件数と該当なしの件数を返し、集計も同じ件数だけ減る"""
+    missing = str(uuid.uuid4())
+    ids = [*project["task_ids"][:2], missing]
+    response = await client.post(
+        f"/api/v1/projects/{project['id']}/tasks/bulk-delete", json={"ids": ids}
+    )
+    assert response.status_code == 200, response.text
+    body = response.json()
+    assert [result["status"] for result in body["results"]] == [
+        "deleted",
+        "deleted",
+        "not_found",
+    ]
+    assert [result["id"] for result in body["results"]] == ids
+    assert (body["succeeded"], body["failed"]) == (2, 1)
+    assert await stats_total(client, project["id"]) == TASKS - 2
+
+
+async def test_bulk_delete_rejects_duplicate_ids(
+    client: httpx.AsyncClient, project: dict[str, Any]
+) -> None:
+    """同じIDを重複して指定した場合は 422 で、何も削除しない"""
+    task_id = project["task_ids"][0]
+    response = await client.post(
+        f"/api/v1/projects/{project['id']}/tasks/bulk-delete",
+        json={"ids": [task_id, task_id]},
+    )
+    assert response.status_code == 422, response.text
+    assert await stats_total(client, project["id"]) == TASKS
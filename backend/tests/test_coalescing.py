@@ -0,0 +1,129 @@
+"""
+読み取りの合流（app.services.coalescing）のテスト。
+
+DB には接続せず、リポジトリの呼び出しを差し替えて実行回数を数える。
+"""
+
+import asyncio
+import uuid
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime
+from typing import Any
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.services.coalescing import SingleFlight
+from app.services.project import ProjectService
+from app.services.task import TaskService
+
+pytestmark = pytest.mark.asyncio
+
+# 同時に実行する呼び出し数
+CALLERS = 5
+
+# リーダーの実行中にフォロワーが到着するまでの待ち時間（秒）
+_DELAY_SECONDS = 0.05
+
+
+def counting(
+    result: Callable[[], Any],
+) -> tuple[Callable[..., Awaitable[Any]], list[int]]:
+    """呼び出し回数を数え、少し待ってから result() を返す非同期関数"""
+    calls: list[int] = []
+
+    async def fn(*args: Any, **kwargs: Any) -> Any:
+        calls.append(1)
+        await asyncio.sleep(_DELAY_SECONDS)
+        return result()
+
+    return fn, calls
+
+
+def not_found() -> Any:
+    """404 を送出する（fn の結果の代わり）"""
+    raise HTTPException(status_code=404, detail="見つかりません", headers={"X-A": "1"})
+
+
+async def test_followers_share_result() -> None:
+    """同時実行の呼び出しは1回の実行に合流し、同じ結果オブジェクトを受け取る"""
+    flight = SingleFlight("test", max_waiters=CALLERS)
+    fn, calls = counting(lambda: {"items": []})
+    results = await asyncio.gather(*(flight.do("key", fn) for _ in range(CALLERS)))
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+    assert flight.in_flight == 0
+
+
+async def test_followers_get_fresh_exception() -> None:
+    """例外は内容が同じで、呼び出しごとに別のオブジェクトとして送出される"""
+    flight = SingleFlight("test", max_waiters=CALLERS)
+    fn, calls = counting(not_found)
+    results = await asyncio.gather(
+        *(flight.do("key", fn) for _ in range(CALLERS)), return_exceptions=True
+    )
+    assert len(calls) == 1
+    assert all(isinstance(e, HTTPException) for e in results)
+    assert len({id(e) for e in results}) == CALLERS
+    for e in results:
+        assert isinstance(e, HTTPException)
+        assert (e.status_code, e.detail, e.headers) == (
+            404,
+            "見つかりません",
+            {"X-A": "1"},
+        )
+
+
+async def test_leader_cancel_reruns_followers() -> None:
+    """リーダーがキャンセルされた場合、フォロワーは改めて実行する"""
+    flight = SingleFlight("test", max_waiters=CALLERS)
+    fn, calls = counting(lambda: "ok")
+    leader = asyncio.create_task(flight.do("key", fn))
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(flight.do("key", fn))
+    await asyncio.sleep(0)
+    leader.cancel()
+    assert await follower == "ok"
+    assert leader.cancelled()
+    assert len(calls) == 2
+
+
+async def test_tasks_version_is_coalesced(monkeypatch: pytest.MonkeyPatch) -> None:
+    """タスク一覧のバージョン取得は同じプロジェクトの同時実行で1回のクエリになる"""
+    project_id = uuid.uuid4()
+    service = TaskService(AsyncSession())
+    fn, calls = counting(lambda: (datetime(2025, 1, 1, tzinfo=UTC), 3))
+    monkeypatch.setattr(service.repository, "get_version_by_project_id", fn)
+    versions = await asyncio.gather(
+        *(service.get_tasks_version(project_id) for _ in range(CALLERS))
+    )
+    assert len(calls) == 1
+    assert all(
+        version
+        == {
+            "last_modified": datetime(2025, 1, 1, tzinfo=UTC),
+            "tag": f"{project_id}:3",
+        }
+        for version in versions
+    )
+
+
+async def test_project_version_is_coalesced(monkeypatch: pytest.MonkeyPatch) -> None:
+    """プロジェクトのバージョン取得は with_task_count ごとに合流する"""
+    project_id = uuid.uuid4()
+    service = ProjectService(AsyncSession())
+    fn, calls = counting(lambda: datetime(2025, 1, 1, tzinfo=UTC))
+    no_tasks, _ = counting(lambda: None)
+    monkeypatch.setattr(service.repository, "get_updated_at", fn)
+    monkeypatch.setattr(service.task_repository, "get_version_by_project_id", no_tasks)
+    versions = await asyncio.gather(
+        *(
+            service.get_project_version(project_id, with_task_count=False)
+            for _ in range(CALLERS)
+        ),
+        service.get_project_version(project_id, with_task_count=True),
+    )
+    # with_task_count=True は別のキー（タスクのバージョンは未作成のため None）
+    assert len(calls) == 2
+    assert all(version == versions[0] for version in versions)
@@ -0,0 +1,199 @@
+"""
+リードレプリカの振り分けとヘルスチェックのテスト（PostgreSQL を使用）。
+
+プライマリ（settings.DATABASE_URL）と、レプリカの代わりの別データベース
+（conftest.py の replica_url）に接続し、振り分け先を current_database() で確認する。
+スタンドインはリカバリ中ではないため、複製遅延の計測値は常に 0 になる
+（遅延による切り離しは _LAG_QUERY を固定値に差し替えて確認する）。
+"""
+
+import time
+from collections.abc import AsyncIterator
+from typing import Any
+
+import httpx
+import pytest
+import pytest_asyncio
+from fastapi import Depends, FastAPI
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.middleware import ReadYourWritesMiddleware
+from app.core.config import settings
+from app.db import dependencies, replicas
+from app.db.dependencies import get_db_session
+from app.db.replicas import READ_YOUR_WRITES_HEADER, Replica, ReplicaSet
+from app.db.session import async_engine, build_engine
+from tests.conftest import REPLICA_DB
+
+pytestmark = pytest.mark.asyncio
+
+# 書き込み後にプライマリへ固定する期間（秒）
+PIN_SECONDS = 60.0
+
+# テスト用ルートのセッション（get_db_session が接続先を選ぶ）
+DB_SESSION = Depends(get_db_session)
+
+
+def build_app() -> FastAPI:
+    """接続先のデータベース名を返すだけのアプリ"""
+    app = FastAPI()
+
+    @app.api_route("/api/database", methods=["GET", "POST"])
+    async def current_database(db: AsyncSession = DB_SESSION) -> dict[str, str | None]:
+        return {"database": await db.scalar(text("SELECT current_database()"))}
+
+    app.add_middleware(ReadYourWritesMiddleware, window=PIN_SECONDS)
+    return app
+
+
+@pytest_asyncio.fixture
+async def replica_set(
+    replica_url: str, monkeypatch: pytest.MonkeyPatch
+) -> AsyncIterator[ReplicaSet]:
+    """スタンドイン1台のレプリカ集合（get_db_session の振り分け先に差し替える）"""
+    stand_in = ReplicaSet(
+        [Replica("stand-in", build_engine(replica_url, pool_metrics=False))],
+        max_lag=1.0,
+        check_interval=60.0,
+        check_timeout=5.0,
+    )
+    monkeypatch.setattr(dependencies, "replica_set", stand_in)
+    yield stand_in
+    await stand_in.dispose()
+
+
+@pytest_asyncio.fixture
+async def client(replica_set: ReplicaSet) -> AsyncIterator[httpx.AsyncClient]:
+    """テスト用アプリのクライアント（Cookie を保持する）"""
+    transport = httpx.ASGITransport(app=build_app())
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as c:
+        yield c
+
+
+async def database_of(
+    client: httpx.AsyncClient, method: str = "GET", **kwargs: Any
+) -> str:
+    """リクエストを送り、セッションの接続先のデータベース名を返す"""
+    response = await client.request(method, "/api/database", **kwargs)
+    assert response.status_code == 200
+    database: str = response.json()["database"]
+    return database
+
+
+# --- 振り分け ---
+
+
+async def test_reads_go_to_replica(client: httpx.AsyncClient) -> None:
+    assert await database_of(client) == REPLICA_DB
+
+
+async def test_writes_go_to_primary(client: httpx.AsyncClient) -> None:
+    assert await database_of(client, "POST") == settings.POSTGRES_DB
+
+
+async def test_falls_back_to_primary_without_healthy_replica(
+    client: httpx.AsyncClient, replica_set: ReplicaSet
+) -> None:
+    replica_set.replicas[0].mark(False, "テスト")
+    assert await database_of(client) == settings.POSTGRES_DB
+
+
+# --- 書き込み直後の読み取りの固定 ---
+
+
+async def test_write_pins_following_reads_to_primary(
+    client: httpx.AsyncClient,
+) -> None:
+    response = await client.post("/api/database")
+    until = float(response.headers[READ_YOUR_WRITES_HEADER])
+    assert until > time.time()
+    assert client.cookies[settings.DB_READ_YOUR_WRITES_COOKIE] == f"{until:.3f}"
+
+    # Cookie を送り返す読み取りはプライマリに固定される
+    assert await database_of(client) == settings.POSTGRES_DB
+
+
+async def test_header_pins_reads_to_primary(client: httpx.AsyncClient) -> None:
+    headers = {READ_YOUR_WRITES_HEADER: f"{time.time() + PIN_SECONDS:.3f}"}
+    assert await database_of(client, headers=headers) == settings.POSTGRES_DB
+
+
+async def test_expired_pin_reads_from_replica(client: httpx.AsyncClient) -> None:
+    client.cookies.set(settings.DB_READ_YOUR_WRITES_COOKIE, f"{time.time() - 1:.3f}")
+    assert await database_of(client) == REPLICA_DB
+
+
+async def test_invalid_pin_reads_from_replica(client: httpx.AsyncClient) -> None:
+    client.cookies.set(settings.DB_READ_YOUR_WRITES_COOKIE, "invalid")
+    assert await database_of(client) == REPLICA_DB
+
+
+# --- ヘルスチェック ---
+
+
+async def test_check_marks_stand_in_healthy(replica_set: ReplicaSet) -> None:
+    replica = replica_set.replicas[0]
+    await replica_set.check(replica)
+    assert replica.healthy
+    assert replica.lag_seconds == 0.0
+    assert replica.checked_at is not None
+
+
+async def test_failed_check_marks_unhealthy(replica_url: str) -> None:
+    unreachable = Replica(
+        "unreachable",
+        build_engine(
+            replica_url.replace(f"/{REPLICA_DB}", f"/{REPLICA_DB}_missing"),
+            pool_metrics=False,
+        ),
+    )
+    checked = ReplicaSet(
+        [unreachable], max_lag=None, check_interval=60.0, check_timeout=5.0
+    )
+    try:
+        await checked.check(unreachable)
+        assert not unreachable.healthy
+        assert unreachable.last_error is not None
+        assert unreachable.last_error.startswith("ヘルスチェック失敗")
+        assert checked.pick() is None
+    finally:
+        await checked.dispose()
+
+
+async def test_excess_lag_marks_unhealthy_until_caught_up(
+    replica_set: ReplicaSet, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    replica = replica_set.replicas[0]
+    lag_query = replicas._LAG_QUERY
+    monkeypatch.setattr(replicas, "_LAG_QUERY", text("SELECT 5.0"))
+    await replica_set.check(replica)
+    assert not replica.healthy
+    assert replica.lag_seconds == 5.0
+    assert replica_set.pick() is None
+
+    # 遅延が解消したら次のヘルスチェックで復旧する
+    monkeypatch.setattr(replicas, "_LAG_QUERY", lag_query)
+    await replica_set.check(replica)
+    assert replica.healthy
+    assert replica.last_error is None
+    assert replica_set.pick() is replica
+
+
+async def test_disconnect_marks_unhealthy(replica_set: ReplicaSet) -> None:
+    replica = replica_set.replicas[0]
+    async with replica.session_factory() as session:
+        pid = await session.scalar(text("SELECT pg_backend_pid()"))
+        async with async_engine.connect() as primary:
+            await primary.execute(
+                text("SELECT pg_terminate_backend(:pid)"), {"pid": pid}
+            )
+        with pytest.raises(DBAPIError):
+            await session.execute(text("SELECT 1"))
+    assert not replica.healthy
+    assert replica.last_error is not None
+    assert replica.last_error.startswith("接続断")
+
+    await replica_set.check(replica)
+    assert replica.healthy